@@ -0,0 +1,12 @@
+import uvicorn
+
+from application.main.config import settings
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "application.gateway.app:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        log_level=settings.LOG_LEVEL,
+        use_colors=True,
+    )
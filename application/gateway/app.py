@@ -0,0 +1,341 @@
+import asyncio
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.routing import APIRouter
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette.requests import Request
+
+from application.gateway.nodes import API_PREFIX, Node, NodePool
+from application.initializer import logger_instance
+from application.main.config import settings
+from application.main.middlewares import CompressionMiddleware
+from application.main.routers.translate import (
+    BatchTranslationItem,
+    BatchTranslationRequest,
+    TranslationRequest,
+)
+from application.main.utility.encoding import JSON, EncodedRoute, dumps, encoded_response
+from application.main.utility.metrics import GATEWAY_FAILOVERS
+
+logger = logger_instance.get_logger(__name__)
+
+# Failures after which the request is retried on the next node: translating is
+# idempotent, and a node that cannot be reached is marked down
+_FAILOVER_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError)
+# Node response headers passed back to the client
+_PASSED_HEADERS = ("retry-after", "vary", "x-token-budget-limit", "x-token-budget-remaining")
+
+
+class NodeResponse(Exception):
+    """A node's error response, returned to the client as it is."""
+
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"Node answered {response.status_code}")
+        self.response = response
+
+
+def passthrough(response: httpx.Response) -> Response:
+    return Response(
+        content=response.content,
+        status_code=response.status_code,
+        media_type=response.headers.get("content-type"),
+        headers={name: response.headers[name] for name in _PASSED_HEADERS if name in response.headers},
+    )
+
+
+def forward_headers(request: Request, accept: str = JSON) -> Dict[str, str]:
+    """Headers of a request forwarded to a node.
+
+    The client address goes in X-Forwarded-For, which uvicorn trusts from 127.0.0.1 by
+    default (FORWARDED_ALLOW_IPS otherwise), so nodes rate limit the client rather than
+    the gateway. Nodes answer uncompressed; the gateway compresses for the client.
+    """
+    headers = {"accept": accept, "accept-encoding": "identity", "content-type": JSON}
+    if request.client:
+        headers["x-forwarded-for"] = request.client.host
+    if "x-request-timeout" in request.headers:
+        headers["x-request-timeout"] = request.headers["x-request-timeout"]
+    return headers
+
+
+def target_of(pair: str) -> str:
+    return pair.split("2", 1)[1]
+
+
+class Gateway:
+    """Routes translation requests to the nodes serving their language pair.
+
+    Each pair is owned by a node on a consistent hash ring of the nodes declaring it, so
+    its cache entries stay on one node and only move when nodes join or leave; when the
+    owner is down or refuses the connection, the next node of the ring serving the pair
+    takes over. Batches mixing pairs are split into one sub-batch per node.
+    """
+
+    def __init__(self, pool: NodePool, client: httpx.AsyncClient):
+        self.pool = pool
+        self.client = client
+
+    def nodes_for(self, pair: str) -> List[Node]:
+        nodes = self.pool.route(pair)
+        if not nodes:
+            if self.pool.serves(pair):
+                raise HTTPException(status_code=503, detail=f"No healthy node serves {pair}")
+            raise HTTPException(status_code=400, detail=f"{pair} is not served by any node")
+        return nodes
+
+    async def post(
+        self, nodes: List[Node], path: str, payload: Dict, headers: Dict[str, str], label: str
+    ) -> httpx.Response:
+        """POSTs to the first of ``nodes`` that can be reached, the others being failovers."""
+        body = dumps(payload)
+        for node in nodes:
+            try:
+                return await self.client.post(
+                    f"{node.url}{API_PREFIX}{path}", content=body, headers=headers
+                )
+            except _FAILOVER_ERRORS as e:
+                logger.warning(f"Failing over {label} from {node.url}: {e!r}")
+                self.pool.mark_down(node)
+                GATEWAY_FAILOVERS.labels(label).inc()
+        raise HTTPException(status_code=503, detail=f"No node available for {label}")
+
+    async def detect(
+        self, request: Request, texts: List[str], timeout: Optional[float] = None
+    ) -> List[str]:
+        """Language of each text, detected by any healthy node (all load the detector)."""
+        nodes = self.pool.healthy(texts[0] if texts else "")
+        payload = {"texts": texts, "timeout": timeout} if timeout is not None else {"texts": texts}
+        response = await self.post(
+            nodes, "/translate/detect", payload, forward_headers(request), "detect"
+        )
+        if response.status_code != 200:
+            raise NodeResponse(response)
+        return response.json()["detected_langs"]
+
+    async def translate_pairs(
+        self,
+        request: Request,
+        pending: Dict[str, List[int]],
+        items: List[BatchTranslationItem],
+        src_langs: List[str],
+        options: Dict,
+        results: List[Dict],
+    ) -> None:
+        """Translates the items listed per pair into ``results``, one sub-batch per node.
+
+        The pairs of a node that cannot be reached are sent again to their next node; pairs
+        no healthy node serves are reported in the ``errors`` of their items.
+        """
+        headers = forward_headers(request)
+        while pending:
+            by_node: Dict[str, Tuple[Node, Dict[str, List[int]]]] = {}
+            for pair, indices in pending.items():
+                try:
+                    node = self.nodes_for(pair)[0]
+                except HTTPException as e:
+                    # Like pairs a node cannot translate, the rest of the batch is served
+                    for i in indices:
+                        results[i].setdefault("errors", {})[target_of(pair)] = e.detail
+                    continue
+                by_node.setdefault(node.url, (node, {}))[1][pair] = indices
+
+            outcomes = await asyncio.gather(
+                *(
+                    self._post_sub_batch(node, pairs, items, src_langs, options, headers)
+                    for node, pairs in by_node.values()
+                )
+            )
+            pending = {}
+            for (node, pairs), outcome in zip(by_node.values(), outcomes):
+                if outcome is None:
+                    for pair in pairs:
+                        GATEWAY_FAILOVERS.labels(pair).inc()
+                    pending.update(pairs)
+                    continue
+                indices, response = outcome
+                if response.status_code != 200:
+                    raise NodeResponse(response)
+                for i, result in zip(indices, response.json()["results"]):
+                    results[i]["translations"].update(result["translations"])
+                    if result.get("errors"):
+                        results[i].setdefault("errors", {}).update(result["errors"])
+
+    async def _post_sub_batch(
+        self,
+        node: Node,
+        pairs: Dict[str, List[int]],
+        items: List[BatchTranslationItem],
+        src_langs: List[str],
+        options: Dict,
+        headers: Dict[str, str],
+    ) -> Optional[Tuple[List[int], httpx.Response]]:
+        """Item indices and response of the node; None if it could not be reached."""
+        targets: Dict[int, List[str]] = {}
+        for pair, indices in pairs.items():
+            for i in indices:
+                targets.setdefault(i, []).append(target_of(pair))
+        indices = sorted(targets)
+        payload = {
+            "items": [
+                {"text": items[i].text, "src_lang": src_langs[i], "tgt_langs": targets[i]}
+                for i in indices
+            ],
+            **options,
+        }
+        try:
+            response = await self.client.post(
+                f"{node.url}{API_PREFIX}/translate/batch", content=dumps(payload), headers=headers
+            )
+        except _FAILOVER_ERRORS as e:
+            logger.warning(f"Failing over {len(pairs)} pairs from {node.url}: {e!r}")
+            self.pool.mark_down(node)
+            return None
+        return indices, response
+
+
+router = APIRouter(prefix=API_PREFIX, route_class=EncodedRoute)
+
+
+@router.post("/translate/")
+async def translate(request: Request, translation_request: TranslationRequest):
+    gateway: Gateway = request.app.state.gateway
+    payload = translation_request.model_dump(exclude_none=True)
+    if not translation_request.src_lang:
+        detected_langs = await gateway.detect(
+            request, translation_request.texts, translation_request.timeout
+        )
+        payload["src_lang"] = Counter(detected_langs).most_common(1)[0][0] if detected_langs else ""
+    pair = f"{payload['src_lang']}2{payload['tgt_lang']}"
+    response = await gateway.post(
+        gateway.nodes_for(pair),
+        "/translate/",
+        payload,
+        forward_headers(request, accept=request.headers.get("accept", JSON)),
+        pair,
+    )
+    return passthrough(response)
+
+
+@router.post("/translate/batch")
+async def translate_batch(request: Request, batch_request: BatchTranslationRequest):
+    """Splits the batch by node, pairs of one node going in one sub-batch, and merges."""
+    start_time = time.perf_counter()
+    gateway: Gateway = request.app.state.gateway
+    items = batch_request.items
+    src_langs = [item.src_lang for item in items]
+    undetected = [i for i, src_lang in enumerate(src_langs) if not src_lang]
+    if undetected:
+        detected_langs = await gateway.detect(
+            request, [items[i].text for i in undetected], batch_request.timeout
+        )
+        for i, src_lang in zip(undetected, detected_langs):
+            src_langs[i] = src_lang
+
+    results = [{"src_lang": src_lang, "translations": {}} for src_lang in src_langs]
+    pending: Dict[str, List[int]] = {}
+    for i, (item, src_lang) in enumerate(zip(items, src_langs)):
+        for tgt_lang in item.targets():
+            if tgt_lang == src_lang:
+                results[i]["translations"][tgt_lang] = item.text
+            else:
+                pending.setdefault(f"{src_lang}2{tgt_lang}", []).append(i)
+
+    options = batch_request.model_dump(include={"timeout", "tier", "allow_fallback"})
+    await gateway.translate_pairs(
+        request, pending, items, src_langs, {k: v for k, v in options.items() if v is not None},
+        results,
+    )
+    for item, result in zip(items, results):
+        # Same order as the targets, whichever node answered first
+        result["translations"] = {
+            tgt_lang: result["translations"][tgt_lang]
+            for tgt_lang in item.targets()
+            if tgt_lang in result["translations"]
+        }
+    return encoded_response(
+        request,
+        {"results": results, "time": f"{time.perf_counter() - start_time:.2f}s"},
+    )
+
+
+@router.get("/translate/pairs")
+async def served_pairs(request: Request):
+    """Pairs served by healthy nodes, and the state of every node."""
+    pool: NodePool = request.app.state.gateway.pool
+    nodes = list(pool.nodes.values())
+    return encoded_response(
+        request,
+        {
+            "pairs": sorted({pair for node in nodes if node.healthy for pair in node.pairs}),
+            "nodes": [
+                {"url": node.url, "healthy": node.healthy, "pairs": sorted(node.pairs)}
+                for node in nodes
+            ],
+        },
+    )
+
+
+@router.get("/health-check/")
+async def health_check():
+    return Response(content=dumps("OK"), media_type=JSON)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    urls = [url.strip() for url in settings.GATEWAY_NODES.split(",") if url.strip()]
+    if not urls:
+        raise ValueError("GATEWAY_NODES lists no node")
+    client = httpx.AsyncClient(
+        timeout=settings.MAX_REQUEST_TIMEOUT_SEC + 5.0,
+        limits=httpx.Limits(max_connections=512, max_keepalive_connections=64),
+    )
+    pool = NodePool(
+        urls,
+        client,
+        replicas=settings.GATEWAY_REPLICAS,
+        probe_interval_sec=settings.GATEWAY_PROBE_INTERVAL_SEC,
+    )
+    await pool.start()
+    app.state.gateway = Gateway(pool, client)
+    yield
+    await pool.close()
+    await client.aclose()
+    logger_instance.stop()
+
+
+def get_gateway_application() -> FastAPI:
+    _app = FastAPI(
+        title=f"{settings.API_NAME} gateway",
+        description="Routes translation requests to the nodes serving their language pair",
+        version=settings.API_VERSION,
+        lifespan=lifespan,
+    )
+    _app.include_router(router)
+
+    @_app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+    @_app.exception_handler(NodeResponse)
+    async def node_response_handler(request: Request, exc: NodeResponse):
+        return passthrough(exc.response)
+
+    @_app.exception_handler(httpx.TimeoutException)
+    async def node_timeout_handler(request: Request, exc: httpx.TimeoutException):
+        return encoded_response(request, {"detail": "Node timed out"}, status_code=504)
+
+    @_app.exception_handler(httpx.HTTPError)
+    async def node_error_handler(request: Request, exc: httpx.HTTPError):
+        logger.error(f"Node request failed: {exc!r}")
+        return encoded_response(request, {"detail": "Bad gateway"}, status_code=502)
+
+    _app.add_middleware(CompressionMiddleware)
+    return _app
+
+
+app = get_gateway_application()
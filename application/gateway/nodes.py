@@ -0,0 +1,100 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+import httpx
+
+from application.gateway.ring import HashRing
+from application.initializer import logger_instance
+from application.main.config import settings
+from application.main.utility.metrics import GATEWAY_NODE_UP
+
+logger = logger_instance.get_logger(__name__)
+
+# Same versioned prefix as the nodes
+API_PREFIX = f"/api/v{settings.API_VERSION.split('.')[0]}"
+# Probed on every node: answers with the pairs it serves, see SERVED_PAIRS
+PAIRS_PATH = f"{API_PREFIX}/translate/pairs"
+
+
+@dataclass
+class Node:
+    url: str
+    # Pairs declared by the node, kept while it is down to tell "down" from "not served"
+    pairs: Set[str] = field(default_factory=set)
+    healthy: bool = False
+
+
+class NodePool:
+    """Nodes behind the gateway, the pairs they serve and whether they answer.
+
+    Every ``probe_interval_sec`` each node is asked for its pairs; a node that fails to
+    answer is down until a later probe succeeds. Requests also mark a node down as soon as
+    it refuses a connection, so failover does not wait for the next probe.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        client: httpx.AsyncClient,
+        replicas: int = 64,
+        probe_interval_sec: float = 2.0,
+    ):
+        self.nodes: Dict[str, Node] = {url.rstrip("/"): Node(url.rstrip("/")) for url in urls}
+        self.ring = HashRing(self.nodes, replicas)
+        self.client = client
+        self.probe_interval_sec = probe_interval_sec
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        await self.probe_all()
+        self._task = asyncio.create_task(self._probe_loop())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _probe_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.probe_interval_sec)
+            await self.probe_all()
+
+    async def probe_all(self) -> None:
+        await asyncio.gather(*(self.probe(node) for node in self.nodes.values()))
+
+    async def probe(self, node: Node) -> None:
+        try:
+            response = await self.client.get(
+                f"{node.url}{PAIRS_PATH}", timeout=max(0.5, self.probe_interval_sec)
+            )
+            response.raise_for_status()
+            node.pairs = set(response.json()["pairs"])
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            if node.healthy:
+                logger.warning(f"Node {node.url} is down: {e!r}")
+            node.healthy = False
+        else:
+            if not node.healthy:
+                logger.info(f"Node {node.url} is up, serving {sorted(node.pairs)}")
+            node.healthy = True
+        GATEWAY_NODE_UP.labels(node.url).set(int(node.healthy))
+
+    def mark_down(self, node: Node) -> None:
+        if node.healthy:
+            logger.warning(f"Node {node.url} failed a request, down until the next probe")
+        node.healthy = False
+        GATEWAY_NODE_UP.labels(node.url).set(0)
+
+    def route(self, pair: str) -> List[Node]:
+        """Healthy nodes serving ``pair``, in ring order from the one owning it."""
+        nodes = (self.nodes[url] for url in self.ring.nodes_for(pair))
+        return [node for node in nodes if node.healthy and pair in node.pairs]
+
+    def serves(self, pair: str) -> bool:
+        """Whether any node, up or down, declared ``pair``."""
+        return any(pair in node.pairs for node in self.nodes.values())
+
+    def healthy(self, key: str) -> List[Node]:
+        """Healthy nodes in ring order from the owner of ``key``, for pair-agnostic work."""
+        nodes = (self.nodes[url] for url in self.ring.nodes_for(key))
+        return [node for node in nodes if node.healthy]
@@ -0,0 +1,41 @@
+import bisect
+import hashlib
+from typing import Iterable, Iterator, List, Tuple
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hash ring of nodes, each placed at ``replicas`` points.
+
+    A key is owned by the first node clockwise from its hash, then the next distinct
+    nodes in ring order are its fallbacks. Adding or removing a node only moves the keys
+    it owns, and the hashing is stable across processes.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 64):
+        self.replicas = max(1, replicas)
+        self._points: List[Tuple[int, str]] = []
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: str) -> None:
+        for replica in range(self.replicas):
+            bisect.insort(self._points, (_hash(f"{node}#{replica}"), node))
+
+    def remove(self, node: str) -> None:
+        self._points = [point for point in self._points if point[1] != node]
+
+    def nodes_for(self, key: str) -> Iterator[str]:
+        """Distinct nodes in ring order starting from the owner of ``key``."""
+        if not self._points:
+            return
+        start = bisect.bisect(self._points, (_hash(key), ""))
+        seen = set()
+        for i in range(len(self._points)):
+            node = self._points[(start + i) % len(self._points)][1]
+            if node not in seen:
+                seen.add(node)
+                yield node
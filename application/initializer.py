@@ -1,9 +1,18 @@
+from functools import lru_cache
+
+
 class IncludeAPIRouter(object):
     def __new__(cls):
         from fastapi.routing import APIRouter
 
         from application.main.config import settings
-        from application.main.routers import router_health_check, router_translator
+        from application.main.routers import (
+            router_admin,
+            router_health_check,
+            router_metrics,
+            router_translator,
+            router_translator_stream,
+        )
 
         # Get the major version
         major = settings.API_VERSION.split(".")[0]
@@ -12,6 +21,10 @@ class IncludeAPIRouter(object):
         router = APIRouter()
         router.include_router(router_health_check, prefix=prefix, tags=["health_check"])
         router.include_router(router_translator, prefix=prefix, tags=["translate"])
+        router.include_router(router_translator_stream, prefix=prefix, tags=["translate"])
+        router.include_router(router_admin, prefix=prefix, tags=["admin"])
+        # Scraped at the conventional unversioned path
+        router.include_router(router_metrics, tags=["metrics"])
         return router
 
 
@@ -43,8 +56,19 @@ class LimiterInstance(object):
         return get_limiter()
 
 
-# instance creation
+@lru_cache(maxsize=None)
+def get_db():
+    """Process-wide database client, connected on first use."""
+    return DataBaseInstance()
+
+
+@lru_cache(maxsize=None)
+def get_cache():
+    """Process-wide cache, its backends connected on first use."""
+    return CacheInstance()
+
+
+# instance creation: only what is cheap and needed at import (route decorators, loggers);
+# clients and models are built by the factories above, from the app lifespan or on first use
 logger_instance = LoggerInstance()
-db_instance = DataBaseInstance()
-cache_instance = CacheInstance()
 limiter_instance = LimiterInstance()
@@ -39,12 +39,127 @@ class GlobalConfig(BaseSettings):
     PORT: int = Field(default=8080, validation_alias="PORT")
     LOG_LEVEL: str = Field(default="info", validation_alias="LOG_LEVEL")
 
+    # Share of requests whose headers and body are captured in debug request logs
+    LOG_BODY_SAMPLE_RATE: float = Field(
+        default=0.01, validation_alias="LOG_BODY_SAMPLE_RATE"
+    )
+    LOG_BODY_MAX_BYTES: int = Field(default=4096, validation_alias="LOG_BODY_MAX_BYTES")
+
     DB: str = Field(default="mongodb", validation_alias="DB")
+    # Cache tiers, fastest first: any of memory, sqlite, redis, then optionally mongodb, the
+    # non-expiring translation memory, as the last tier (e.g. "memory,redis,mongodb")
     CACHE: str = Field(default="redis", validation_alias="CACHE")
     LOG_CONFIG_FILENAME: str = Field(
         default="logging_config.yaml", validation_alias="LOG_CONFIG_FILENAME"
     )
 
+    # Deadline applied to requests that do not carry their own (seconds)
+    REQUEST_TIMEOUT_SEC: float = Field(
+        default=10.0, validation_alias="REQUEST_TIMEOUT_SEC"
+    )
+    MAX_REQUEST_TIMEOUT_SEC: float = Field(
+        default=60.0, validation_alias="MAX_REQUEST_TIMEOUT_SEC"
+    )
+
+    # Rate limits are enforced locally and reconciled through Redis on this interval;
+    # a sync slower than the timeout leaves limits enforced per process
+    RATE_LIMIT_SYNC_INTERVAL_SEC: float = Field(
+        default=0.5, validation_alias="RATE_LIMIT_SYNC_INTERVAL_SEC"
+    )
+    RATE_LIMIT_SYNC_TIMEOUT_SEC: float = Field(
+        default=0.1, validation_alias="RATE_LIMIT_SYNC_TIMEOUT_SEC"
+    )
+
+    # Upper bound of one inference batch, in tokens x beams (input + expected output);
+    # larger requests are split into chunks so that peak memory stays bounded
+    MAX_BATCH_TOKENS: int = Field(default=32768, validation_alias="MAX_BATCH_TOKENS")
+
+    # Model tiers to load (quality and/or fast, which loads more checkpoints), and the one
+    # used when a request names none
+    TRANSLATOR_TIERS: str = Field(default="quality", validation_alias="TRANSLATOR_TIERS")
+    DEFAULT_TIER: str = Field(default="quality", validation_alias="DEFAULT_TIER")
+    # Serve quality-tier requests with the fast tier while every inference slot is busy
+    TIER_FALLBACK_UNDER_LOAD: bool = Field(
+        default=True, validation_alias="TIER_FALLBACK_UNDER_LOAD"
+    )
+
+    # Tokenize the next chunk and decode the previous one while the current one generates
+    PIPELINED_INFERENCE: bool = Field(default=True, validation_alias="PIPELINED_INFERENCE")
+
+    # Replace numbers, URLs, emails and code spans with placeholders before the cache
+    # lookup and inference, so that templated texts share one cache entry
+    PLACEHOLDER_MASKING: bool = Field(default=True, validation_alias="PLACEHOLDER_MASKING")
+
+    # Per-client translation budget, in estimated source tokens (cached texts cost 1)
+    TOKEN_BUDGET: str = Field(default="20000/minute", validation_alias="TOKEN_BUDGET")
+
+    # Write-behind audit log of every translation (billing, quality review) to the DB
+    # backend, flushed with insert_many every AUDIT_BATCH_SIZE events or flush interval;
+    # events beyond AUDIT_QUEUE_SIZE waiting ones are dropped and counted
+    AUDIT_LOG: bool = Field(default=False, validation_alias="AUDIT_LOG")
+    AUDIT_COLLECTION: str = Field(
+        default="translation_audit", validation_alias="AUDIT_COLLECTION"
+    )
+    AUDIT_INCLUDE_TEXTS: bool = Field(default=True, validation_alias="AUDIT_INCLUDE_TEXTS")
+    AUDIT_BATCH_SIZE: int = Field(default=500, validation_alias="AUDIT_BATCH_SIZE")
+    AUDIT_FLUSH_INTERVAL_SEC: float = Field(
+        default=1.0, validation_alias="AUDIT_FLUSH_INTERVAL_SEC"
+    )
+    AUDIT_QUEUE_SIZE: int = Field(default=10000, validation_alias="AUDIT_QUEUE_SIZE")
+
+    # Language pairs this node loads and serves (e.g. "en2vi,vi2en"), all when empty; a
+    # gateway (python -m application.gateway) routes each pair to the nodes serving it
+    SERVED_PAIRS: str = Field(default="", validation_alias="SERVED_PAIRS")
+    # Gateway: node base URLs, virtual nodes per node on the hash ring, and how often the
+    # nodes' pairs and health are probed
+    GATEWAY_NODES: str = Field(default="", validation_alias="GATEWAY_NODES")
+    GATEWAY_REPLICAS: int = Field(default=64, validation_alias="GATEWAY_REPLICAS")
+    GATEWAY_PROBE_INTERVAL_SEC: float = Field(
+        default=2.0, validation_alias="GATEWAY_PROBE_INTERVAL_SEC"
+    )
+
+    # Track the most looked-up cache keys (count-min sketch + top-k, counts halved every
+    # HOT_KEYS_DECAY_SEC): top keys looked up HOT_KEYS_MIN_COUNT times are pinned in the
+    # in-process tier and kept HOT_KEY_TTL in the others, new entries get COLD_KEY_TTL
+    HOT_KEYS: bool = Field(default=True, validation_alias="HOT_KEYS")
+    HOT_KEYS_TOP_K: int = Field(default=100, validation_alias="HOT_KEYS_TOP_K")
+    HOT_KEYS_MIN_COUNT: int = Field(default=20, validation_alias="HOT_KEYS_MIN_COUNT")
+    HOT_KEYS_DECAY_SEC: float = Field(default=300.0, validation_alias="HOT_KEYS_DECAY_SEC")
+    HOT_KEY_TTL: str = Field(default="7d", validation_alias="HOT_KEY_TTL")
+    # Empty COLD_KEY_TTL leaves new entries to the TTL of each tier's config
+    COLD_KEY_TTL: str = Field(default="", validation_alias="COLD_KEY_TTL")
+    # Whether /admin/hot-keys lists the source texts of the keys (they may be user data)
+    HOT_KEYS_EXPOSE_TEXTS: bool = Field(default=False, validation_alias="HOT_KEYS_EXPOSE_TEXTS")
+
+    # WebSocket streams: requests a connection may have in flight before its frames stop
+    # being read, inference calls per pair and connection, and texts coalesced into one
+    STREAM_MAX_INFLIGHT: int = Field(default=64, validation_alias="STREAM_MAX_INFLIGHT")
+    STREAM_CALLS_PER_PAIR: int = Field(default=2, validation_alias="STREAM_CALLS_PER_PAIR")
+    STREAM_MAX_BATCH_TEXTS: int = Field(
+        default=256, validation_alias="STREAM_MAX_BATCH_TEXTS"
+    )
+
+    # Responses of at least COMPRESSION_MIN_SIZE bytes are compressed with the first of
+    # COMPRESSION_ENCODINGS (br, gzip) the client accepts; empty disables compression
+    COMPRESSION_MIN_SIZE: int = Field(default=1024, validation_alias="COMPRESSION_MIN_SIZE")
+    COMPRESSION_ENCODINGS: str = Field(
+        default="br,gzip", validation_alias="COMPRESSION_ENCODINGS"
+    )
+
+    # Stub mode: fake models with synthetic latency, to measure serving overhead offline.
+    # Combine with CACHE=memory and DB=memory to run without Redis and Mongo.
+    STUB_MODE: bool = Field(default=False, validation_alias="STUB_MODE")
+    STUB_LATENCY_MS: float = Field(default=0.0, validation_alias="STUB_LATENCY_MS")
+    STUB_LATENCY_PER_TOKEN_MS: float = Field(
+        default=0.0, validation_alias="STUB_LATENCY_PER_TOKEN_MS"
+    )
+    STUB_DETECT_LATENCY_MS: float = Field(
+        default=0.0, validation_alias="STUB_DETECT_LATENCY_MS"
+    )
+
+    # Required in the X-Admin-Token header of /admin endpoints, disabled when empty
+    ADMIN_TOKEN: str = Field(default="", validation_alias="ADMIN_TOKEN")
+
 
 class DevConfig(GlobalConfig):
     model_config = SettingsConfigDict(env_prefix="DEV_", env_file=".env", extra="allow")
@@ -0,0 +1,20 @@
+from functools import lru_cache
+from typing import Optional
+
+from application.main.config import settings
+from application.main.infrastructure.audit.sink import AuditSink
+
+
+@lru_cache(maxsize=None)
+def get_audit_sink() -> Optional[AuditSink]:
+    """Process-wide translation audit sink, or None unless AUDIT_LOG is enabled."""
+    if not settings.AUDIT_LOG:
+        return None
+    from application.main.infrastructure.database.db import DataBase
+
+    return AuditSink(
+        DataBase(settings.AUDIT_COLLECTION),
+        batch_size=settings.AUDIT_BATCH_SIZE,
+        flush_interval_sec=settings.AUDIT_FLUSH_INTERVAL_SEC,
+        max_queue_size=settings.AUDIT_QUEUE_SIZE,
+    )
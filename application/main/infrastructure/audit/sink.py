@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from application.main.utility.metrics import (
+    AUDIT_EVENTS_DROPPED,
+    AUDIT_EVENTS_WRITTEN,
+    AUDIT_FLUSH_LATENCY,
+    AUDIT_QUEUE_DEPTH,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AuditSink:
+    """Write-behind sink of translation events into a database collection.
+
+    ``record`` only puts the event on a bounded queue, so a request never waits on the
+    database. A background task writes the queue with ``insert_many`` once
+    ``batch_size`` events are waiting or every ``flush_interval_sec``, on a worker thread
+    since the database client is synchronous. When the writer falls behind, events past
+    ``max_queue_size`` are dropped and counted instead of growing memory; a failed insert
+    drops its batch the same way. ``close`` writes whatever is still queued.
+    """
+
+    def __init__(
+        self,
+        db,
+        batch_size: int = 500,
+        flush_interval_sec: float = 1.0,
+        max_queue_size: int = 10000,
+    ):
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_sec = flush_interval_sec
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._batch_ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    def record(self, event: Dict) -> None:
+        """Queues an event for writing; drops it when the queue is full."""
+        if self._closing:
+            AUDIT_EVENTS_DROPPED.labels("closed").inc()
+            return
+        self._ensure_task()
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            AUDIT_EVENTS_DROPPED.labels("queue_full").inc()
+            return
+        AUDIT_QUEUE_DEPTH.set(self._queue.qsize())
+        if self._queue.qsize() >= self.batch_size:
+            self._batch_ready.set()
+
+    def _ensure_task(self) -> None:
+        if self._task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self.flush_interval_sec)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self.flush()
+            if self._closing:
+                return
+
+    async def flush(self) -> None:
+        """Writes every queued event, ``batch_size`` at a time."""
+        while not self._queue.empty():
+            batch: List[Dict] = []
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            AUDIT_QUEUE_DEPTH.set(self._queue.qsize())
+            await self._write(batch)
+
+    async def _write(self, batch: List[Dict]) -> None:
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(self.db.insert_multiple_db_record, batch)
+        except Exception as e:
+            AUDIT_EVENTS_DROPPED.labels("error").inc(len(batch))
+            logger.warning(f"Dropped {len(batch)} audit events, insert failed: {e!r}")
+            return
+        finally:
+            AUDIT_FLUSH_LATENCY.observe(time.perf_counter() - start)
+        AUDIT_EVENTS_WRITTEN.inc(len(batch))
+
+    async def close(self, timeout_sec: float = 10.0) -> None:
+        """Stops accepting events and writes the queued ones, for at most ``timeout_sec``."""
+        self._closing = True
+        self._batch_ready.set()
+        try:
+            if self._task is not None:
+                await asyncio.wait_for(self._task, timeout_sec)
+            else:
+                await asyncio.wait_for(self.flush(), timeout_sec)
+        except asyncio.TimeoutError:
+            AUDIT_EVENTS_DROPPED.labels("closed").inc(self._queue.qsize())
+            logger.warning(
+                f"Audit log not flushed on shutdown, {self._queue.qsize()} events lost"
+            )
@@ -1,3 +1,24 @@
+from typing import List
+
+from application.main.config import settings
+from application.main.infrastructure.cache.keys import (
+    parse_translation_cache_key,
+    translation_cache_key,
+)
+from application.main.infrastructure.cache.memory.operations import InMemory
+from application.main.infrastructure.cache.mongodb.operations import TranslationMemory
 from application.main.infrastructure.cache.redis.operations import Redis
+from application.main.infrastructure.cache.sqlite.operations import SQLite
+
+# Backends are instantiated on selection so unused ones never connect
+CacheToUse = {
+    'redis': Redis,
+    'memory': InMemory,
+    'sqlite': SQLite,
+    'mongodb': TranslationMemory,
+}
+
 
-CacheToUse = {'redis': Redis()}
+def cache_tiers() -> List[str]:
+    """Backends of the CACHE setting, fastest first, e.g. ``memory,redis,mongodb``."""
+    return [name.strip() for name in settings.CACHE.split(",") if name.strip()]
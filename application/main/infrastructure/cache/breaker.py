@@ -0,0 +1,93 @@
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+import pybreaker
+
+from application.main.utility.metrics import (
+    CIRCUIT_BREAKER_STATE,
+    CIRCUIT_BREAKER_TRANSITIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+# The breaker never lets a request through to find out whether the server is back: that is
+# left to the health probe, so the reset timeout only matters if the probe thread dies.
+_BREAKER_RESET_TIMEOUT_SEC = 24 * 3600
+_BREAKER_STATES = {pybreaker.STATE_CLOSED: 0, pybreaker.STATE_HALF_OPEN: 1, pybreaker.STATE_OPEN: 2}
+
+
+class BreakerMetricsListener(pybreaker.CircuitBreakerListener):
+    def __init__(self, service: str, on_open: Callable[[], None]):
+        self.service = service
+        self.on_open = on_open
+
+    def state_change(self, cb, old_state, new_state):
+        old_name = old_state.name if old_state else "none"
+        CIRCUIT_BREAKER_TRANSITIONS.labels(self.service, old_name, new_state.name).inc()
+        CIRCUIT_BREAKER_STATE.labels(self.service).set(_BREAKER_STATES[new_state.name])
+        if new_state.name == pybreaker.STATE_OPEN:
+            logger.warning(f"{self.service} circuit opened, running without it until it recovers")
+            self.on_open()
+        elif new_state.name == pybreaker.STATE_CLOSED:
+            logger.info(f"{self.service} circuit closed, back to normal")
+
+
+class ProbedBreaker:
+    """In-process circuit breaker of a cache server, closed again by a health probe.
+
+    After ``fail_max`` consecutive failures the breaker opens and the cache runs degraded:
+    callers check ``degraded`` and skip the server without touching the network. A
+    background thread then calls ``ping`` every ``probe_interval`` seconds and closes the
+    breaker once it succeeds.
+    """
+
+    def __init__(
+        self, service: str, ping: Callable[[], object], fail_max: int = 3, probe_interval: float = 5.0
+    ):
+        self.service = service
+        self.ping = ping
+        self.probe_interval = probe_interval
+        # State is kept in process memory: checking it must not cost a round trip to the
+        # very server it protects
+        self.breaker = pybreaker.CircuitBreaker(
+            fail_max=fail_max,
+            reset_timeout=_BREAKER_RESET_TIMEOUT_SEC,
+            listeners=[BreakerMetricsListener(service, on_open=self._start_probe)],
+            name=service,
+        )
+        CIRCUIT_BREAKER_STATE.labels(service).set(0)
+        self._probe_lock = threading.Lock()
+        self._probe_thread: Optional[threading.Thread] = None
+
+    @property
+    def degraded(self) -> bool:
+        return self.breaker.current_state != pybreaker.STATE_CLOSED
+
+    def _start_probe(self) -> None:
+        with self._probe_lock:
+            if self._probe_thread is not None and self._probe_thread.is_alive():
+                return
+            self._probe_thread = threading.Thread(
+                target=self._probe, name=f"{self.service}-health-probe", daemon=True
+            )
+            self._probe_thread.start()
+
+    def _probe(self) -> None:
+        # Started from the listener, before the breaker has switched to open
+        while True:
+            time.sleep(self.probe_interval)
+            if self.breaker.current_state != pybreaker.STATE_OPEN:
+                return
+            try:
+                self.ping()
+            except Exception:
+                continue
+            # Half-open, then one call through the breaker to close it
+            self.breaker.half_open()
+            try:
+                self.breaker.call(self.ping)
+            except Exception:
+                # Reopened by the breaker: keep probing
+                continue
@@ -1,45 +1,96 @@
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 
 from application.initializer import logger_instance
-from application.main.config import settings
-from application.main.infrastructure.cache import CacheToUse
+from application.main.infrastructure.cache import CacheToUse, cache_tiers
+from application.main.utility.metrics import CACHE_REQUESTS
 
 logger = logger_instance.get_logger(__name__)
 
 
 class Cache:
-    def __init__(self):
-        self._cache = CacheToUse[settings.CACHE]
+    """Cache over one or more tiers, fastest first (``CACHE=memory,sqlite,redis``).
+
+    Reads go down the tiers until a hit, which is copied back into the faster tiers;
+    writes go to every tier. Hits and misses are counted per tier.
+    """
 
-    def __set(self, key: str, obj: Any, ttl: Optional[float] = None) -> None:
-        self._cache.set(key, obj, ttl)
+    def __init__(self):
+        self.tiers = cache_tiers()
+        self._caches = [CacheToUse[name]() for name in self.tiers]
 
     def set(self, key: str, obj: Any, ttl: Optional[float] = None) -> Optional[bool]:
-        try:
-            self.__set(key, obj, ttl)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to set cache key={key}: {e}")
-            return None
+        return self.set_many({key: obj}, ttl)
 
-    def __get(self, key: str) -> Optional[Any]:
-        return self._cache.get(key)
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> Optional[bool]:
+        ok = True
+        for name, cache in zip(self.tiers, self._caches):
+            try:
+                cache.set_many(items, ttl)
+            except Exception as e:
+                logger.error(f"Failed to set {len(items)} keys in {name} cache: {e}")
+                ok = None
+        return ok
 
     def get(self, key: str) -> Optional[Any]:
-        try:
-            return self.__get(key)
-        except Exception as e:
-            logger.error(f"Failed to get cache key={key}: {e}")
-            return None
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        values: List[Optional[Any]] = [None] * len(keys)
+        missing = list(range(len(keys)))
+        for depth, (name, cache) in enumerate(zip(self.tiers, self._caches)):
+            if not missing:
+                break
+            try:
+                results = cache.get_many([keys[i] for i in missing])
+            except Exception as e:
+                logger.error(f"Failed to get {len(missing)} keys from {name} cache: {e}")
+                results = [None] * len(missing)
+
+            hits = {}
+            still_missing = []
+            for i, result in zip(missing, results):
+                if result is None:
+                    still_missing.append(i)
+                else:
+                    values[i] = hits[keys[i]] = result
+            CACHE_REQUESTS.labels(name, "hit").inc(len(missing) - len(still_missing))
+            CACHE_REQUESTS.labels(name, "miss").inc(len(still_missing))
+
+            # Promote into the faster tiers that missed
+            for upper_name, upper in zip(self.tiers[:depth], self._caches[:depth]):
+                if not hits:
+                    break
+                try:
+                    upper.set_many(hits)
+                except Exception as e:
+                    logger.error(f"Failed to promote {len(hits)} keys to {upper_name} cache: {e}")
+            missing = still_missing
+        return values
+
+    def pin(self, keys: List[str], ttl: Optional[float] = None) -> None:
+        """Pins hot ``keys`` in the in-process tiers and extends their TTL to ``ttl`` elsewhere."""
+        for name, cache in zip(self.tiers, self._caches):
+            try:
+                cache.pin(keys)
+                if ttl:
+                    cache.expire(keys, ttl)
+            except Exception as e:
+                logger.error(f"Failed to pin {len(keys)} keys in {name} cache: {e}")
 
-    def __delete(self, key: str) -> None:
-        self._cache.delete(key)
+    def unpin(self, keys: List[str]) -> None:
+        for name, cache in zip(self.tiers, self._caches):
+            try:
+                cache.unpin(keys)
+            except Exception as e:
+                logger.error(f"Failed to unpin {len(keys)} keys in {name} cache: {e}")
 
     def delete(self, key: str) -> Optional[bool]:
-        try:
-            self.__delete(key)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to delete cache key={key}: {e}")
-            return None
+        ok = True
+        for name, cache in zip(self.tiers, self._caches):
+            try:
+                cache.delete(key)
+            except Exception as e:
+                logger.error(f"Failed to delete cache key={key} from {name} cache: {e}")
+                ok = None
+        return ok
@@ -1,5 +1,5 @@
 import abc
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 
 class ICacheOperations(abc.ABC):
@@ -14,3 +14,24 @@ class ICacheOperations(abc.ABC):
     @abc.abstractmethod
     def delete(self, key: str) -> None:
         pass
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Values of ``keys`` in order, None for misses. Backends override it with one round trip."""
+        return [self.get(key) for key in keys]
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        for key, obj in items.items():
+            self.set(key, obj, ttl)
+
+    def delete_many(self, keys: List[str]) -> None:
+        for key in keys:
+            self.delete(key)
+
+    def expire(self, keys: List[str], ttl: float) -> None:
+        """Resets the TTL of existing ``keys``; a no-op for backends without expiry."""
+
+    def pin(self, keys: List[str]) -> None:
+        """Keeps ``keys`` regardless of eviction and TTL; only in-process tiers pin."""
+
+    def unpin(self, keys: List[str]) -> None:
+        """Makes pinned ``keys`` subject to eviction and TTL again."""
@@ -0,0 +1,152 @@
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class CountMinSketch:
+    """Approximate counts of a stream of keys in ``depth`` rows of ``width`` counters.
+
+    Estimates never undercount; with conservative updates (only the smallest counters of
+    a key are raised) they overcount little as long as ``width`` is large next to the
+    number of keys that matter.
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self._rows = [[0] * width for _ in range(depth)]
+
+    def _cells(self, key: str) -> List[int]:
+        return [hash((row, key)) % self.width for row in range(self.depth)]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """Counts ``count`` more occurrences of ``key``; returns its new estimate."""
+        cells = self._cells(key)
+        estimate = min(row[cell] for row, cell in zip(self._rows, cells)) + count
+        for row, cell in zip(self._rows, cells):
+            if row[cell] < estimate:
+                row[cell] = estimate
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        return min(row[cell] for row, cell in zip(self._rows, self._cells(key)))
+
+    def decay(self) -> None:
+        """Halves every counter, so that estimates follow recent traffic."""
+        self._rows = [[count >> 1 for count in row] for row in self._rows]
+
+
+class HotKeyTracker:
+    """Heavy hitters among cache keys: a count-min sketch plus the ``top_k`` keys.
+
+    Every lookup is counted in the sketch, and a key whose estimate beats the smallest of
+    the current top ``top_k`` replaces it. Top keys counted at least ``min_count`` times
+    are hot. Counts are halved every ``decay_interval_sec``, so keys that stop being asked
+    for cool down and leave the top.
+    """
+
+    def __init__(
+        self,
+        top_k: int = 100,
+        min_count: int = 20,
+        decay_interval_sec: float = 300.0,
+        width: int = 2048,
+        depth: int = 4,
+    ):
+        self.top_k = max(1, top_k)
+        self.min_count = max(1, min_count)
+        self.decay_interval_sec = decay_interval_sec
+        self.sketch = CountMinSketch(width, depth)
+
+        self._lock = threading.Lock()
+        self._top: Dict[str, int] = {}
+        # Texts of the top keys only, for the admin endpoint when labels are recorded
+        self._labels: Dict[str, str] = {}
+        self._min_key: Optional[str] = None
+        self._hot: Set[str] = set()
+        self._decay_at = time.monotonic() + decay_interval_sec
+
+    @property
+    def num_hot(self) -> int:
+        return len(self._hot)
+
+    def is_hot(self, key: str) -> bool:
+        return key in self._hot
+
+    def record(
+        self, keys: List[str], labels: Optional[List[str]] = None
+    ) -> Tuple[List[str], List[str]]:
+        """Counts one lookup of each key, labelled by its text if ``labels`` are given.
+
+        :return: keys that became hot, and keys that are no longer hot
+        """
+        promoted: List[str] = []
+        demoted: List[str] = []
+        with self._lock:
+            if self.decay_interval_sec and time.monotonic() >= self._decay_at:
+                self._decay(demoted)
+            for key, label in zip(keys, labels or [None] * len(keys)):
+                self._offer(key, self.sketch.add(key), label, promoted, demoted)
+            # A key may have gone both ways within one batch: keep its final state
+            promoted = [key for key in dict.fromkeys(promoted) if key in self._hot]
+            demoted = [key for key in dict.fromkeys(demoted) if key not in self._hot]
+        return promoted, demoted
+
+    def _offer(
+        self, key: str, count: int, label: Optional[str], promoted: List[str], demoted: List[str]
+    ) -> None:
+        if key in self._top:
+            self._top[key] = count
+            if key == self._min_key:
+                self._min_key = None
+        else:
+            if len(self._top) >= self.top_k:
+                min_key = self._smallest()
+                if count <= self._top[min_key]:
+                    return
+                self._remove(min_key, demoted)
+            self._top[key] = count
+            if label is not None:
+                self._labels[key] = label
+            self._min_key = None
+        if count >= self.min_count and key not in self._hot:
+            self._hot.add(key)
+            promoted.append(key)
+
+    def _smallest(self) -> str:
+        if self._min_key is None:
+            self._min_key = min(self._top, key=self._top.__getitem__)
+        return self._min_key
+
+    def _remove(self, key: str, demoted: List[str]) -> None:
+        del self._top[key]
+        self._labels.pop(key, None)
+        if key in self._hot:
+            self._hot.discard(key)
+            demoted.append(key)
+        if key == self._min_key:
+            self._min_key = None
+
+    def _decay(self, demoted: List[str]) -> None:
+        self.sketch.decay()
+        for key in list(self._top):
+            self._top[key] >>= 1
+            if self._top[key] == 0:
+                self._remove(key, demoted)
+            elif self._top[key] < self.min_count and key in self._hot:
+                self._hot.discard(key)
+                demoted.append(key)
+        self._min_key = None
+        self._decay_at = time.monotonic() + self.decay_interval_sec
+
+    def top(self, limit: Optional[int] = None) -> List[Dict]:
+        """Top keys by estimated lookups, most counted first, with their text if labelled."""
+        with self._lock:
+            ranked = sorted(self._top.items(), key=lambda it: it[1], reverse=True)
+            top = []
+            for key, count in ranked[:limit]:
+                entry = {"key": key, "count": count, "hot": key in self._hot}
+                if key in self._labels:
+                    entry["text"] = self._labels[key]
+                top.append(entry)
+            return top
@@ -0,0 +1,22 @@
+import hashlib
+from typing import Optional, Tuple
+
+
+def text_hash(text: str) -> str:
+    return hashlib.md5(text.encode()).hexdigest()
+
+
+def translation_cache_key(pair: str, model_version: str, text: str) -> str:
+    """Key of the cached translation of ``text``: ``<pair>:<model_version>:<md5 of text>``.
+
+    ``pair`` includes the tier (``en2vi:quality``); ``model_version`` must not contain ``:``.
+    """
+    return f"{pair}:{model_version}:{text_hash(text)}"
+
+
+def parse_translation_cache_key(key: str) -> Optional[Tuple[str, str, str]]:
+    """(pair, model_version, text_hash) of a ``translation_cache_key``, None for other keys."""
+    parts = key.rsplit(":", 2)
+    if len(parts) != 3 or not all(parts):
+        return None
+    return parts[0], parts[1], parts[2]
@@ -0,0 +1,93 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from pytimeparse.timeparse import timeparse
+
+from application.main.infrastructure.cache.cache_interface import ICacheOperations
+from application.main.utility.config_loader import ConfigReaderInstance
+
+
+class InMemory(ICacheOperations):
+    """Process-local LRU cache with per-entry TTL.
+
+    Values are stored and returned exactly like the Redis backend does (bytes, JSON decoded
+    when possible), so callers can switch backends without changes. Pinned keys (the hot
+    ones, see ``HotKeyTracker``) are kept apart from the LRU: they are neither evicted nor
+    expired until unpinned, and do not count towards ``max_entries``.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.config = ConfigReaderInstance.yaml.read_config_from_file(
+            "memory_config.yaml"
+        )
+        ttl = timeparse(self.config.ttl) if self.config.ttl else None
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self.max_entries = int(self.config.max_entries or 0)
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+        self._pinned: Set[str] = set()
+        self._pinned_entries: Dict[str, bytes] = {}
+
+    def set(self, key: str, obj: Any, ttl: Optional[float] = None) -> None:
+        value = obj if isinstance(obj, (str, bytes)) else json.dumps(obj)
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+
+        with self._lock:
+            if key in self._pinned:
+                self._pinned_entries[key] = value
+            else:
+                self._insert(key, value, ttl)
+
+    def _insert(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl
+        self._entries[key] = (value, time.monotonic() + ttl if ttl else None)
+        self._entries.move_to_end(key)
+        if self.max_entries:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and key in self._pinned_entries:
+                entry = (self._pinned_entries[key], None)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+        try:
+            return json.loads(value)
+        except (TypeError, json.JSONDecodeError):
+            return value
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._pinned_entries.pop(key, None)
+
+    def pin(self, keys: List[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._pinned.add(key)
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._pinned_entries[key] = entry[0]
+
+    def unpin(self, keys: List[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._pinned.discard(key)
+                value = self._pinned_entries.pop(key, None)
+                if value is not None:
+                    self._insert(key, value)
@@ -0,0 +1,202 @@
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import pybreaker
+from pymongo import ASCENDING, MongoClient, UpdateOne
+from pymongo.errors import PyMongoError
+from pytimeparse.timeparse import timeparse
+
+from application.main.infrastructure.cache.breaker import ProbedBreaker
+from application.main.infrastructure.cache.cache_interface import ICacheOperations
+from application.main.infrastructure.cache.keys import parse_translation_cache_key
+from application.main.utility.config_loader import ConfigReaderInstance
+from application.main.utility.retry import retry
+
+logger = logging.getLogger(__name__)
+
+# model_version of human-reviewed translations, stored under the language pair without
+# tier (``en2vi``) and served for their text whatever the tier and model
+HUMAN_MODEL_VERSION = "human"
+
+
+class TranslationMemory(ICacheOperations):
+    """Persistent translation memory in a MongoDB collection, meant as the last cache tier.
+
+    Entries never expire, so long-lived content is translated once. Documents are keyed by
+    ``(pair, model_version, text_hash)`` under a unique compound index, and a whole batch
+    of misses is looked up with one ``$in`` query per pair and model. Machine translations
+    are inserted with ``$setOnInsert``, so they never replace an existing entry, and a
+    human-reviewed entry (``model_version: "human"``, see ``seed``) takes precedence over
+    the model's own for the same text.
+
+    Like the Redis tier, it sits behind an in-process circuit breaker: once ``fail_max``
+    consecutive calls fail, lookups miss and writes are dropped without waiting on the
+    server until a background ping gets through again.
+    """
+
+    @retry(service=__name__, logger=logger)
+    def __init__(self):
+        super().__init__()
+        self.config = ConfigReaderInstance.yaml.read_config_from_file("mongodb_config.yaml")
+        config = self.config.test
+        timeout_ms = int(config.translation_memory_timeout_ms or 500)
+        # Own client with short timeouts: this sits on the request path
+        self.client = MongoClient(
+            f"mongodb://{config.host}:{config.port}",
+            serverSelectionTimeoutMS=timeout_ms,
+            connectTimeoutMS=timeout_ms,
+            socketTimeoutMS=timeout_ms,
+        )
+        self.collection = self.client[config.db_name][
+            config.translation_memory_collection_name or "translation_memory"
+        ]
+        self.collection.create_index(
+            [("pair", ASCENDING), ("model_version", ASCENDING), ("text_hash", ASCENDING)],
+            unique=True,
+            name="pair_model_version_text_hash",
+        )
+        self.breaker = ProbedBreaker(
+            "mongodb",
+            ping=lambda: self.client.admin.command("ping"),
+            fail_max=int(config.translation_memory_fail_max or 3),
+            probe_interval=timeparse(str(config.translation_memory_probe_interval or "5s")),
+        )
+
+    @property
+    def degraded(self) -> bool:
+        return self.breaker.degraded
+
+    @staticmethod
+    def _group(keys: List[str]) -> Dict[Tuple[str, str], Dict[str, str]]:
+        """Keys by (pair, model_version), then by text hash; foreign keys are skipped."""
+        groups: Dict[Tuple[str, str], Dict[str, str]] = {}
+        for key in keys:
+            parsed = parse_translation_cache_key(key)
+            if parsed is not None:
+                pair, model_version, text_hash = parsed
+                groups.setdefault((pair, model_version), {})[text_hash] = key
+        return groups
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        if self.degraded or not keys:
+            return [None] * len(keys)
+
+        @self.breaker.breaker
+        def protected_find() -> Dict[str, str]:
+            found: Dict[str, str] = {}
+            for (pair, model_version), by_hash in self._group(keys).items():
+                hashes = list(by_hash)
+                cursor = self.collection.find(
+                    {
+                        "$or": [
+                            {
+                                "pair": pair,
+                                "model_version": model_version,
+                                "text_hash": {"$in": hashes},
+                            },
+                            {
+                                "pair": pair.split(":")[0],
+                                "model_version": HUMAN_MODEL_VERSION,
+                                "text_hash": {"$in": hashes},
+                            },
+                        ]
+                    },
+                    projection={"_id": False, "model_version": 1, "text_hash": 1, "translation": 1},
+                )
+                for doc in cursor:
+                    key = by_hash[doc["text_hash"]]
+                    if key not in found or doc["model_version"] == HUMAN_MODEL_VERSION:
+                        found[key] = doc["translation"]
+            return found
+
+        try:
+            found = protected_find()
+        except pybreaker.CircuitBreakerError:
+            logger.error(f"Circuit breaker is open: failed to get {len(keys)} keys")
+            return [None] * len(keys)
+        except PyMongoError as e:
+            logger.error(f"Translation memory find error: {e}")
+            return [None] * len(keys)
+        return [found.get(key) for key in keys]
+
+    def set(self, key: str, obj: Any, ttl: Optional[float] = None) -> None:
+        self.set_many({key: obj}, ttl)
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Inserts the entries that do not exist yet; ``ttl`` is ignored, entries persist."""
+        if self.degraded or not items:
+            return
+        now = time.time()
+        operations = []
+        for (pair, model_version), by_hash in self._group(list(items)).items():
+            for text_hash, key in by_hash.items():
+                value = items[key]
+                operations.append(
+                    UpdateOne(
+                        {"pair": pair, "model_version": model_version, "text_hash": text_hash},
+                        {
+                            "$setOnInsert": {
+                                "translation": value.decode("utf-8")
+                                if isinstance(value, bytes)
+                                else str(value),
+                                "created_at": now,
+                            }
+                        },
+                        upsert=True,
+                    )
+                )
+        if not operations:
+            return
+
+        @self.breaker.breaker
+        def protected_bulk_write():
+            self.collection.bulk_write(operations, ordered=False)
+
+        try:
+            protected_bulk_write()
+        except pybreaker.CircuitBreakerError:
+            logger.error(f"Circuit breaker is open: failed to set {len(items)} keys")
+        except PyMongoError as e:
+            logger.error(f"Translation memory bulk write error: {e}")
+
+    def seed(self, pair: str, translations: Dict[str, str]) -> int:
+        """Upserts human-reviewed translations of ``pair`` (e.g. ``en2vi``) by text hash.
+
+        :return: number of entries written
+        """
+        now = time.time()
+        operations = [
+            UpdateOne(
+                {"pair": pair, "model_version": HUMAN_MODEL_VERSION, "text_hash": text_hash},
+                {"$set": {"translation": translation, "created_at": now}},
+                upsert=True,
+            )
+            for text_hash, translation in translations.items()
+        ]
+        if not operations:
+            return 0
+        result = self.collection.bulk_write(operations, ordered=False)
+        return result.upserted_count + result.modified_count
+
+    def delete(self, key: str) -> None:
+        parsed = parse_translation_cache_key(key)
+        if parsed is None or self.degraded:
+            return
+        pair, model_version, text_hash = parsed
+
+        @self.breaker.breaker
+        def protected_delete():
+            self.collection.delete_one(
+                {"pair": pair, "model_version": model_version, "text_hash": text_hash}
+            )
+
+        try:
+            protected_delete()
+        except pybreaker.CircuitBreakerError:
+            logger.error(f"Circuit breaker is open: failed to delete key {key}")
+        except PyMongoError as e:
+            logger.error(f"Translation memory delete error: {e}")
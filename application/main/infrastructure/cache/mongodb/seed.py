@@ -0,0 +1,121 @@
+"""Pre-seeds the MongoDB translation memory with human-reviewed translations.
+
+Reads a CSV of ``source,translation`` rows for one language pair; the seeded entries are
+served instead of the model's translations of the same texts, whatever the tier, e.g.::
+
+    python -m application.main.infrastructure.cache.mongodb.seed --pair en2vi \\
+        --csv reviewed/en2vi.csv
+
+Texts are stored the way the translator looks them up: with PLACEHOLDER_MASKING, numbers,
+URLs, emails and code spans are replaced by placeholders on both sides, which requires the
+translation to contain the same values as the source; other rows are skipped.
+
+Machine translations of the seeded texts already cached in the shared tiers of the CACHE
+setting (Redis, SQLite) are deleted, so the seeded entries are served on the next lookup.
+In-process memory tiers of running servers cannot be reached from here: they keep serving
+the machine translation until the entry expires or the server restarts.
+"""
+
+import argparse
+import csv
+import json
+from typing import Dict, List, Optional, Tuple
+
+from application.main.config import settings
+from application.main.infrastructure.cache import CacheToUse, cache_tiers
+from application.main.infrastructure.cache.keys import text_hash
+from application.main.infrastructure.cache.mongodb.operations import TranslationMemory
+from application.main.infrastructure.translator.masking import PLACEHOLDER, mask
+from application.main.infrastructure.translator.translators import (
+    TIERS,
+    TRANSLATOR_FACTORY,
+    StubTranslator,
+)
+
+# Tiers that are not shared between servers, or that hold the seeded entries themselves
+_UNREACHABLE_TIERS = ("memory", "mongodb")
+
+
+def to_template(source: str, translation: str) -> Optional[Tuple[str, str]]:
+    """(source, translation) as masked templates with matching placeholders, or None."""
+    if not settings.PLACEHOLDER_MASKING:
+        return source, translation
+    masked_source, masked_translation = mask(source), mask(translation)
+    if sorted(masked_source.values) != sorted(masked_translation.values):
+        return None
+    # Number the translation's placeholders after the source's, whatever their order
+    indices = list(range(len(masked_source.values)))
+    mapping: List[int] = []
+    for value in masked_translation.values:
+        index = next(i for i in indices if masked_source.values[i] == value)
+        indices.remove(index)
+        mapping.append(index)
+    template = PLACEHOLDER.sub(
+        lambda match: f"{{{mapping[int(match.group(1))]}}}", masked_translation.template
+    )
+    return masked_source.template, template
+
+
+def load_translations(path: str) -> Tuple[Dict[str, str], int]:
+    """Translations by source text hash, and the number of skipped rows."""
+    translations: Dict[str, str] = {}
+    skipped = 0
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.reader(f):
+            if len(row) < 2 or not row[0].strip():
+                skipped += 1
+                continue
+            templates = to_template(row[0].strip(), row[1].strip())
+            if templates is None:
+                skipped += 1
+                continue
+            source, translation = templates
+            translations[text_hash(source)] = translation
+    return translations, skipped
+
+
+def machine_cache_keys(pair: str, hashes: List[str]) -> List[str]:
+    """Cache keys of the model translations of ``hashes``, for every tier of ``pair``."""
+    keys = []
+    for tier in TIERS:
+        factory = TRANSLATOR_FACTORY.get(f"{pair}:{tier}")
+        if factory is None:
+            continue
+        version = (StubTranslator if settings.STUB_MODE else factory).checkpoint_version()
+        keys.extend(f"{pair}:{tier}:{version}:{hash_}" for hash_ in hashes)
+    return keys
+
+
+def invalidate_machine_translations(pair: str, hashes: List[str]) -> List[str]:
+    """Deletes model translations of ``hashes`` from the shared cache tiers.
+
+    :return: names of the tiers cleared
+    """
+    keys = machine_cache_keys(pair, hashes)
+    cleared = []
+    for name in cache_tiers():
+        if name in _UNREACHABLE_TIERS or name not in CacheToUse or not keys:
+            continue
+        CacheToUse[name]().delete_many(keys)
+        cleared.append(name)
+    return cleared
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--pair", required=True, help='language pair without tier, e.g. "en2vi"')
+    parser.add_argument("--csv", required=True, help="source,translation rows")
+    args = parser.parse_args(argv)
+
+    translations, skipped = load_translations(args.csv)
+    written = TranslationMemory().seed(args.pair, translations)
+    cleared = invalidate_machine_translations(args.pair, list(translations))
+    print(
+        json.dumps(
+            {"pair": args.pair, "written": written, "skipped": skipped, "cleared_tiers": cleared}
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,16 @@
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 import pybreaker
 import redis
 from pytimeparse.timeparse import timeparse
+from redis.backoff import NoBackoff
 from redis.exceptions import ConnectionError, TimeoutError
+from redis.retry import Retry
 
 from application.main.config import settings
+from application.main.infrastructure.cache.breaker import ProbedBreaker
 from application.main.infrastructure.cache.cache_interface import ICacheOperations
 from application.main.utility.config_loader import ConfigReaderInstance
 from application.main.utility.retry import retry
@@ -16,11 +19,18 @@ logger = logging.getLogger(__name__)
 
 
 class Redis(ICacheOperations):
+    """Redis cache with an in-process circuit breaker.
+
+    After ``fail_max`` consecutive failures the breaker opens and the cache runs degraded:
+    reads miss and writes are dropped without touching the network. A background thread
+    then pings Redis every ``probe_interval`` and closes the breaker once it answers.
+    """
+
     @retry(service=__name__, logger=logger)
     def __init__(self):
         super().__init__()
         self.config = ConfigReaderInstance.yaml.read_config_from_file(
-            settings.CACHE + "_config.yaml"
+            "redis_config.yaml"
         )
 
         if not all(hasattr(self.config, attr) for attr in ["host", "port", "ttl"]):
@@ -31,20 +41,30 @@ class Redis(ICacheOperations):
             ttl = None
 
         setattr(self.config, "ttl", ttl)
+        socket_timeout = float(getattr(self.config, "socket_timeout", 0.5))
+        self.probe_interval = timeparse(str(getattr(self.config, "probe_interval", "5s")))
 
         self.redis = redis.Redis(
             host=self.config.host,
             port=self.config.port,
             decode_responses=False,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+            # Failures are handled by the breaker, not retried in the request path
+            retry=Retry(NoBackoff(), 0),
         )
 
-        self.redis_breaker = pybreaker.CircuitBreaker(
-            fail_max=3,
-            reset_timeout=60,
-            state_storage=pybreaker.CircuitRedisStorage(
-                pybreaker.STATE_CLOSED, self.redis
-            ),
+        self.breaker = ProbedBreaker(
+            "redis",
+            ping=self.redis.ping,
+            fail_max=int(getattr(self.config, "fail_max", 3)),
+            probe_interval=self.probe_interval,
         )
+        self.redis_breaker = self.breaker.breaker
+
+    @property
+    def degraded(self) -> bool:
+        return self.breaker.degraded
 
     @classmethod
     def get_uri(cls, config: Any = None) -> str:
@@ -53,13 +73,15 @@ class Redis(ICacheOperations):
         If config is not provided, use default values.
         """
         config = config or ConfigReaderInstance.yaml.read_config_from_file(
-            settings.CACHE + "_config.yaml"
+            "redis_config.yaml"
         )
         host = getattr(config, "host", "localhost")
         port = getattr(config, "port", 6379)
         return f"redis://{host}:{port}"
 
     def set(self, key: str, obj: Any, ttl: Optional[float] = None) -> None:
+        if self.degraded:
+            return
         value = obj if isinstance(obj, (str, bytes)) else json.dumps(obj)
 
         @self.redis_breaker
@@ -77,6 +99,9 @@ class Redis(ICacheOperations):
             logger.error(f"Redis set error: {e}")
 
     def get(self, key: str) -> Optional[Any]:
+        if self.degraded:
+            return None
+
         @self.redis_breaker
         def protected_get():
             return self.redis.get(key)
@@ -94,7 +119,73 @@ class Redis(ICacheOperations):
             logger.error(f"Redis get error: {e}")
             return None
 
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        if self.degraded or not keys:
+            return [None] * len(keys)
+
+        @self.redis_breaker
+        def protected_mget():
+            return self.redis.mget(keys)
+
+        try:
+            results = protected_mget()
+        except pybreaker.CircuitBreakerError:
+            logger.error(f"Circuit breaker is open: failed to get {len(keys)} keys")
+            return [None] * len(keys)
+        except (ConnectionError, TimeoutError) as e:
+            logger.error(f"Redis mget error: {e}")
+            return [None] * len(keys)
+
+        values = []
+        for result in results:
+            try:
+                values.append(json.loads(result))
+            except (TypeError, json.JSONDecodeError):
+                values.append(result)
+        return values
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        if self.degraded or not items:
+            return
+        ttl = ttl if ttl is not None else self.config.ttl
+
+        @self.redis_breaker
+        def protected_set_many():
+            with self.redis.pipeline(transaction=False) as pipe:
+                for key, obj in items.items():
+                    value = obj if isinstance(obj, (str, bytes)) else json.dumps(obj)
+                    pipe.set(key, value, ex=int(ttl) if ttl else None)
+                pipe.execute()
+
+        try:
+            protected_set_many()
+        except pybreaker.CircuitBreakerError:
+            logger.error(f"Circuit breaker is open: failed to set {len(items)} keys")
+        except (ConnectionError, TimeoutError) as e:
+            logger.error(f"Redis pipeline set error: {e}")
+
+    def expire(self, keys: List[str], ttl: float) -> None:
+        if self.degraded or not keys:
+            return
+
+        @self.redis_breaker
+        def protected_expire():
+            with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.expire(key, int(ttl))
+                pipe.execute()
+
+        try:
+            protected_expire()
+        except pybreaker.CircuitBreakerError:
+            logger.error(f"Circuit breaker is open: failed to expire {len(keys)} keys")
+        except (ConnectionError, TimeoutError) as e:
+            logger.error(f"Redis pipeline expire error: {e}")
+
     def delete(self, key: str) -> None:
+        if self.degraded:
+            return
+
         @self.redis_breaker
         def protected_delete():
             self.redis.delete(key)
@@ -105,3 +196,21 @@ class Redis(ICacheOperations):
             logger.error(f"Circuit breaker is open: failed to delete key {key}")
         except (ConnectionError, TimeoutError) as e:
             logger.error(f"Redis delete error: {e}")
+
+    def delete_many(self, keys: List[str]) -> None:
+        if self.degraded or not keys:
+            return
+
+        @self.redis_breaker
+        def protected_delete_many():
+            with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.delete(key)
+                pipe.execute()
+
+        try:
+            protected_delete_many()
+        except pybreaker.CircuitBreakerError:
+            logger.error(f"Circuit breaker is open: failed to delete {len(keys)} keys")
+        except (ConnectionError, TimeoutError) as e:
+            logger.error(f"Redis pipeline delete error: {e}")
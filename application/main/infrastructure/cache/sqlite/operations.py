@@ -0,0 +1,178 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from pytimeparse.timeparse import timeparse
+
+from application.main.config import settings
+from application.main.infrastructure.cache.cache_interface import ICacheOperations
+from application.main.utility.config_loader import ConfigReaderInstance
+
+# Reads refresh the LRU timestamp at most this often per entry, to keep reads read-only
+_TOUCH_INTERVAL_SEC = 3600
+# SQLite caps the number of bound parameters per statement
+_MAX_VARIABLES = 900
+
+
+def _chunks(items: List[Any], size: int = _MAX_VARIABLES):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+class SQLite(ICacheOperations):
+    """Persistent local cache in a memory-mapped SQLite file under ``CACHE_DIR``.
+
+    Survives restarts and needs no server, so it can be the only tier of a single-node
+    deployment or sit between the in-process cache and Redis. Entries expire after
+    ``ttl``; once the file grows past ``max_size_mb`` the least recently read entries are
+    evicted. Values are stored and returned like the Redis backend does.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.config = ConfigReaderInstance.yaml.read_config_from_file(
+            "sqlite_config.yaml"
+        )
+        ttl = timeparse(self.config.ttl) if self.config.ttl else None
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self.max_size_bytes = int(float(self.config.max_size_mb) * 1024 * 1024)
+        self.path = settings.APP_CONFIG.CACHE_DIR / self.config.filename
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"PRAGMA mmap_size={int(float(self.config.mmap_size_mb) * 1024 * 1024)}"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " expires_at REAL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)"
+        )
+        self._size_bytes = self._data_size()
+
+    @staticmethod
+    def _encode(obj: Any) -> bytes:
+        value = obj if isinstance(obj, (str, bytes)) else json.dumps(obj)
+        return value.encode("utf-8") if isinstance(value, str) else value
+
+    @staticmethod
+    def _decode(value: bytes) -> Any:
+        try:
+            return json.loads(value)
+        except (TypeError, json.JSONDecodeError, UnicodeDecodeError):
+            return value
+
+    def _data_size(self) -> int:
+        page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return page_size * (page_count - freelist)
+
+    def set(self, key: str, obj: Any, ttl: Optional[float] = None) -> None:
+        self.set_many({key: obj}, ttl)
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        if not items:
+            return
+        now = time.time()
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = now + ttl if ttl else None
+        rows = [(key, self._encode(obj), expires_at, now) for key, obj in items.items()]
+
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries (key, value, expires_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            self._size_bytes += sum(len(row[0]) + len(row[1]) for row in rows)
+            if self.max_size_bytes and self._size_bytes > self.max_size_bytes:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drops expired entries, then the least recently read ones, down to 90% of the cap."""
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+            )
+        self._size_bytes = self._data_size()
+        target = int(self.max_size_bytes * 0.9)
+        while self._size_bytes > target:
+            count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if not count:
+                break
+            # Remove a share of the entries proportional to the overshoot, oldest first
+            excess = max(1, int(count * (1 - target / self._size_bytes)))
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.execute(
+                    "DELETE FROM entries WHERE key IN"
+                    " (SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+                    (excess,),
+                )
+            self._size_bytes = self._data_size()
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        if not keys:
+            return []
+        now = time.time()
+        found: Dict[str, bytes] = {}
+        stale: List[str] = []
+
+        with self._lock:
+            for chunk in _chunks(list(dict.fromkeys(keys))):
+                rows = self._conn.execute(
+                    "SELECT key, value, expires_at, accessed_at FROM entries"
+                    f" WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, value, expires_at, accessed_at in rows:
+                    if expires_at is not None and expires_at <= now:
+                        continue
+                    found[key] = value
+                    if accessed_at < now - _TOUCH_INTERVAL_SEC:
+                        stale.append(key)
+            if stale:
+                with self._conn:
+                    self._conn.execute("BEGIN")
+                    for chunk in _chunks(stale):
+                        self._conn.execute(
+                            "UPDATE entries SET accessed_at = ?"
+                            f" WHERE key IN ({','.join('?' * len(chunk))})",
+                            [now, *chunk],
+                        )
+
+        return [self._decode(found[key]) if key in found else None for key in keys]
+
+    def expire(self, keys: List[str], ttl: float) -> None:
+        expires_at = time.time() + ttl
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                for chunk in _chunks(keys):
+                    self._conn.execute(
+                        "UPDATE entries SET expires_at = ?"
+                        f" WHERE key IN ({','.join('?' * len(chunk))})",
+                        [expires_at, *chunk],
+                    )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
@@ -1,3 +1,5 @@
+from application.main.infrastructure.database.memory.operations import InMemoryDataBase
 from application.main.infrastructure.database.mongodb.operations import Mongodb
 
-DataBaseToUse = {'mongodb': Mongodb()}
+# Backends are instantiated on selection so unused ones never connect
+DataBaseToUse = {'mongodb': Mongodb, 'memory': InMemoryDataBase}
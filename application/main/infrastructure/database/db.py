@@ -1,11 +1,12 @@
-from typing import Dict
+from typing import Dict, Optional
 
 from application.main.config import settings
 from application.main.infrastructure.database import DataBaseToUse
 
 class DataBase:
-    def __init__(self):
-        self._db = DataBaseToUse[settings.DB]
+    def __init__(self, collection_name: Optional[str] = None):
+        # None selects the collection configured for the backend
+        self._db = DataBaseToUse[settings.DB](collection_name)
 
     def get_database_config_config_details(self):
         return self._db
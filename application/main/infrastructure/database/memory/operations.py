@@ -0,0 +1,67 @@
+import copy
+import threading
+import uuid
+from typing import Dict, List, Optional
+
+from application.main.infrastructure.database.db_interface import IDataBaseOperations
+
+
+class InMemoryDataBase(IDataBaseOperations):
+    """Process-local stand-in for the Mongodb backend.
+
+    Filters only support equality on top-level fields, which is all the application uses.
+    """
+
+    def __init__(self, collection_name: Optional[str] = None):
+        super().__init__()
+        self.collection_name = collection_name
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict] = {}
+
+    @staticmethod
+    def _matches(record: Dict, filter: Dict) -> bool:
+        return all(record.get(k) == v for k, v in filter.items())
+
+    def fetch_single_db_record(self, unique_id: str):
+        with self._lock:
+            record = self._records.get(unique_id)
+            return copy.deepcopy(record) if record is not None else None
+
+    def update_single_db_record(self, record: Dict):
+        _id = record.get("_id")
+        if not _id:
+            raise ValueError("Record must have '_id' for update")
+        with self._lock:
+            if _id not in self._records:
+                return 0
+            self._records[_id].update(copy.deepcopy(record))
+            return 1
+
+    def update_multiple_db_record(self, filter: Dict, update_data: Dict):
+        with self._lock:
+            matched = [r for r in self._records.values() if self._matches(r, filter)]
+            for record in matched:
+                record.update(copy.deepcopy(update_data))
+            return len(matched)
+
+    def fetch_multiple_db_record(self, filter: Dict):
+        with self._lock:
+            return [
+                copy.deepcopy(r) for r in self._records.values() if self._matches(r, filter)
+            ]
+
+    def insert_single_db_record(self, record: Dict):
+        with self._lock:
+            return self._insert(record)
+
+    def insert_multiple_db_record(self, records: List[Dict]):
+        with self._lock:
+            return [self._insert(record) for record in records]
+
+    def _insert(self, record: Dict) -> str:
+        record = copy.deepcopy(record)
+        _id = record.setdefault("_id", uuid.uuid4().hex)
+        if _id in self._records:
+            raise ValueError(f"Duplicate _id: {_id}")
+        self._records[_id] = record
+        return _id
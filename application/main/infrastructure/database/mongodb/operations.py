@@ -1,4 +1,5 @@
-from typing import Dict
+import threading
+from typing import Dict, Optional
 
 from pymongo import MongoClient
 
@@ -6,9 +7,20 @@ from application.main.config import settings
 from application.main.infrastructure.database.db_interface import IDataBaseOperations
 from application.main.utility.config_loader import ConfigReaderInstance
 
+# One client (and connection pool) per server, shared by every collection
+_clients: Dict[str, MongoClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(uri: str) -> MongoClient:
+    with _clients_lock:
+        if uri not in _clients:
+            _clients[uri] = MongoClient(uri)
+        return _clients[uri]
+
 
 class Mongodb(IDataBaseOperations):
-    def __init__(self):
+    def __init__(self, collection_name: Optional[str] = None):
         super().__init__()
         self.db_config = ConfigReaderInstance.yaml.read_config_from_file(
             settings.DB + "_config.yaml"
@@ -20,9 +32,9 @@ class Mongodb(IDataBaseOperations):
             + ":"
             + str(self.db_config.test.port)
         )
-        self.client = MongoClient(connection_uri)
+        self.client = _get_client(connection_uri)
         self.db = self.client[self.db_config.test.db_name]
-        self.collection = self.db[self.db_config.test.collection_name]
+        self.collection = self.db[collection_name or self.db_config.test.collection_name]
 
     def fetch_single_db_record(self, unique_id: str):
         filter = {"_id": unique_id}
@@ -1 +1,12 @@
+from functools import lru_cache
+
+from application.main.config import settings
+from application.main.infrastructure.detector.base import BaseDetector
 from application.main.infrastructure.detector.detector import Detector
+from application.main.infrastructure.detector.stub import StubDetector
+
+
+@lru_cache(maxsize=None)
+def get_detector() -> BaseDetector:
+    """Returns the process-wide language detector (a stub one in STUB_MODE)."""
+    return StubDetector() if settings.STUB_MODE else Detector()
@@ -81,3 +81,8 @@ class BaseDetector(abc.ABC):
     @abc.abstractmethod
     def detect(self, texts: list[str], topk=3) -> list[dict]:
         raise NotImplementedError()
+
+    @abc.abstractmethod
+    def detect_each(self, texts: list[str]) -> list[str]:
+        """Most probable language of each text, unlike ``detect`` which merges them."""
+        raise NotImplementedError()
@@ -56,3 +56,25 @@ class Detector(BaseDetector):
         )
 
         return top_languages
+
+    def detect_each(self, texts: list[str]) -> list[str]:
+        """Detects the most probable language of each text in one batched forward pass.
+
+        Args:
+            texts (list[str]): List of text strings to analyze.
+
+        Returns:
+            list[str]: Language label of each text, in input order.
+        """
+        inputs = self.tokenizer(
+            texts,
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=512,
+        ).to(self.device)
+
+        with torch.no_grad():
+            logits = self.model(**inputs).logits  # shape: [num_texts, num_classes]
+
+        return [self.id2label[idx] for idx in logits.argmax(dim=-1).tolist()]
@@ -0,0 +1,43 @@
+import time
+
+from application.main.config import settings
+from application.main.infrastructure.detector.base import BaseDetector
+
+# Letters shared with French (â, ê, ô) are left out of the Vietnamese set
+_VIETNAMESE_CHARS = set("ăđơưạảấầẩẫậắằẳẵặẹẻẽếềểễệỉịọỏốồổỗộớờởỡợụủứừửữựỳỵỷỹ")
+_FRENCH_CHARS = set("éèêëàâçîïôûùüÿœæ")
+_FRENCH_WORDS = {"le", "la", "les", "est", "et", "je", "vous", "nous", "une", "des", "du"}
+
+
+class StubDetector(BaseDetector):
+    """Heuristic stand-in detector (en, fr, vi) with a synthetic ``STUB_DETECT_LATENCY_MS``."""
+
+    def __init__(self):
+        super().__init__()
+        self.model_name = "stub"
+
+    def detect(self, texts: list[str], topk=3) -> list[dict]:
+        self._sleep()
+        return [
+            {"language": language, "confidence": 1.0 if i == 0 else 0.0}
+            for i, language in enumerate(self._rank(" ".join(texts))[:topk])
+        ]
+
+    def detect_each(self, texts: list[str]) -> list[str]:
+        self._sleep()
+        return [self._rank(text)[0] for text in texts]
+
+    @staticmethod
+    def _sleep() -> None:
+        if settings.STUB_DETECT_LATENCY_MS > 0:
+            time.sleep(settings.STUB_DETECT_LATENCY_MS / 1000)
+
+    @staticmethod
+    def _rank(text: str) -> list[str]:
+        text = text.lower()
+        chars = set(text)
+        if chars & _VIETNAMESE_CHARS:
+            return ["vi", "fr", "en"]
+        if chars & _FRENCH_CHARS or set(text.split()) & _FRENCH_WORDS:
+            return ["fr", "en", "vi"]
+        return ["en", "fr", "vi"]
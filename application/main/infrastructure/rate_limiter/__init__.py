@@ -1,2 +1,10 @@
-from application.main.infrastructure.rate_limiter.limiter import setup_rate_limit
-from application.main.infrastructure.rate_limiter.limiter import get_limiter
\ No newline at end of file
+from application.main.infrastructure.rate_limiter.limiter import (
+    Limiter,
+    RateLimitExceeded,
+    get_limiter,
+    setup_rate_limit,
+)
+from application.main.infrastructure.rate_limiter.quota import (
+    charge_detection,
+    charge_tokens,
+)
@@ -1,30 +1,308 @@
+import asyncio
+import functools
 import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
-from slowapi import Limiter
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
-from slowapi.util import get_remote_address
+from fastapi.responses import JSONResponse, Response
+from starlette.requests import HTTPConnection
 
+from application.main.config import settings
+from application.main.infrastructure.cache import cache_tiers
 from application.main.infrastructure.cache.redis.operations import Redis
+from application.main.infrastructure.rate_limiter.quota import (
+    TokenQuota,
+    start_token_quota,
+    stop_token_quota,
+)
+from application.main.infrastructure.rate_limiter.sync import RedisUsageSync
+from application.main.infrastructure.rate_limiter.token_bucket import (
+    TokenBucket,
+    parse_limit,
+)
+from application.main.utility.metrics import (
+    RATE_LIMIT_DEGRADED,
+    RATE_LIMIT_SYNC_LATENCY,
+    RATE_LIMITED_REQUESTS,
+)
 
 logger = logging.getLogger(__name__)
 _limiter = None
 
 
+class RateLimitExceeded(Exception):
+    def __init__(self, limit: str, retry_after: int):
+        super().__init__(f"Rate limit exceeded: {limit}")
+        self.limit = limit
+        self.retry_after = retry_after
+        self.headers: Dict[str, str] = {}
+
+
+def get_remote_address(request: Request) -> str:
+    return request.client.host if request.client else "127.0.0.1"
+
+
+class Limiter:
+    """Approximate distributed rate limiter.
+
+    Every process enforces its limits on local token buckets, so a request never waits on
+    Redis. In the background the usage of each key is added to a shared counter per fixed
+    window of the limit period, every ``sync_interval_sec`` in one pipelined round trip,
+    and each bucket is drained by what the other processes consumed since the previous
+    exchange. Global overshoot is thus bounded by what the other processes admit during
+    one sync interval. When Redis is slower than ``sync_timeout_sec`` or down, limits stay
+    enforced per process and the pending usage is carried over to the next exchange.
+
+    Buckets left full and unused for a whole period are dropped at most every
+    ``evict_interval_sec``, when a new bucket is created, whether or not usage is synced.
+    """
+
+    def __init__(
+        self,
+        key_func: Callable[[Request], str] = get_remote_address,
+        default_limits: Optional[List[str]] = None,
+        sync: Optional[RedisUsageSync] = None,
+        sync_interval_sec: float = 0.5,
+        sync_timeout_sec: float = 0.1,
+        evict_interval_sec: float = 60.0,
+    ):
+        self.key_func = key_func
+        self.default_limits = [
+            (limit, *parse_limit(limit)) for limit in default_limits or []
+        ]
+        self.sync = sync
+        self.sync_interval_sec = sync_interval_sec
+        self.sync_timeout_sec = sync_timeout_sec
+        self.evict_interval_sec = evict_interval_sec
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        # Usage not yet published, and (window, own usage, others' usage) published in the
+        # current window, per bucket key
+        self._pending: Dict[str, int] = {}
+        self._windows: Dict[str, Tuple[int, int, int]] = {}
+        self._degraded = False
+        self._sync_task: Optional[asyncio.Task] = None
+        self._evict_at = time.monotonic() + evict_interval_sec
+
+    def hit(self, scope: str, key: str, limit: str, cost: int = 1) -> int:
+        """Takes ``cost`` tokens from the ``limit`` bucket of ``key`` or raises RateLimitExceeded.
+
+        :return: tokens left in the bucket
+        """
+        amount, period_sec = parse_limit(limit)
+        return self._hit(scope, key, limit, amount, period_sec, cost)
+
+    def _hit(
+        self, scope: str, key: str, limit: str, amount: int, period_sec: int, cost: int
+    ) -> int:
+        bucket_key = f"{scope}:{amount}/{period_sec}:{key}"
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            # Buckets only accumulate here, one per new client, so sweeping here bounds them
+            if time.monotonic() >= self._evict_at:
+                self._evict_idle_buckets()
+            bucket = self._buckets[bucket_key] = TokenBucket(amount, period_sec)
+            self._ensure_sync_task()
+
+        if not bucket.consume(cost):
+            raise RateLimitExceeded(limit, bucket.retry_after(cost))
+        if self.sync is not None and cost:
+            self._pending[bucket_key] = self._pending.get(bucket_key, 0) + cost
+        return int(bucket.tokens)
+
+    async def default_limits_dependency(self, request: HTTPConnection) -> None:
+        """App-wide dependency applying the default limits to routes without their own.
+
+        WebSocket routes are charged once per connection.
+        """
+        if not self.default_limits:
+            return
+        if getattr(request.scope.get("endpoint"), "__rate_limited__", False):
+            return
+        route = request.scope.get("route")
+        scope = getattr(route, "path", request.url.path)
+        key = self.key_func(request)
+        for limit, amount, period_sec in self.default_limits:
+            self._hit(scope, key, limit, amount, period_sec, 1)
+
+    def limit(self, limit_value: str, key_func: Optional[Callable[[Request], str]] = None):
+        """Route decorator enforcing ``limit_value`` (e.g. ``"50/minute"``) per client key."""
+        amount, period_sec = parse_limit(limit_value)
+
+        def decorator(func):
+            scope = f"{func.__module__}.{func.__name__}"
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                request = next(
+                    (it for it in (*args, *kwargs.values()) if isinstance(it, Request)),
+                    None,
+                )
+                if request is None:
+                    raise TypeError(f"{scope} needs a `request: Request` argument to be limited")
+                key = (key_func or self.key_func)(request)
+                self._hit(scope, key, limit_value, amount, period_sec, 1)
+                return await func(*args, **kwargs)
+
+            # Routes with their own limits skip the default ones, see default_limits_dependency
+            wrapper.__rate_limited__ = True
+            return wrapper
+
+        return decorator
+
+    def quota(
+        self,
+        budget: str,
+        key_func: Optional[Callable[[Request], str]] = None,
+        scope: Optional[str] = None,
+    ):
+        """Route decorator charging a token ``budget`` (e.g. ``"20000/minute"``) per client key.
+
+        The route is rejected upfront once the budget is spent; otherwise the work it does
+        is charged with ``charge_tokens`` as it goes, so the cost can depend on cache hits.
+        The budget left is returned in X-Token-Budget-* response headers. Routes given the
+        same ``scope`` draw from one budget per client; by default each route has its own.
+        """
+        parse_limit(budget)
+
+        def decorator(func):
+            quota_scope = scope or f"{func.__module__}.{func.__name__}:tokens"
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                request = next(
+                    (it for it in (*args, *kwargs.values()) if isinstance(it, Request)),
+                    None,
+                )
+                if request is None:
+                    raise TypeError(
+                        f"{quota_scope} needs a `request: Request` argument to be limited"
+                    )
+                quota = TokenQuota(self, quota_scope, (key_func or self.key_func)(request), budget)
+                token = start_token_quota(quota)
+                try:
+                    quota.charge(0)
+                    response = await func(*args, **kwargs)
+                except RateLimitExceeded as exc:
+                    exc.headers.update(quota.headers())
+                    raise
+                finally:
+                    stop_token_quota(token)
+                if isinstance(response, Response):
+                    response.headers.update(quota.headers())
+                return response
+
+            wrapper.__rate_limited__ = True
+            return wrapper
+
+        return decorator
+
+    def exempt(self, func):
+        func.__rate_limited__ = True
+        return func
+
+    def _ensure_sync_task(self) -> None:
+        if self.sync is None or self._sync_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._sync_task = loop.create_task(self._sync_loop())
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval_sec)
+            try:
+                await self.sync_once()
+            except Exception:
+                logger.exception("Rate limit synchronization failed")
+
+    async def sync_once(self) -> None:
+        """Publishes pending usage and drains local buckets by the other processes' usage."""
+        pending, self._pending = self._pending, {}
+        now = time.time()
+        windows = {key: int(now // bucket.period_sec) for key, bucket in self._buckets.items()}
+        if not windows:
+            return
+        usage: Dict[str, Tuple[int, int]] = {
+            f"{key}:{window}": (pending.get(key, 0), int(self._buckets[key].period_sec) * 2)
+            for key, window in windows.items()
+        }
+
+        start = time.perf_counter()
+        try:
+            totals = await asyncio.wait_for(
+                self.sync.exchange(usage), timeout=self.sync_timeout_sec
+            )
+        except Exception as e:
+            # Carry the usage over; a timed-out pipeline may still have been applied, which
+            # only makes the other processes slightly stricter
+            for key, cost in pending.items():
+                self._pending[key] = self._pending.get(key, 0) + cost
+            self._set_degraded(True, e)
+            return
+        finally:
+            RATE_LIMIT_SYNC_LATENCY.observe(time.perf_counter() - start)
+        self._set_degraded(False)
+
+        for key, window in windows.items():
+            total = totals[f"{key}:{window}"]
+            seen_window, own, others_seen = self._windows.get(key, (window, 0, 0))
+            if seen_window != window:
+                own = others_seen = 0
+            own += pending.get(key, 0)
+            others = total - own
+            if others > others_seen:
+                self._buckets[key].drain(others - others_seen)
+                others_seen = others
+            self._windows[key] = (window, own, others_seen)
+
+    def _set_degraded(self, degraded: bool, error: Optional[Exception] = None) -> None:
+        if degraded == self._degraded:
+            return
+        self._degraded = degraded
+        RATE_LIMIT_DEGRADED.set(int(degraded))
+        if degraded:
+            logger.warning(
+                f"Rate limit sync unavailable ({error!r}), enforcing limits per process"
+            )
+        else:
+            logger.info("Rate limit sync restored")
+
+    def _evict_idle_buckets(self) -> None:
+        self._evict_at = time.monotonic() + self.evict_interval_sec
+        for key in [k for k, b in self._buckets.items() if b.idle() and k not in self._pending]:
+            del self._buckets[key]
+            self._windows.pop(key, None)
+
+    async def close(self) -> None:
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+        if self.sync is not None:
+            if self._pending:
+                try:
+                    await self.sync_once()
+                except Exception:
+                    logger.exception("Final rate limit synchronization failed")
+            await self.sync.close()
+
+
 def get_limiter() -> Limiter:
     global _limiter
     if _limiter is not None:
         return _limiter
 
-    storage_uri = Redis.get_uri()
+    # Limits are only shared across processes when Redis is the cache backend
+    sync = RedisUsageSync(Redis.get_uri()) if "redis" in cache_tiers() else None
     _limiter = Limiter(
         key_func=get_remote_address,
         default_limits=["5/minute"],
-    strategy="sliding-window-counter",
-        storage_uri=storage_uri,
-        in_memory_fallback_enabled=True,
+        sync=sync,
+        sync_interval_sec=settings.RATE_LIMIT_SYNC_INTERVAL_SEC,
+        sync_timeout_sec=settings.RATE_LIMIT_SYNC_TIMEOUT_SEC,
     )
     return _limiter
 
@@ -34,12 +312,12 @@ def setup_rate_limit(app: FastAPI):
 
     @app.exception_handler(RateLimitExceeded)
     async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
+        RATE_LIMITED_REQUESTS.labels(request.url.path).inc()
         return JSONResponse(
             status_code=429,
             content={
-                "detail": f"Too Many Requests, retry after {getattr(exc, 'retry_after', 60)}",
-                "retry_after": getattr(exc, "retry_after", 60),
+                "detail": f"Too Many Requests, retry after {exc.retry_after}",
+                "retry_after": exc.retry_after,
             },
+            headers={"Retry-After": str(exc.retry_after), **exc.headers},
         )
-
-    app.add_middleware(SlowAPIMiddleware)
@@ -0,0 +1,66 @@
+import math
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional
+
+from application.main.infrastructure.rate_limiter.token_bucket import parse_limit
+
+# Rough characters per subword token, to price texts without tokenizing them twice
+CHARS_PER_TOKEN = 4
+# Flat cost of a text served from the cache
+CACHED_TEXT_COST = 1
+# Flat cost of detecting the language of a text on its own (/translate/detect)
+DETECTED_TEXT_COST = 1
+
+
+def estimate_cost(texts: List[str], num_cached: int = 0) -> int:
+    """Cost in tokens of translating ``texts`` plus serving ``num_cached`` texts from the cache."""
+    return num_cached * CACHED_TEXT_COST + sum(
+        1 + math.ceil(len(text) / CHARS_PER_TOKEN) for text in texts
+    )
+
+
+class TokenQuota:
+    """Token budget of one client for the request being served."""
+
+    def __init__(self, limiter, scope: str, key: str, budget: str):
+        self.limiter = limiter
+        self.scope = scope
+        self.key = key
+        self.budget = budget
+        self.limit, _ = parse_limit(budget)
+        self.remaining: Optional[int] = None
+
+    def charge(self, cost: int) -> None:
+        self.remaining = 0
+        self.remaining = self.limiter.hit(self.scope, self.key, self.budget, cost)
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"X-Token-Budget-Limit": str(self.limit)}
+        if self.remaining is not None:
+            headers["X-Token-Budget-Remaining"] = str(max(0, self.remaining))
+        return headers
+
+
+_quota: ContextVar[Optional[TokenQuota]] = ContextVar("token_quota", default=None)
+
+
+def start_token_quota(quota: TokenQuota) -> Token:
+    return _quota.set(quota)
+
+
+def stop_token_quota(token: Token) -> None:
+    _quota.reset(token)
+
+
+def charge_tokens(texts: List[str], num_cached: int = 0) -> None:
+    """Charges the current request's quota, if any; raises RateLimitExceeded when spent."""
+    quota = _quota.get()
+    if quota is not None:
+        quota.charge(estimate_cost(texts, num_cached))
+
+
+def charge_detection(num_texts: int) -> None:
+    """Charges detecting the language of ``num_texts`` texts to the current request's quota."""
+    quota = _quota.get()
+    if quota is not None:
+        quota.charge(num_texts * DETECTED_TEXT_COST)
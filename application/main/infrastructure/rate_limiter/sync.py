@@ -0,0 +1,36 @@
+from typing import Dict, Tuple
+
+import redis.asyncio as aioredis
+
+
+class RedisUsageSync:
+    """Publishes per-key usage deltas to Redis and reads back the global totals.
+
+    One pipelined round trip per exchange, whatever the number of keys; the caller owns
+    the timeout and decides what to do when Redis is slow or down.
+    """
+
+    def __init__(self, url: str, prefix: str = "ratelimit:", socket_timeout_sec: float = 1.0):
+        self.prefix = prefix
+        self.redis = aioredis.from_url(
+            url,
+            socket_timeout=socket_timeout_sec,
+            socket_connect_timeout=socket_timeout_sec,
+        )
+
+    async def exchange(self, usage: Dict[str, Tuple[int, int]]) -> Dict[str, int]:
+        """Adds ``delta`` to each key (refreshing its ``ttl_sec``) and returns the new totals.
+
+        :param usage: key -> (delta, ttl_sec); a zero delta only reads the current total
+        """
+        keys = list(usage)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                delta, ttl_sec = usage[key]
+                pipe.incrby(self.prefix + key, delta)
+                pipe.expire(self.prefix + key, ttl_sec)
+            results = await pipe.execute()
+        return dict(zip(keys, results[::2]))
+
+    async def close(self) -> None:
+        await self.redis.aclose()
@@ -0,0 +1,67 @@
+import functools
+import math
+import re
+import time
+from typing import Tuple
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_LIMIT_PATTERN = re.compile(r"^\s*(\d+)\s*(?:/|per)\s*(second|minute|hour|day)s?\s*$")
+
+
+@functools.lru_cache(maxsize=None)
+def parse_limit(limit_value: str) -> Tuple[int, int]:
+    """Parses a limit such as ``"50/minute"`` or ``"5 per second"`` into (amount, period_sec)."""
+    match = _LIMIT_PATTERN.match(limit_value.lower())
+    if match is None:
+        raise ValueError(f"Invalid rate limit: {limit_value!r}")
+    return int(match.group(1)), _PERIODS[match.group(2)]
+
+
+class TokenBucket:
+    """A bucket of ``capacity`` tokens refilled continuously over ``period_sec``.
+
+    Not thread-safe: buckets are only touched from the event loop.
+    """
+
+    __slots__ = ("capacity", "period_sec", "rate", "tokens", "updated_at", "used_at")
+
+    def __init__(self, capacity: int, period_sec: float):
+        self.capacity = capacity
+        self.period_sec = period_sec
+        self.rate = capacity / period_sec
+        self.tokens = float(capacity)
+        self.updated_at = self.used_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def consume(self, cost: int = 1) -> bool:
+        now = time.monotonic()
+        self._refill(now)
+        self.used_at = now
+        # A cost above the capacity is admitted on a full bucket and paid back as debt
+        if self.tokens < min(cost, self.capacity):
+            return False
+        self.tokens -= cost
+        return True
+
+    def drain(self, amount: float) -> None:
+        """Removes tokens spent elsewhere (other processes sharing this limit).
+
+        The bucket may go into debt, down to one full period, so that usage admitted
+        elsewhere is paid back instead of being forgotten once the bucket is empty.
+        """
+        self._refill(time.monotonic())
+        self.tokens = max(-self.capacity, self.tokens - amount)
+
+    def retry_after(self, cost: int = 1) -> int:
+        """Seconds until ``cost`` tokens are available again."""
+        missing = min(cost, self.capacity) - self.tokens
+        return max(1, math.ceil(missing / self.rate))
+
+    def idle(self) -> bool:
+        """Full and untouched for a whole period, so it can be dropped without losing state."""
+        now = time.monotonic()
+        self._refill(now)
+        return self.tokens >= self.capacity and now - self.used_at >= self.period_sec
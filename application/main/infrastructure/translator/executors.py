@@ -0,0 +1,116 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Set
+
+import torch
+
+from application.initializer import logger_instance
+from application.main.utility.config_loader import ConfigReaderInstance
+
+logger = logger_instance.get_logger(__name__)
+
+DEFAULT_POOL = "default"
+
+
+def parse_cpus(cpus: Optional[str]) -> Optional[Set[int]]:
+    """Parses a CPU list such as ``"0-3,8"``; None when empty."""
+    if not cpus:
+        return None
+    result: Set[int] = set()
+    for part in str(cpus).split(","):
+        first, _, last = part.strip().partition("-")
+        result.update(range(int(first), int(last or first) + 1))
+    return result
+
+
+class InferencePool:
+    """Worker threads running generate, pinned to the pool's CPUs.
+
+    The affinity is set from each worker thread when it starts, and on Linux it is
+    inherited by the OpenMP threads the worker spawns, so pools given disjoint CPUs run
+    concurrently without oversubscribing the machine. The intra-op thread count is not
+    per pool: torch.set_num_threads leaks across threads, so one count is set for the
+    whole process (see InferencePools) and only checked here.
+    """
+
+    def __init__(self, name: str, workers: int = 1, cpus: Optional[str] = None):
+        self.name = name
+        self.workers = max(1, int(workers or 1))
+        self.cpus = parse_cpus(cpus)
+        self.threads = 0
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix=f"inference-{name}",
+            initializer=self._init_worker,
+        )
+
+    @property
+    def fair_threads(self) -> int:
+        """Intra-op threads per worker that keep the workers within the pool's CPUs."""
+        available = len(self.cpus) if self.cpus else os.cpu_count() or 1
+        return max(1, available // self.workers)
+
+    def _init_worker(self) -> None:
+        if self.cpus and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, self.cpus)
+            except OSError as e:
+                logger.warning(f"Cannot pin inference pool {self.name} to {self.cpus}: {e}")
+        torch.set_num_threads(self.threads)
+        if torch.get_num_threads() != self.threads:
+            logger.warning(
+                f"Inference pool {self.name} runs {torch.get_num_threads()} intra-op threads"
+                f" instead of {self.threads}"
+            )
+
+
+class InferencePools:
+    """Inference pools from ``inference_config.yaml`` and the translators assigned to them.
+
+    ``intra_op_threads`` applies to every worker of every pool; when 0 it is the smallest
+    fair share among the pools, so that no pool oversubscribes its CPUs.
+    """
+
+    def __init__(self, config_filename: str = "inference_config.yaml"):
+        self.config = ConfigReaderInstance.yaml.read_config_from_file(config_filename)
+        if self.config.interop_threads:
+            try:
+                torch.set_num_interop_threads(int(self.config.interop_threads))
+            except RuntimeError as e:
+                # Only possible before the first inter-op parallel work of the process
+                logger.warning(f"Cannot set torch inter-op threads: {e}")
+
+        pools_config = vars(self.config.pools) if self.config.pools else {}
+        for name, conf in pools_config.items():
+            if conf.threads:
+                logger.warning(
+                    f"Inference pool {name}: per-pool threads are ignored, set intra_op_threads"
+                )
+        self.pools: Dict[str, InferencePool] = {
+            name: InferencePool(name, conf.workers, conf.cpus)
+            for name, conf in pools_config.items()
+        }
+        if DEFAULT_POOL not in self.pools:
+            self.pools[DEFAULT_POOL] = InferencePool(DEFAULT_POOL)
+
+        self.intra_op_threads = int(self.config.intra_op_threads or 0) or min(
+            pool.fair_threads for pool in self.pools.values()
+        )
+        torch.set_num_threads(self.intra_op_threads)
+        for pool in self.pools.values():
+            pool.threads = self.intra_op_threads
+        self.assignments: Dict[str, str] = (
+            dict(vars(self.config.models)) if self.config.models else {}
+        )
+        for key, name in self.assignments.items():
+            if name not in self.pools:
+                raise ValueError(f"Translator {key} assigned to unknown inference pool {name}")
+
+        for pool in self.pools.values():
+            logger.info(
+                f"Inference pool {pool.name}: {pool.workers} workers x {pool.threads} threads"
+                + (f" on CPUs {sorted(pool.cpus)}" if pool.cpus else "")
+            )
+
+    def pool_for(self, key: str) -> InferencePool:
+        return self.pools[self.assignments.get(key, DEFAULT_POOL)]
@@ -0,0 +1,60 @@
+import re
+from typing import List, NamedTuple, Optional
+
+# Spans that must come out of translation verbatim, in priority order
+_MASKED_SPANS = re.compile(
+    "|".join(
+        [
+            r"`[^`\n]+`",  # inline code
+            r"(?:https?://|www\.)[^\s<>\"']*[^\s<>\"'.,;:!?)\]]",  # URLs
+            r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+",  # emails
+            r"(?<!\w)[-+]?\d+(?:[.,:/-]\d+)*%?(?!\w)",  # numbers, dates, times, amounts
+        ]
+    )
+)
+PLACEHOLDER = re.compile(r"\{(\d+)\}")
+
+
+class MaskedText(NamedTuple):
+    text: str
+    template: str
+    values: List[str]
+
+
+def mask(text: str) -> MaskedText:
+    """Replaces numbers, URLs, emails and code spans with ``{0}``, ``{1}``... placeholders.
+
+    "Order 12345 shipped" and "Order 67890 shipped" both become "Order {0} shipped", so
+    they share one cache entry and one shorter inference.
+    """
+    # Texts that already contain placeholders are left alone rather than escaped
+    if PLACEHOLDER.search(text):
+        return MaskedText(text, text, [])
+
+    values: List[str] = []
+
+    def replace(match: re.Match) -> str:
+        values.append(match.group(0))
+        return f"{{{len(values) - 1}}}"
+
+    return MaskedText(text, _MASKED_SPANS.sub(replace, text), values)
+
+
+def unmask(translation: str, values: List[str]) -> Optional[str]:
+    """Restores the masked values, or None if the model dropped or duplicated a placeholder."""
+    if not values:
+        return translation
+    found = sorted(int(index) for index in PLACEHOLDER.findall(translation))
+    if found != list(range(len(values))):
+        return None
+    return PLACEHOLDER.sub(lambda match: values[int(match.group(1))], translation)
+
+
+def placeholders_kept(source: str, translation: str) -> bool:
+    """Whether ``translation`` keeps each placeholder of ``source`` exactly once."""
+    return sorted(PLACEHOLDER.findall(translation)) == sorted(PLACEHOLDER.findall(source))
+
+
+def needs_translation(template: str) -> bool:
+    """False for templates made only of placeholders, spaces and punctuation."""
+    return any(char.isalpha() for char in PLACEHOLDER.sub("", template))
@@ -1,21 +1,58 @@
 import asyncio
+import contextlib
+import contextvars
 import csv
-import hashlib
-from typing import Dict, List
+import functools
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncContextManager, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 import torch
+from pytimeparse.timeparse import timeparse
+from transformers import BatchEncoding
 
-from application.initializer import cache_instance, logger_instance
+from application.initializer import get_cache, logger_instance
 from application.main.config import settings
-from application.main.infrastructure.detector import Detector
+from application.main.infrastructure.cache.hot_keys import HotKeyTracker
+from application.main.infrastructure.cache.keys import translation_cache_key
+from application.main.infrastructure.detector import get_detector
+from application.main.infrastructure.rate_limiter import charge_tokens
+from application.main.infrastructure.translator.executors import InferencePools
+from application.main.infrastructure.translator.masking import (
+    MaskedText,
+    mask,
+    needs_translation,
+    placeholders_kept,
+    unmask,
+)
 from application.main.infrastructure.translator.translators import (
+    TIERS,
     TRANSLATOR_FACTORY,
     BaseTranslator,
+    StubTranslator,
+)
+from application.main.utility.deadline import Deadline
+from application.main.utility.metrics import (
+    BATCH_PADDING_RATIO,
+    BATCH_SIZE,
+    CACHE_HOT_KEYS,
+    GENERATED_TOKENS,
+    MASKING_FALLBACKS,
+    MODEL_IDLE,
+    TOKENS_PER_SECOND,
 )
+from application.main.utility.profiler import batch_profiler
+from application.main.utility.timing import record_stage, timed_stage
 
 logger = logger_instance.get_logger(__name__)
-_cache = cache_instance
-detector = Detector()
+
+# Holds an inference slot around inference, given the pair, the number of texts and the
+# deadline; the cache is looked up and the request charged before it is entered
+InferenceSlot = Callable[[str, int, Optional[Deadline]], AsyncContextManager[None]]
+
+
+def _no_inference_slot(pair: str, num_texts: int, deadline: Optional[Deadline]):
+    return contextlib.nullcontext()
 
 
 class UniversalTranslator:
@@ -23,6 +60,8 @@ class UniversalTranslator:
 
     This class manages multiple translation models, acts like Registry Pattern,
     handles model loading, and caches translation results for efficiency.
+    Every pair is served by one model per tier (``en2vi:fast``, ``en2vi:quality``), each
+    with its own cache namespace and metrics labels.
     """
 
     SUPPORTED_LANGUAGES: Dict[str, List[str]] = {
@@ -33,45 +72,141 @@ class UniversalTranslator:
 
     def __init__(self):
         self.translators: Dict[str, BaseTranslator] = {}
+        self._cache = get_cache()
+        self.hot_keys: Optional[HotKeyTracker] = (
+            HotKeyTracker(
+                top_k=settings.HOT_KEYS_TOP_K,
+                min_count=settings.HOT_KEYS_MIN_COUNT,
+                decay_interval_sec=settings.HOT_KEYS_DECAY_SEC,
+            )
+            if settings.HOT_KEYS
+            else None
+        )
+        self.hot_key_ttl = timeparse(settings.HOT_KEY_TTL) if settings.HOT_KEY_TTL else None
+        self.cold_key_ttl = timeparse(settings.COLD_KEY_TTL) if settings.COLD_KEY_TTL else None
+        # Tiers sharing a checkpoint share the loaded model
+        self._models: Dict[Callable[[], BaseTranslator], BaseTranslator] = {}
+        # One thread per model tokenizes and decodes next to generate: tokenizers are
+        # not safe to share between threads
+        self._prep_executors: Dict[BaseTranslator, ThreadPoolExecutor] = {}
+        # generate runs on the inference pool of its model, see inference_config.yaml
+        self._inference_pools = InferencePools()
+        self._inference_executors: Dict[BaseTranslator, Executor] = {}
         self.languages = self.load_lang_dict_from_csv(
             str(settings.APP_CONFIG.RESOURCES_DIR / "languages.csv")
         )
+        self.tiers = [
+            tier.strip() for tier in settings.TRANSLATOR_TIERS.split(",") if tier.strip()
+        ]
+        if not self.tiers or any(tier not in TIERS for tier in self.tiers):
+            raise ValueError(
+                f"Invalid TRANSLATOR_TIERS {settings.TRANSLATOR_TIERS!r}, expected some of {TIERS}"
+            )
+
+        supported_pairs = [
+            f"{src_lang}2{tgt_lang}"
+            for src_lang, tgt_langs in self.SUPPORTED_LANGUAGES.items()
+            for tgt_lang in tgt_langs
+        ]
+        served_pairs = [
+            pair.strip() for pair in settings.SERVED_PAIRS.split(",") if pair.strip()
+        ]
+        unknown_pairs = set(served_pairs) - set(supported_pairs)
+        if unknown_pairs:
+            raise ValueError(
+                f"Invalid SERVED_PAIRS {settings.SERVED_PAIRS!r}: {sorted(unknown_pairs)}"
+                " are not supported"
+            )
+        # Pairs loaded by this node, see SERVED_PAIRS
+        self.pairs = served_pairs or supported_pairs
 
         for src_lang, tgt_langs in self.SUPPORTED_LANGUAGES.items():
             for tgt_lang in tgt_langs:
-                key = self.__key(src_lang, tgt_lang)
-                logger.info(f"Register translator model: {key}")
-                try:
-                    self.__register_translator(src_lang, tgt_lang)
-                except Exception as e:
-                    logger.error(f"Failed to load translator {key}: {e}")
-                    raise
-
-    def __key(self, src_lang: str, tgt_lang: str) -> str:
-        return f"{src_lang}2{tgt_lang}"
-
-    def _make_cache_key(self, src_lang: str, tgt_lang: str, text: str) -> str:
-        prefix = self.__key(src_lang, tgt_lang)
-        return f"{prefix}:{hashlib.md5(text.encode()).hexdigest()}"
-
-    def __register_translator(self, src_lang: str, tgt_lang: str):
-        key = self.__key(src_lang, tgt_lang)
+                if f"{src_lang}2{tgt_lang}" not in self.pairs:
+                    continue
+                for tier in self.tiers:
+                    key = self.__key(src_lang, tgt_lang, tier)
+                    logger.info(f"Register translator model: {key}")
+                    try:
+                        self.__register_translator(src_lang, tgt_lang, tier)
+                    except Exception as e:
+                        logger.error(f"Failed to load translator {key}: {e}")
+                        raise
+
+    def __key(self, src_lang: str, tgt_lang: str, tier: str) -> str:
+        return f"{src_lang}2{tgt_lang}:{tier}"
+
+    def _make_cache_key(self, pair: str, translator: BaseTranslator, text: str) -> str:
+        return translation_cache_key(pair, translator.model_version, text)
+
+    def __register_translator(self, src_lang: str, tgt_lang: str, tier: str):
+        key = self.__key(src_lang, tgt_lang, tier)
         if key not in self.translators:
             factory = TRANSLATOR_FACTORY.get(key)
             if not factory:
                 raise ValueError(f"No translator factory for {key}")
-            self.translators[key] = factory()
+            translator = self._models.get(factory)
+            if translator is None:
+                translator = self._models[factory] = (
+                    StubTranslator() if settings.STUB_MODE else factory()
+                )
+                self._prep_executors[translator] = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"prep-{key}"
+                )
+                self._inference_executors[translator] = (
+                    self._inference_pools.pool_for(key).executor
+                )
+            self.translators[key] = translator
             logger.info(f"Loading translator model: {key} Finished!")
 
-    def __get_translator(self, src_lang: str, tgt_lang: str) -> BaseTranslator:
-        key = self.__key(src_lang, tgt_lang)
+    def __get_translator(self, src_lang: str, tgt_lang: str, tier: str) -> BaseTranslator:
+        key = self.__key(src_lang, tgt_lang, tier)
         translator = self.translators.get(key)
         if translator is None:
             raise ValueError(f"Translator for {key} not loaded")
         return translator
 
+    def resolve_tier(self, tier: Optional[str] = None) -> str:
+        """Returns the loaded tier serving ``tier`` (DEFAULT_TIER when None).
+
+        Raises:
+            ValueError: If the tier does not exist.
+        """
+        tier = tier or settings.DEFAULT_TIER
+        if tier not in TIERS:
+            raise ValueError(f"Unknown tier {tier}, expected one of {', '.join(TIERS)}")
+        return tier if tier in self.tiers else self.tiers[0]
+
+    def check_pair(self, src_lang: str, tgt_lang: str) -> None:
+        """Checks that this node translates ``src_lang`` to ``tgt_lang``.
+
+        Raises:
+            ValueError: If the translation direction is not supported or not served.
+        """
+        if tgt_lang not in self.SUPPORTED_LANGUAGES.get(src_lang, []):
+            # Codes missing from languages.csv are named by themselves
+            src_name = self.languages.get(src_lang, src_lang)
+            tgt_name = self.languages.get(tgt_lang, tgt_lang)
+            logger.error(
+                f"Unsupported translation: {src_name} ({src_lang}) ->  {tgt_name}  ({tgt_lang})"
+            )
+            raise ValueError(
+                f"Translation from {src_name} ({src_lang}) ->  {tgt_name} ({tgt_lang}) is not supported"
+            )
+
+        if f"{src_lang}2{tgt_lang}" not in self.pairs:
+            raise ValueError(
+                f"Translation from {src_lang} to {tgt_lang} is not served by this node"
+            )
+
     async def translate(
-        self, texts: List[str], src_lang: str, tgt_lang: str
+        self,
+        texts: List[str],
+        src_lang: str,
+        tgt_lang: str,
+        deadline: Optional[Deadline] = None,
+        tier: Optional[str] = None,
+        inference_slot: InferenceSlot = _no_inference_slot,
     ) -> List[str]:
         """Translates a list of texts from a source language to a target language.
 
@@ -81,60 +216,315 @@ class UniversalTranslator:
             texts: List of text strings to translate.
             src_lang: Source language code. If empty, language detection is performed.
             tgt_lang: Target language code.
+            deadline: Optional request deadline; uncached texts are dropped instead of
+                translated once it has passed or its client disconnected.
+            tier: Model tier, ``fast`` or ``quality``; DEFAULT_TIER when None. A tier that
+                is not loaded is served by the loaded one.
+            inference_slot: Entered around inference only, so that cache hits never wait
+                for the concurrency limit of the caller.
 
         Returns:
             List[str]: List of translated and formatted text strings.
 
         Raises:
-            ValueError: If the translation direction is not supported or the translator is not loaded.
+            ValueError: If the translation direction or the tier is not supported, or the translator is not loaded.
+            DeadlineExceeded: If the request was abandoned before inference.
         """
         if not src_lang:
-            detected_langs = detector.detect(texts, topk=3)
+            detected_langs = get_detector().detect(texts, topk=3)
             logger.debug(
                 f"src_lang not found, try to detect it: {detected_langs}",
             )
             src_lang = detected_langs[0]["language"]
 
-        if tgt_lang not in self.SUPPORTED_LANGUAGES.get(src_lang, []):
-            logger.error(
-                f"Unsupported translation: {self.languages[src_lang]} ({src_lang}) ->  {self.languages[tgt_lang]}  ({tgt_lang})"
-            )
-            raise ValueError(
-                f"Translation from {self.languages[src_lang]} ({src_lang}) ->  {self.languages[tgt_lang]} ({tgt_lang}) is not supported"
-            )
+        self.check_pair(src_lang, tgt_lang)
 
-        translator = self.__get_translator(src_lang, tgt_lang)
-        cache_key_prefix = self.__key(src_lang, tgt_lang)
-        cached_results: Dict[str, str] = {}
-        texts_to_translate: List[str] = []
+        tier = self.resolve_tier(tier)
+        translator = self.__get_translator(src_lang, tgt_lang, tier)
+        pair = self.__key(src_lang, tgt_lang, tier)
 
-        for text in texts:
-            key = self._make_cache_key(src_lang, tgt_lang, text)
-            if result := _cache.get(key):
-                logger.debug(f"cache hit: {cache_key_prefix}:{text}")
-                cached_results[text] = result.decode("utf-8")
-            else:
-                texts_to_translate.append(text)
+        with timed_stage(pair, "mask"):
+            masked = [
+                mask(text) if settings.PLACEHOLDER_MASKING else MaskedText(text, text, [])
+                for text in texts
+            ]
+        templates = list(dict.fromkeys(it.template for it in masked))
+        translations = await self._translate_cached(
+            pair, translator, templates, deadline, inference_slot
+        )
 
-        if texts_to_translate:
-            logger.debug(
-                f"translating {len(texts_to_translate)} texts with {cache_key_prefix}"
-            )
-            translations = await asyncio.to_thread(
-                translator.translate, texts_to_translate
+        results: Dict[str, str] = {}
+        for it in masked:
+            restored = unmask(translations[it.template], it.values)
+            if restored is not None:
+                results[it.text] = restored
+        fallback = list(dict.fromkeys(it.text for it in masked if it.text not in results))
+        if fallback:
+            # The model mangled some placeholders: translate those texts as they are
+            logger.debug(f"{len(fallback)} texts lost placeholders with {pair}")
+            MASKING_FALLBACKS.labels(pair).inc(len(fallback))
+            # Charged with the templates already
+            results.update(
+                await self._translate_cached(
+                    pair, translator, fallback, deadline, inference_slot, charge=False
+                )
             )
 
-            for text, translated in zip(texts_to_translate, translations):
-                key = self._make_cache_key(src_lang, tgt_lang, text)
-                cached_results[text] = translated
-                _cache.set(key, translated)
+        with timed_stage(pair, "postprocess"):
+            return [
+                self.improve_translation_formatting(
+                    text, results[text], improve_punctuation=True
+                )
+                for text in texts
+            ]
 
-        return [
-            self.improve_translation_formatting(
-                text, cached_results[text], improve_punctuation=True
-            )
+    async def _translate_cached(
+        self,
+        pair: str,
+        translator: BaseTranslator,
+        texts: List[str],
+        deadline: Optional[Deadline] = None,
+        inference_slot: InferenceSlot = _no_inference_slot,
+        charge: bool = True,
+    ) -> Dict[str, str]:
+        """Translates unique texts through the cache, running inference on the misses only.
+
+        Entries are namespaced by ``pair`` including its tier, and by the model version,
+        since different models translate differently. The misses are charged to the
+        request's token budget before an inference slot is taken. Translations that lost
+        placeholders of their text are neither cached nor served from the cache.
+        """
+        cache_key_prefix = pair
+        # Nothing to translate in templates made of placeholders and punctuation only
+        cached_results: Dict[str, str] = {
+            text: text
             for text in texts
-        ]
+            if settings.PLACEHOLDER_MASKING and not needs_translation(text)
+        }
+        texts = [text for text in texts if text not in cached_results]
+        texts_to_translate: List[str] = []
+
+        with timed_stage(cache_key_prefix, "cache"):
+            keys = [self._make_cache_key(pair, translator, text) for text in texts]
+            self._track_hot_keys(keys, texts)
+            for key, text, result in zip(keys, texts, self._cache.get_many(keys)):
+                if result is not None:
+                    result = result.decode("utf-8") if isinstance(result, bytes) else str(result)
+                    if not placeholders_kept(text, result):
+                        # Written before translations were checked: translate it again
+                        self._cache.delete(key)
+                        result = None
+                if result is None:
+                    texts_to_translate.append(text)
+                else:
+                    logger.debug(f"cache hit: {cache_key_prefix}:{text}")
+                    cached_results[text] = result
+        if charge:
+            # Priced after the cache lookup so that cached texts stay cheap
+            charge_tokens(
+                texts_to_translate, num_cached=len(texts) - len(texts_to_translate)
+            )
+
+        chunks = self._chunk(translator, texts_to_translate)
+        if not chunks:
+            return cached_results
+        logger.debug(
+            f"translating {len(texts_to_translate)} texts with {cache_key_prefix}"
+            f" in {len(chunks)} chunks"
+        )
+        async with inference_slot(pair, len(texts_to_translate), deadline):
+            async for chunk, translations in self._run_chunks(
+                cache_key_prefix, translator, chunks, deadline
+            ):
+                with timed_stage(cache_key_prefix, "cache_write"):
+                    new_results = dict(zip(chunk, translations))
+                    cached_results.update(new_results)
+                    self._cache_write(
+                        {
+                            self._make_cache_key(pair, translator, text): translated
+                            for text, translated in new_results.items()
+                            # Served this time through the fallback, but never cached
+                            if placeholders_kept(text, translated)
+                        }
+                    )
+
+        return cached_results
+
+    def _track_hot_keys(self, keys: List[str], texts: List[str]) -> None:
+        """Counts lookups; pins the keys that became hot, unpins those that cooled down."""
+        if self.hot_keys is None or not keys:
+            return
+        # Texts are kept only to be listed by /admin/hot-keys, and only if allowed
+        promoted, demoted = self.hot_keys.record(
+            keys, texts if settings.HOT_KEYS_EXPOSE_TEXTS else None
+        )
+        if promoted:
+            logger.debug(f"{len(promoted)} cache keys became hot")
+            self._cache.pin(promoted, self.hot_key_ttl)
+        if demoted:
+            self._cache.unpin(demoted)
+        if promoted or demoted:
+            CACHE_HOT_KEYS.set(self.hot_keys.num_hot)
+
+    def _cache_write(self, items: Dict[str, str]) -> None:
+        """Writes translations, hot ones with HOT_KEY_TTL, the others with COLD_KEY_TTL if set."""
+        if self.hot_keys is None:
+            self._cache.set_many(items)
+            return
+        hot = {key: value for key, value in items.items() if self.hot_keys.is_hot(key)}
+        cold = {key: value for key, value in items.items() if key not in hot}
+        if hot:
+            self._cache.set_many(hot, self.hot_key_ttl)
+        if cold:
+            self._cache.set_many(cold, self.cold_key_ttl)
+
+    def _chunk(self, translator: BaseTranslator, texts: List[str]) -> List[List[str]]:
+        """Splits texts into length-sorted chunks that fit the MAX_BATCH_TOKENS budget.
+
+        A chunk costs its size x beams x (longest input + expected output) tokens, which
+        is what the padded inputs and the beam search state grow with, so peak memory
+        stays bounded whatever the request size. Sorting by length keeps padding low.
+        """
+        budget = settings.MAX_BATCH_TOKENS
+        per_row = translator._num_beams * (1 + translator._output_length_ratio)
+        chunks: List[List[str]] = []
+        chunk: List[str] = []
+        longest = 0
+        # Longest first, so the first text of a chunk sets its padded width
+        for text in sorted(texts, key=translator.estimate_tokens, reverse=True):
+            if chunk and (len(chunk) + 1) * per_row * longest > budget:
+                chunks.append(chunk)
+                chunk = []
+            if not chunk:
+                longest = translator.estimate_tokens(text)
+            chunk.append(text)
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    async def _run_chunks(
+        self,
+        pair: str,
+        translator: BaseTranslator,
+        chunks: List[List[str]],
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[Tuple[List[str], List[str]]]:
+        """Translates chunks one after the other, yielding (chunk, translations) in order.
+
+        Chunks are tokenized and decoded on the translator's preprocessing thread, as its
+        tokenizer must not be shared between the workers of the inference pool, which only
+        generate. With PIPELINED_INFERENCE the next chunk is tokenized, and the previous one
+        decoded, while the current one generates, so the model does not wait on the
+        tokenizer. The gaps between two generate calls are
+        recorded as model idle time in both modes.
+        """
+        if not chunks:
+            return
+        remaining = sum(len(chunk) for chunk in chunks)
+        prep_executor = self._prep_executors[translator]
+        inference_executor = self._inference_executors[translator]
+        last_generate_end: Optional[float] = None
+
+        def record_idle(generate_start: float, generate_end: float) -> None:
+            nonlocal last_generate_end
+            if last_generate_end is not None:
+                MODEL_IDLE.labels(pair).observe(generate_start - last_generate_end)
+            last_generate_end = generate_end
+
+        if not settings.PIPELINED_INFERENCE:
+            for chunk in chunks:
+                # Checked before every chunk, so an abandoned request stops mid-way
+                if deadline is not None:
+                    await deadline.check(dropped=remaining)
+                batch = await self._run_in(prep_executor, self._tokenize, pair, translator, chunk)
+                generated_ids, generate_start, generate_end = await self._run_in(
+                    inference_executor, self._generate, pair, translator, batch
+                )
+                record_idle(generate_start, generate_end)
+                remaining -= len(chunk)
+                translations = await self._run_in(
+                    prep_executor, self._decode, pair, translator, generated_ids
+                )
+                yield chunk, translations
+            return
+
+        next_batch = self._run_in(prep_executor, self._tokenize, pair, translator, chunks[0])
+        decoding: Optional[Tuple[List[str], asyncio.Future]] = None
+        try:
+            for i, chunk in enumerate(chunks):
+                if deadline is not None:
+                    await deadline.check(dropped=remaining)
+                batch = await next_batch
+                if i + 1 < len(chunks):
+                    next_batch = self._run_in(
+                        prep_executor, self._tokenize, pair, translator, chunks[i + 1]
+                    )
+                generated_ids, generate_start, generate_end = await self._run_in(
+                    inference_executor, self._generate, pair, translator, batch
+                )
+                record_idle(generate_start, generate_end)
+                remaining -= len(chunk)
+
+                if decoding is not None:
+                    yield decoding[0], await decoding[1]
+                decoding = (
+                    chunk,
+                    self._run_in(prep_executor, self._decode, pair, translator, generated_ids),
+                )
+            if decoding is not None:
+                yield decoding[0], await decoding[1]
+                decoding = None
+        finally:
+            # Abandoned half-way: nobody will await what is still queued
+            for future in (next_batch, decoding[1] if decoding else None):
+                if future is not None and not future.done():
+                    future.cancel()
+
+    @staticmethod
+    def _run_in(executor: Optional[Executor], func, *args) -> asyncio.Future:
+        """Runs ``func`` on ``executor`` in the current context, so that timing spans
+        recorded by the worker thread reach the request."""
+        context = contextvars.copy_context()
+        return asyncio.get_running_loop().run_in_executor(
+            executor, functools.partial(context.run, func, *args)
+        )
+
+    @staticmethod
+    def _tokenize(pair: str, translator: BaseTranslator, texts: List[str]) -> BatchEncoding:
+        with timed_stage(pair, "tokenize"):
+            batch = translator.tokenize(texts)
+
+        attention_mask = batch["attention_mask"]
+        BATCH_SIZE.labels(pair).observe(len(texts))
+        BATCH_PADDING_RATIO.labels(pair).observe(
+            1 - attention_mask.sum().item() / max(attention_mask.numel(), 1)
+        )
+        return batch
+
+    @staticmethod
+    def _generate(
+        pair: str, translator: BaseTranslator, batch: BatchEncoding
+    ) -> Tuple[torch.Tensor, float, float]:
+        """Runs generate on a worker thread, recording throughput metrics.
+
+        Returns the generated ids and the start and end of the call.
+        """
+        with batch_profiler.profile(pair):
+            start_time = time.perf_counter()
+            generated_ids = translator.generate(batch)
+            end_time = time.perf_counter()
+        record_stage(pair, "generate", end_time - start_time)
+
+        num_tokens = (generated_ids != translator.tokenizer.pad_token_id).sum().item()
+        GENERATED_TOKENS.labels(pair).inc(num_tokens)
+        if end_time > start_time:
+            TOKENS_PER_SECOND.labels(pair).observe(num_tokens / (end_time - start_time))
+        return generated_ids, start_time, end_time
+
+    @staticmethod
+    def _decode(pair: str, translator: BaseTranslator, generated_ids: torch.Tensor) -> List[str]:
+        with timed_stage(pair, "decode"):
+            return translator.decode(generated_ids)
 
     def improve_translation_formatting(
         self,
@@ -1,18 +1,43 @@
-from typing import Callable, Dict
+from typing import Callable, Dict, Tuple
 
 from application.main.infrastructure.translator.translators.base import BaseTranslator
-from application.main.infrastructure.translator.translators.en_fr import EnFrTranslator
-from application.main.infrastructure.translator.translators.en_vi import EnViTranslator
-from application.main.infrastructure.translator.translators.fr_en import FrEnTranslator
+from application.main.infrastructure.translator.translators.en_fr import (
+    EnFrQualityTranslator,
+    EnFrTranslator,
+)
+from application.main.infrastructure.translator.translators.en_vi import (
+    EnViFastTranslator,
+    EnViTranslator,
+)
+from application.main.infrastructure.translator.translators.fr_en import (
+    FrEnQualityTranslator,
+    FrEnTranslator,
+)
 from application.main.infrastructure.translator.translators.fr_vi import FrViTranslator
-from application.main.infrastructure.translator.translators.vi_en import ViEnTranslator
+from application.main.infrastructure.translator.translators.stub import StubTranslator
+from application.main.infrastructure.translator.translators.vi_en import (
+    ViEnFastTranslator,
+    ViEnTranslator,
+)
 from application.main.infrastructure.translator.translators.vi_fr import ViFrTranslator
 
+FAST_TIER = "fast"
+QUALITY_TIER = "quality"
+TIERS: Tuple[str, ...] = (FAST_TIER, QUALITY_TIER)
+
+# Keyed by "<pair>:<tier>"; pairs without a smaller or larger checkpoint serve both tiers
+# with the same model, which is then loaded once
 TRANSLATOR_FACTORY: Dict[str, Callable[[], BaseTranslator]] = {
-    "vi2fr": ViFrTranslator,
-    "vi2en": ViEnTranslator,
-    "en2fr": EnFrTranslator,
-    "en2vi": EnViTranslator,
-    "fr2en": FrEnTranslator,
-    "fr2vi": FrViTranslator,
+    "vi2fr:fast": ViFrTranslator,
+    "vi2fr:quality": ViFrTranslator,
+    "vi2en:fast": ViEnFastTranslator,
+    "vi2en:quality": ViEnTranslator,
+    "en2fr:fast": EnFrTranslator,
+    "en2fr:quality": EnFrQualityTranslator,
+    "en2vi:fast": EnViFastTranslator,
+    "en2vi:quality": EnViTranslator,
+    "fr2en:fast": FrEnTranslator,
+    "fr2en:quality": FrEnQualityTranslator,
+    "fr2vi:fast": FrViTranslator,
+    "fr2vi:quality": FrViTranslator,
 }
@@ -1,10 +1,11 @@
-from abc import ABC, abstractmethod
+from abc import ABC
 from typing import List
 
 import torch
 from transformers import (
     AutoModelForSeq2SeqLM,
     AutoTokenizer,
+    BatchEncoding,
     MarianMTModel,
     MarianTokenizer,
 )
@@ -26,6 +27,13 @@ class BaseTranslator(ABC):
 
     model_name: str = ""
     model_type: str = "" 
+    # Bump when the weights behind model_name change, so that cached translations of the
+    # previous weights are not served (see model_version)
+    model_revision: str = ""
+
+    # Prepended to every input / removed from every output (e.g. "en: " for envit5)
+    _input_prefix: str = ""
+    _output_prefix: str = ""
 
     _device = torch.device(
         "cuda"
@@ -43,6 +51,10 @@ class BaseTranslator(ABC):
     _max_length = 512 
     _num_beams = 4  
     _stop_early = True
+    # Expected output tokens per input token, and a rough input token size in characters,
+    # used to size batches before tokenizing them
+    _output_length_ratio = 1.5
+    _chars_per_token = 4
 
     def __init__(self):
         """Initialize the translator, validating model configuration."""
@@ -53,6 +65,16 @@ class BaseTranslator(ABC):
                 f"Invalid model_type: {self.model_type}. Supported types: {list(self._MODEL_FACTORY.keys())}"
             )
 
+    @classmethod
+    def checkpoint_version(cls) -> str:
+        """Checkpoint (and revision) identifier, without loading the translator."""
+        return f"{cls.model_name}@{cls.model_revision}" if cls.model_revision else cls.model_name
+
+    @property
+    def model_version(self) -> str:
+        """Checkpoint (and revision) identifier, part of the keys of cached translations."""
+        return self.checkpoint_version()
+
     def device(self) -> str:
         """Returns the device on which the model is loaded.
 
@@ -138,7 +160,60 @@ class BaseTranslator(ABC):
         self.model.to(self._device)
         self.model.load_state_dict(state_dict)
 
-    @abstractmethod
+    def estimate_tokens(self, text: str) -> int:
+        """Cheap estimate of the number of input tokens of ``text``, without tokenizing it."""
+        num_tokens = len(self._input_prefix + text) // self._chars_per_token + 2
+        return min(num_tokens, self._max_length)
+
+    def tokenize(self, texts: List[str]) -> BatchEncoding:
+        """Tokenizes a batch of texts into padded model inputs on the model device.
+
+        Args:
+            texts: List of input texts to translate.
+
+        Returns:
+            BatchEncoding holding ``input_ids`` and ``attention_mask``.
+        """
+        if self._input_prefix:
+            texts = [f"{self._input_prefix}{text}" for text in texts]
+        return self.tokenizer(
+            texts,
+            return_tensors=self._return_tensor,
+            padding=self._padding,
+            truncation=self._truncation,
+            max_length=self._max_length,
+        ).to(self._device)
+
+    def generate(self, batch: BatchEncoding) -> torch.Tensor:
+        """Runs beam search over a tokenized batch.
+
+        Args:
+            batch: Model inputs returned by ``tokenize``.
+
+        Returns:
+            Tensor of generated token ids, padded with the tokenizer's pad token.
+        """
+        return self.model.generate(
+            **batch,
+            max_length=self._max_length,
+            num_beams=self._num_beams,
+            early_stopping=self._stop_early,
+        )
+
+    def decode(self, generated_ids: torch.Tensor) -> List[str]:
+        """Decodes generated token ids into texts.
+
+        Args:
+            generated_ids: Output of ``generate``.
+
+        Returns:
+            List of translated texts.
+        """
+        outputs = self.tokenizer.batch_decode(generated_ids, skip_special_tokens=True)
+        if self._output_prefix:
+            return [it.replace(self._output_prefix, "") for it in outputs]
+        return list(outputs)
+
     def translate(self, texts: List[str]) -> List[str]:
         """Translates a list of texts to the target language.
 
@@ -148,4 +223,4 @@ class BaseTranslator(ABC):
         Returns:
             List of translated texts.
         """
-        raise NotImplementedError
+        return self.decode(self.generate(self.tokenize(texts)))
@@ -0,0 +1,71 @@
+import threading
+import time
+from typing import Dict, List
+
+import torch
+from transformers import BatchEncoding
+
+from application.main.config import settings
+from application.main.infrastructure.translator.translators.base import BaseTranslator
+
+
+class StubTokenizer:
+    """Whitespace tokenizer with a growing vocabulary, mimicking the HF tokenizer API we use."""
+
+    pad_token_id = 0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._word_to_id: Dict[str, int] = {}
+        self._id_to_word: List[str] = [""]
+
+    def _encode(self, text: str) -> List[int]:
+        ids = []
+        with self._lock:
+            for word in text.split():
+                if word not in self._word_to_id:
+                    self._word_to_id[word] = len(self._id_to_word)
+                    self._id_to_word.append(word)
+                ids.append(self._word_to_id[word])
+        return ids
+
+    def __call__(self, texts: List[str], max_length: int = 512, **kwargs) -> BatchEncoding:
+        encoded = [self._encode(text)[:max_length] or [self.pad_token_id] for text in texts]
+        width = max(len(ids) for ids in encoded)
+        input_ids = torch.full((len(encoded), width), self.pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(encoded), width), dtype=torch.long)
+        for row, ids in enumerate(encoded):
+            input_ids[row, : len(ids)] = torch.tensor(ids)
+            attention_mask[row, : len(ids)] = 1
+        return BatchEncoding({"input_ids": input_ids, "attention_mask": attention_mask})
+
+    def batch_decode(self, generated_ids: torch.Tensor, **kwargs) -> List[str]:
+        return [
+            " ".join(self._id_to_word[i] for i in row if i != self.pad_token_id)
+            for row in generated_ids.tolist()
+        ]
+
+
+class StubTranslator(BaseTranslator):
+    """Deterministic stand-in translator for measuring serving overhead without models.
+
+    "Translates" every text to itself (whitespace-normalised) after sleeping
+    ``STUB_LATENCY_MS`` plus ``STUB_LATENCY_PER_TOKEN_MS`` per input token, which keeps the
+    worker thread busy the way ``generate`` does while releasing the GIL.
+    """
+
+    model_name = "stub"
+    _device = torch.device("cpu")
+
+    def __init__(self):
+        # No model to validate or load: BaseTranslator.__init__ is deliberately skipped
+        self.tokenizer = StubTokenizer()
+
+    def generate(self, batch: BatchEncoding) -> torch.Tensor:
+        num_tokens = int(batch["attention_mask"].sum().item())
+        latency_ms = (
+            settings.STUB_LATENCY_MS + settings.STUB_LATENCY_PER_TOKEN_MS * num_tokens
+        )
+        if latency_ms > 0:
+            time.sleep(latency_ms / 1000)
+        return batch["input_ids"]
@@ -4,27 +4,21 @@ from application.main.infrastructure.translator.translators.base import BaseTran
 class ViEnTranslator(BaseTranslator):
     model_name = "VietAI/envit5-translation"
     model_type = "AutoModelForSeq2SeqLM"
+    _input_prefix = "vi: "
+    _output_prefix = "en: "
 
     def __init__(self):
         super().__init__()
         self.load_model()
 
-    def translate(self, texts):
-        prefixed = [f"vi: {text}" for text in texts]
-        inputs = self.tokenizer(
-            prefixed,
-            return_tensors=self._return_tensor,
-            padding=self._padding,
-            truncation=self._truncation,
-            max_length=self._max_length,
-        ).to(self._device)
-        outputs = self.model.generate(
-            inputs.input_ids,
-            max_length=self._max_length,
-            num_beams=self._num_beams,
-            early_stopping=self._stop_early,
-        )
-        return [
-            it.replace("en: ", "")
-            for it in self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
-        ]
+
+class ViEnFastTranslator(BaseTranslator):
+    """Smaller Marian checkpoint with greedy decoding, for the latency-bound tier."""
+
+    model_name = "Helsinki-NLP/opus-mt-vi-en"
+    model_type = "MarianMTModel"
+    _num_beams = 1
+
+    def __init__(self):
+        super().__init__()
+        self.load_model()
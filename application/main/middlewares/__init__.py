@@ -1 +1,3 @@
-from application.main.middlewares.logging import LoggingMiddleware
\ No newline at end of file
+from application.main.middlewares.compression import CompressionMiddleware
+from application.main.middlewares.logging import LoggingMiddleware
+from application.main.middlewares.server_timing import ServerTimingMiddleware
@@ -0,0 +1,90 @@
+import asyncio
+import gzip
+from typing import Optional, Sequence
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from application.main.config import settings
+from application.main.middlewares.middleware_interface import IMiddleware
+from application.main.utility.encoding import negotiate
+
+# Levels suited to dynamic content: brotli's default (11) costs far more than it saves
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+# Bodies this large are compressed on a worker thread rather than the event loop
+OFFLOAD_SIZE = 256 * 1024
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+class CompressionMiddleware(IMiddleware):
+    """Compresses response bodies of at least ``minimum_size`` bytes with brotli or gzip.
+
+    The encoding is negotiated from Accept-Encoding among ``encodings``, in that order of
+    preference. Only single-message bodies are compressed; streamed responses and bodies
+    that already have a Content-Encoding are passed through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: Optional[int] = None,
+        encodings: Optional[Sequence[str]] = None,
+    ):
+        self.app = app
+        self.minimum_size = (
+            settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+        )
+        if encodings is None:
+            encodings = settings.COMPRESSION_ENCODINGS.split(",")
+        self.encodings = [it.strip() for it in encodings if it.strip() in ("br", "gzip")]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+
+        async def send_compressed(message: Message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            headers = MutableHeaders(scope=start)
+            body = message.get("body", b"")
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+            ):
+                await send(start)
+                await send(message)
+                return
+
+            if len(body) >= OFFLOAD_SIZE:
+                body = await asyncio.to_thread(compress, body, encoding)
+            else:
+                body = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
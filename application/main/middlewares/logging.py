@@ -1,55 +1,90 @@
-import json
+import logging
+import random
 import time
+from typing import List, Optional
 
-from fastapi import Request, Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from application.initializer import logger_instance
+from application.main.config import settings
 from application.main.middlewares.middleware_interface import IMiddleware
 
 logger = logger_instance.get_logger(__name__)
 
+_REDACTED_HEADERS = {b"authorization", b"cookie", b"x-admin-token"}
 
-class LoggingMiddleware(IMiddleware):
-    def __init__(self, app: ASGIApp):
-        self.app = app
-
-    async def dispatch_func(self, request: Request, call_next):
-        start_time = time.time()
-
-        # Read body safely
-        body_bytes = await request.body()
-        request_body = self._parse_body(body_bytes)
 
-        # Rebuild request stream (because it can be read only once)
-        async def receive():
-            return {"type": "http.request", "body": body_bytes, "more_body": False}
+class LoggingMiddleware(IMiddleware):
+    """Logs one debug record per HTTP request without touching the body stream.
 
-        request._receive = receive
+    Nothing is collected unless debug logging is enabled. The request body and headers are
+    only captured for a ``sample_rate`` share of requests, and the body is capped at
+    ``max_body_bytes``; chunks are passed downstream as-is.
+    """
 
-        # Process request
-        response: Response = await call_next(request)
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: Optional[float] = None,
+        max_body_bytes: Optional[int] = None,
+    ):
+        self.app = app
+        self.sample_rate = (
+            settings.LOG_BODY_SAMPLE_RATE if sample_rate is None else sample_rate
+        )
+        self.max_body_bytes = (
+            settings.LOG_BODY_MAX_BYTES if max_body_bytes is None else max_body_bytes
+        )
 
-        process_time = (time.time() - start_time) * 1000  # in ms
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.DEBUG):
+            await self.app(scope, receive, send)
+            return
 
-        log_data = {
-            "method": request.method,
-            "url": str(request.url),
-            "path": request.url.path,
-            "query_params": dict(request.query_params),
-            "headers": dict(request.headers),
-            "body": request_body,
-            "status_code": response.status_code,
-            "process_time_ms": round(process_time, 2),
-        }
+        start_time = time.perf_counter()
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        body_chunks: List[bytes] = []
+        body_size = 0
+        status_code = 500
 
-        logger.debug("HTTP request log", extra=log_data)
+        async def receive_and_capture() -> Message:
+            nonlocal body_size
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                room = self.max_body_bytes - body_size
+                if room > 0 and chunk:
+                    body_chunks.append(chunk if len(chunk) <= room else chunk[:room])
+                body_size += len(chunk)
+            return message
 
-        return response
+        async def send_and_capture(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-    def _parse_body(self, body_bytes: bytes):
         try:
-            body_str = body_bytes.decode("utf-8")
-            return json.loads(body_str)
-        except Exception:
-            return body_bytes.decode("utf-8", errors="ignore")
+            await self.app(
+                scope, receive_and_capture if sampled else receive, send_and_capture
+            )
+        finally:
+            log_data = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "query_string": scope["query_string"].decode("latin-1"),
+                "status_code": status_code,
+                "process_time_ms": round((time.perf_counter() - start_time) * 1000, 2),
+            }
+            if sampled:
+                log_data["headers"] = {
+                    name.decode("latin-1"): "<redacted>"
+                    if name in _REDACTED_HEADERS
+                    else value.decode("latin-1")
+                    for name, value in scope["headers"]
+                }
+                log_data["body"] = b"".join(body_chunks).decode("utf-8", errors="replace")
+                log_data["body_size"] = body_size
+                log_data["body_truncated"] = body_size > self.max_body_bytes
+
+            logger.debug("HTTP request log", extra=log_data)
@@ -1,15 +1,15 @@
 from abc import ABC, abstractmethod
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class IMiddleware(BaseHTTPMiddleware, ABC):
+class IMiddleware(ABC):
+    """Pure ASGI middleware: unlike BaseHTTPMiddleware it adds no task or body buffering."""
+
     @abstractmethod
     def __init__(self, app: ASGIApp):
         raise NotImplementedError
 
     @abstractmethod
-    async def dispatch_func(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         raise NotImplementedError
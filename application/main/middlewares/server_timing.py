@@ -0,0 +1,39 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from application.main.middlewares.middleware_interface import IMiddleware
+from application.main.utility.timing import (
+    record_span,
+    server_timing_header,
+    start_request_timing,
+    stop_request_timing,
+)
+
+
+class ServerTimingMiddleware(IMiddleware):
+    """Collects per-request stage spans and returns them in a Server-Timing header."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        token = start_request_timing()
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                record_span("total", time.perf_counter() - start_time)
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", server_timing_header())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            stop_request_timing(token)
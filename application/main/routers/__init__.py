@@ -1,2 +1,5 @@
+from application.main.routers.admin import router as router_admin
 from application.main.routers.health_check import router as router_health_check
+from application.main.routers.metrics import router as router_metrics
 from application.main.routers.translate import router as router_translator
+from application.main.routers.translate_stream import router as router_translator_stream
@@ -0,0 +1,53 @@
+import hmac
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, Query
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRouter
+
+from application.initializer import logger_instance
+from application.main.config import settings
+from application.main.services import get_translation_service
+from application.main.utility.profiler import batch_profiler
+
+
+def verify_admin_token(x_admin_token: Optional[str] = Header(default=None)):
+    # Fails closed: without ADMIN_TOKEN the admin endpoints are disabled
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled")
+    if not hmac.compare_digest(x_admin_token or "", settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(verify_admin_token)])
+logger = logger_instance.get_logger(__name__)
+
+
+@router.post("/profile")
+async def start_profile(batches: int = Query(default=1, ge=1, le=100)):
+    """Captures a torch.profiler trace of the next `batches` inference batches into logs/."""
+    logger.info("Profiler capture requested", extra={"batches": batches})
+    return JSONResponse(content=batch_profiler.arm(batches), status_code=202)
+
+
+@router.get("/profile")
+async def profile_status():
+    return JSONResponse(content=batch_profiler.status(), status_code=200)
+
+
+@router.get("/hot-keys")
+async def hot_keys(limit: int = Query(default=20, ge=1, le=1000)):
+    """Most looked-up cache keys with their estimated lookup counts; hot ones are pinned."""
+    translator = get_translation_service().translator
+    if translator.hot_keys is None:
+        return JSONResponse(content={"enabled": False, "keys": []}, status_code=200)
+    return JSONResponse(
+        content={
+            "enabled": True,
+            "min_count": translator.hot_keys.min_count,
+            "hot_key_ttl": translator.hot_key_ttl,
+            "cold_key_ttl": translator.cold_key_ttl,
+            "keys": translator.hot_keys.top(limit),
+        },
+        status_code=200,
+    )
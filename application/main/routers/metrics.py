@@ -0,0 +1,14 @@
+from fastapi import Request, Response
+from fastapi.routing import APIRouter
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from application.initializer import limiter_instance
+
+router = APIRouter()
+limiter = limiter_instance
+
+
+@router.get("/metrics", include_in_schema=False)
+@limiter.exempt
+async def metrics(request: Request):
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -1,53 +1,144 @@
-from typing import List, Optional
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Literal, Optional, Tuple
 
-from fastapi.responses import JSONResponse
 from fastapi.routing import APIRouter
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
+from starlette.requests import HTTPConnection
 from starlette.requests import Request as StarletteRequest
 
 from application.initializer import limiter_instance, logger_instance
-from application.main.services import DetectorService, TranslationService
+from application.main.config import settings
+from application.main.infrastructure.audit import get_audit_sink
+from application.main.infrastructure.rate_limiter.quota import charge_detection, estimate_cost
+from application.main.services import get_detector_service, get_translation_service
+from application.main.utility.deadline import Deadline, DeadlineExceeded
+from application.main.utility.encoding import EncodedRoute, encoded_response
+from application.main.utility.timing import UNKNOWN_PAIR, record_stage
 
 
 class TranslationRequest(BaseModel):
     texts: List[str]
     src_lang: Optional[str] = None
     tgt_lang: str
+    # Seconds the client is willing to wait, overrides the X-Request-Timeout header
+    timeout: Optional[float] = None
+    # Model tier (DEFAULT_TIER when omitted); quality requests may be served by the fast
+    # tier under load unless allow_fallback is false
+    tier: Optional[Literal["fast", "quality"]] = None
+    allow_fallback: bool = True
 
 
-translation_service = TranslationService()
-language_detector_service = DetectorService()
-router = APIRouter(prefix="/translate")
+class BatchTranslationItem(BaseModel):
+    text: str
+    src_lang: Optional[str] = None
+    # One target, or several to localize the same text into each of them
+    tgt_lang: Optional[str] = None
+    tgt_langs: Optional[List[str]] = None
+
+    @model_validator(mode="after")
+    def check_targets(self):
+        if not self.tgt_lang and not self.tgt_langs:
+            raise ValueError("tgt_lang or tgt_langs is required")
+        return self
+
+    def targets(self) -> List[str]:
+        targets = [self.tgt_lang] if self.tgt_lang else []
+        return list(dict.fromkeys(targets + (self.tgt_langs or [])))
+
+
+class BatchTranslationRequest(BaseModel):
+    items: List[BatchTranslationItem]
+    timeout: Optional[float] = None
+    tier: Optional[Literal["fast", "quality"]] = None
+    allow_fallback: bool = True
+
+
+class DetectionRequest(BaseModel):
+    texts: List[str]
+    timeout: Optional[float] = None
+
+
+# Bodies may be JSON or msgpack, responses follow the Accept header
+router = APIRouter(prefix="/translate", route_class=EncodedRoute)
 limiter = limiter_instance
 logger = logger_instance.get_logger(__name__)
 
+# Token budget shared by every translation entry point, so that switching endpoints (or
+# opening a stream) does not give a client another TOKEN_BUDGET
+QUOTA_SCOPE = "translate:tokens"
+
+
+def request_timeout(connection: HTTPConnection, timeout: Optional[float] = None) -> float:
+    """Timeout from the body field, the X-Request-Timeout header or the server default."""
+    if timeout is None:
+        try:
+            timeout = float(connection.headers["X-Request-Timeout"])
+        except (KeyError, ValueError):
+            timeout = settings.REQUEST_TIMEOUT_SEC
+    return min(max(timeout, 0.0), settings.MAX_REQUEST_TIMEOUT_SEC)
+
+
+def get_deadline(request: StarletteRequest, timeout: Optional[float] = None) -> Deadline:
+    """Builds the request deadline, tied to the client connection."""
+    return Deadline(request_timeout(request, timeout), is_disconnected=request.is_disconnected)
+
+
+def audit(request: HTTPConnection, endpoint: str, texts: List[str], result: Dict) -> None:
+    """Queues an audit event of one translated (src_lang, tgt_lang) group, if enabled."""
+    sink = get_audit_sink()
+    if sink is None:
+        return
+    event = {
+        "timestamp": datetime.now(timezone.utc),
+        "endpoint": endpoint,
+        "client": limiter.key_func(request),
+        "src_lang": result["src_lang"],
+        "tgt_lang": result["tgt_lang"],
+        "tier": result["tier"],
+        "num_texts": len(texts),
+        "source_chars": sum(len(text) for text in texts),
+        "estimated_tokens": estimate_cost(texts),
+    }
+    if settings.AUDIT_INCLUDE_TEXTS:
+        event["texts"] = texts
+        event["translations"] = result["results"]
+    sink.record(event)
+
 
 @router.post("/")
-@limiter.limit("50/minute")
+@limiter.quota(settings.TOKEN_BUDGET, scope=QUOTA_SCOPE)
 async def translate(request: StarletteRequest, translation_request: TranslationRequest):
-    logger.debug(
-        "Received translation request", extra={"payload": translation_request.dict()}
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Received translation request",
+            extra={"payload": translation_request.model_dump()},
+        )
+    deadline = get_deadline(request, translation_request.timeout)
     try:
         if translation_request.src_lang is None:
-            logger.debug(
-                "Source language not provided, attempting detection",
-                extra={"payload": translation_request.dict()},
-            )
-            detected_result = await language_detector_service.detect(
-                translation_request.texts
+            logger.debug("Source language not provided, attempting detection")
+            detect_start = time.perf_counter()
+            detected_result = await get_detector_service().detect(
+                translation_request.texts, deadline=deadline
             )
             translation_request.src_lang = detected_result["detected_lang"]
+            record_stage(UNKNOWN_PAIR, "detect", time.perf_counter() - detect_start)
 
             logger.debug(
                 "Language detected", extra={"detection_result": detected_result}
             )
 
-        results = await translation_service.translate(
+        results = await get_translation_service().translate(
             translation_request.texts,
             translation_request.src_lang or "",
             translation_request.tgt_lang,
+            deadline=deadline,
+            tier=translation_request.tier,
+            allow_fallback=translation_request.allow_fallback,
         )
+        audit(request, "translate", translation_request.texts, results)
 
         logger.info(
             "Translation completed successfully",
@@ -58,12 +149,20 @@ async def translate(request: StarletteRequest, translation_request: TranslationR
             },
         )
 
-        return JSONResponse(content=results, status_code=200)
+        return encoded_response(request, results)
 
+    except DeadlineExceeded as e:
+        # 499 mirrors nginx's "client closed request"; nobody reads it anyway
+        return encoded_response(
+            request,
+            content={"detail": str(e)},
+            status_code=499 if e.disconnected else 504,
+        )
     except RuntimeError as e:
         if str(e) == "Server is busy. Please try again later.":
             logger.warning("Request rejected due to overload")
-            return JSONResponse(
+            return encoded_response(
+                request,
                 content={"detail": "Server is busy. Please try again later."},
                 status_code=429,
             )
@@ -71,6 +170,130 @@ async def translate(request: StarletteRequest, translation_request: TranslationR
     except ValueError as e:
         logger.error(
             "Translation failed",
-            extra={"error": str(e), "payload": translation_request.dict()},
+            extra={"error": str(e), "payload": translation_request.model_dump()},
+        )
+        return encoded_response(request, {"detail": str(e)}, status_code=400)
+
+
+@router.post("/batch")
+@limiter.quota(settings.TOKEN_BUDGET, scope=QUOTA_SCOPE)
+async def translate_batch(request: StarletteRequest, batch_request: BatchTranslationRequest):
+    """Translates items with their own languages, each into one or several targets.
+
+    Languages are detected per item in one detector call, then items are grouped by pair
+    and the pairs are translated concurrently. Results follow the input order.
+    """
+    start_time = time.perf_counter()
+    deadline = get_deadline(request, batch_request.timeout)
+    items = batch_request.items
+    try:
+        src_langs = [item.src_lang for item in items]
+        undetected = [i for i, src_lang in enumerate(src_langs) if not src_lang]
+        if undetected:
+            detect_start = time.perf_counter()
+            detected_result = await get_detector_service().detect_each(
+                [items[i].text for i in undetected], deadline=deadline
+            )
+            for i, src_lang in zip(undetected, detected_result["detected_langs"]):
+                src_langs[i] = src_lang
+            record_stage(UNKNOWN_PAIR, "detect", time.perf_counter() - detect_start)
+
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        for item, src_lang in zip(items, src_langs):
+            for tgt_lang in item.targets():
+                if tgt_lang != src_lang:
+                    groups.setdefault((src_lang, tgt_lang), []).append(item.text)
+
+        outcomes = await get_translation_service().translate_batch(
+            groups,
+            deadline=deadline,
+            tier=batch_request.tier,
+            allow_fallback=batch_request.allow_fallback,
         )
-        return JSONResponse(content={"detail": str(e)}, status_code=400)
+        for pair, texts in groups.items():
+            if not isinstance(outcomes[pair], ValueError):
+                audit(request, "translate_batch", texts, outcomes[pair])
+
+        positions = dict.fromkeys(groups, 0)
+        results = []
+        for item, src_lang in zip(items, src_langs):
+            result = {"src_lang": src_lang, "translations": {}}
+            for tgt_lang in item.targets():
+                pair = (src_lang, tgt_lang)
+                if tgt_lang == src_lang:
+                    result["translations"][tgt_lang] = item.text
+                elif isinstance(outcomes[pair], ValueError):
+                    result.setdefault("errors", {})[tgt_lang] = str(outcomes[pair])
+                else:
+                    result["translations"][tgt_lang] = outcomes[pair]["results"][positions[pair]]
+                    positions[pair] += 1
+            results.append(result)
+
+        logger.info(
+            "Batch translation completed",
+            extra={"num_items": len(items), "num_pairs": len(groups)},
+        )
+        return encoded_response(
+            request,
+            content={
+                "results": results,
+                "time": f"{time.perf_counter() - start_time:.2f}s",
+            },
+            status_code=200,
+        )
+
+    except DeadlineExceeded as e:
+        return encoded_response(
+            request,
+            content={"detail": str(e)},
+            status_code=499 if e.disconnected else 504,
+        )
+    except RuntimeError as e:
+        if str(e) == "Server is busy. Please try again later.":
+            logger.warning("Batch request rejected due to overload")
+            return encoded_response(
+                request,
+                content={"detail": "Server is busy. Please try again later."},
+                status_code=429,
+            )
+        raise e
+
+
+@router.post("/detect")
+@limiter.quota(settings.TOKEN_BUDGET, scope=QUOTA_SCOPE)
+async def detect(request: StarletteRequest, detection_request: DetectionRequest):
+    """Detects the language of every text, e.g. for a gateway to route them by pair.
+
+    Charged to the translation budget, one token per text.
+    """
+    deadline = get_deadline(request, detection_request.timeout)
+    try:
+        charge_detection(len(detection_request.texts))
+        result = await get_detector_service().detect_each(
+            detection_request.texts, deadline=deadline
+        )
+        return encoded_response(request, result)
+
+    except DeadlineExceeded as e:
+        return encoded_response(
+            request,
+            content={"detail": str(e)},
+            status_code=499 if e.disconnected else 504,
+        )
+    except RuntimeError as e:
+        if str(e) == "Server is busy. Please try again later.":
+            logger.warning("Detection request rejected due to overload")
+            return encoded_response(
+                request,
+                content={"detail": "Server is busy. Please try again later."},
+                status_code=429,
+            )
+        raise e
+
+
+@router.get("/pairs")
+@limiter.exempt
+async def served_pairs(request: StarletteRequest):
+    """Language pairs and tiers this node serves (SERVED_PAIRS), probed by the gateway."""
+    translator = get_translation_service().translator
+    return encoded_response(request, {"pairs": translator.pairs, "tiers": translator.tiers})
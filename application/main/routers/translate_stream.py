@@ -0,0 +1,252 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
+
+from fastapi.routing import APIRouter
+from pydantic import ValidationError
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from application.initializer import limiter_instance, logger_instance
+from application.main.config import settings
+from application.main.infrastructure.rate_limiter.limiter import RateLimitExceeded
+from application.main.infrastructure.rate_limiter.quota import (
+    TokenQuota,
+    start_token_quota,
+    stop_token_quota,
+)
+from application.main.routers.translate import (
+    QUOTA_SCOPE,
+    TranslationRequest,
+    audit,
+    request_timeout,
+)
+from application.main.services import get_detector_service, get_translation_service
+from application.main.utility.deadline import Deadline, DeadlineExceeded
+from application.main.utility.encoding import JSON, MSGPACK, dumps, loads
+from application.main.utility.metrics import (
+    RATE_LIMITED_REQUESTS,
+    STREAM_COALESCED_REQUESTS,
+    STREAM_CONNECTIONS,
+)
+
+router = APIRouter(prefix="/translate")
+limiter = limiter_instance
+logger = logger_instance.get_logger(__name__)
+
+class StreamTranslationRequest(TranslationRequest):
+    # Tag echoed in the response, as responses come back in completion order
+    id: Union[int, str]
+
+
+@dataclass
+class _Pending:
+    request: StreamTranslationRequest
+    deadline: Deadline
+    # Frames are answered in the format they came in: JSON text or msgpack binary
+    media_type: str
+
+
+@dataclass
+class _Lane:
+    """Requests of one connection for one (src, tgt, tier, allow_fallback)."""
+
+    waiting: Deque[_Pending] = field(default_factory=deque)
+    running: int = 0
+
+
+def error_reply(e: Exception) -> Tuple[int, Dict]:
+    """HTTP-like status and body of a failed request, as the HTTP endpoint would answer."""
+    if isinstance(e, DeadlineExceeded):
+        return (499 if e.disconnected else 504), {"detail": str(e)}
+    if isinstance(e, RateLimitExceeded):
+        RATE_LIMITED_REQUESTS.labels("/translate/stream").inc()
+        return 429, {
+            "detail": f"Too Many Requests, retry after {e.retry_after}",
+            "retry_after": e.retry_after,
+        }
+    if isinstance(e, RuntimeError) and str(e) == "Server is busy. Please try again later.":
+        return 429, {"detail": str(e)}
+    if isinstance(e, ValueError):
+        return 400, {"detail": str(e)}
+    logger.error(f"Stream translation failed: {e!r}")
+    return 500, {"detail": "Internal Server Error"}
+
+
+class TranslationStream:
+    """Tagged translation requests multiplexed over one WebSocket connection.
+
+    Each frame is a ``/translate`` request body with an ``id``; the response frame carries
+    the same ``id`` and is sent as soon as its translation completes, so responses may come
+    back in any order. Requests go through the same service as the HTTP endpoints, at most
+    ``STREAM_CALLS_PER_PAIR`` inference calls per pair at a time: requests arriving while
+    those run are coalesced, up to ``STREAM_MAX_BATCH_TEXTS`` texts, into the next call,
+    which then runs under the earliest deadline among them.
+
+    Flow control: once ``STREAM_MAX_INFLIGHT`` requests are unanswered no more frames are
+    read, so a client sending faster than it is served is pushed back by TCP instead of
+    growing server memory.
+    """
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        # Streams share the token budget of the /translate routes
+        self.quota = TokenQuota(
+            limiter, QUOTA_SCOPE, limiter.key_func(websocket), settings.TOKEN_BUDGET
+        )
+        self._slots = asyncio.Semaphore(max(1, settings.STREAM_MAX_INFLIGHT))
+        self._lanes: Dict[Tuple[str, str, Optional[str], bool], _Lane] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._send_lock = asyncio.Lock()
+        self._closed = False
+
+    async def run(self) -> None:
+        STREAM_CONNECTIONS.inc()
+        try:
+            await self._receive()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            # Requests still running are dropped by their deadline at the next check
+            self._closed = True
+            STREAM_CONNECTIONS.dec()
+
+    async def disconnected(self) -> bool:
+        return self._closed
+
+    async def _receive(self) -> None:
+        while True:
+            await self._slots.acquire()
+            message = await self.websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            if message.get("text") is not None:
+                media_type, frame = JSON, message["text"]
+            else:
+                media_type, frame = MSGPACK, message.get("bytes") or b""
+            try:
+                payload = loads(frame, media_type)
+            except Exception:
+                await self._reply(
+                    media_type, {"id": None, "status": 400, "detail": "Invalid frame"}
+                )
+                continue
+            try:
+                request = StreamTranslationRequest.model_validate(payload)
+            except ValidationError as e:
+                await self._reply(
+                    media_type,
+                    {
+                        "id": payload.get("id") if isinstance(payload, dict) else None,
+                        "status": 422,
+                        "detail": e.errors(
+                            include_url=False, include_context=False, include_input=False
+                        ),
+                    },
+                )
+                continue
+            deadline = Deadline(
+                request_timeout(self.websocket, request.timeout),
+                is_disconnected=self.disconnected,
+            )
+            self._submit(_Pending(request, deadline, media_type))
+
+    def _spawn(self, coroutine) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _submit(self, item: _Pending) -> None:
+        request = item.request
+        if request.src_lang is None:
+            self._spawn(self._detect(item))
+            return
+        key = (request.src_lang, request.tgt_lang, request.tier, request.allow_fallback)
+        lane = self._lanes.setdefault(key, _Lane())
+        lane.waiting.append(item)
+        self._start(key, lane)
+
+    def _start(self, key: Tuple[str, str, Optional[str], bool], lane: _Lane) -> None:
+        while lane.waiting and lane.running < max(1, settings.STREAM_CALLS_PER_PAIR):
+            batch: List[_Pending] = []
+            size = 0
+            while lane.waiting and (
+                not batch
+                or size + len(lane.waiting[0].request.texts) <= settings.STREAM_MAX_BATCH_TEXTS
+            ):
+                item = lane.waiting.popleft()
+                batch.append(item)
+                size += len(item.request.texts)
+            lane.running += 1
+            self._spawn(self._translate(key, lane, batch))
+
+    async def _detect(self, item: _Pending) -> None:
+        try:
+            detected_result = await get_detector_service().detect(
+                item.request.texts, deadline=item.deadline
+            )
+        except Exception as e:
+            await self._fail(item, e)
+            return
+        item.request.src_lang = detected_result["detected_lang"]
+        self._submit(item)
+
+    async def _translate(
+        self, key: Tuple[str, str, Optional[str], bool], lane: _Lane, batch: List[_Pending]
+    ) -> None:
+        src_lang, tgt_lang, tier, allow_fallback = key
+        STREAM_COALESCED_REQUESTS.observe(len(batch))
+        token = start_token_quota(self.quota)
+        try:
+            self.quota.charge(0)
+            result = await get_translation_service().translate(
+                [text for item in batch for text in item.request.texts],
+                src_lang,
+                tgt_lang,
+                deadline=min((item.deadline for item in batch), key=lambda it: it.expires_at),
+                tier=tier,
+                allow_fallback=allow_fallback,
+            )
+        except Exception as e:
+            for item in batch:
+                await self._fail(item, e)
+            return
+        finally:
+            stop_token_quota(token)
+            lane.running -= 1
+            self._start(key, lane)
+
+        offset = 0
+        for item in batch:
+            texts = item.request.texts
+            item_result = {**result, "results": result["results"][offset : offset + len(texts)]}
+            offset += len(texts)
+            audit(self.websocket, "translate_stream", texts, item_result)
+            await self._reply(
+                item.media_type, {"id": item.request.id, "status": 200, "result": item_result}
+            )
+
+    async def _fail(self, item: _Pending, e: Exception) -> None:
+        status, body = error_reply(e)
+        await self._reply(item.media_type, {"id": item.request.id, "status": status, **body})
+
+    async def _reply(self, media_type: str, message: Dict[str, Any]) -> None:
+        """Sends one response frame and frees the in-flight slot of its request."""
+        try:
+            if not self._closed:
+                async with self._send_lock:
+                    if media_type == MSGPACK:
+                        await self.websocket.send_bytes(dumps(message, MSGPACK))
+                    else:
+                        await self.websocket.send_text(dumps(message).decode("utf-8"))
+        except (WebSocketDisconnect, RuntimeError, OSError):
+            # Closed while the request was running
+            self._closed = True
+        finally:
+            self._slots.release()
+
+
+@router.websocket("/stream")
+async def translate_stream(websocket: WebSocket):
+    await websocket.accept()
+    await TranslationStream(websocket).run()
@@ -1,2 +1,20 @@
-from application.main.services.language_detector_service import DetectorService
-from application.main.services.translation_service import TranslationService
+from functools import lru_cache
+
+# The services are imported by their factories: importing this package must not import
+# torch and transformers, let alone load models
+
+
+@lru_cache(maxsize=None)
+def get_translation_service():
+    """Process-wide translation service; the first call loads every translator."""
+    from application.main.services.translation_service import TranslationService
+
+    return TranslationService()
+
+
+@lru_cache(maxsize=None)
+def get_detector_service():
+    """Process-wide detection service; the first call loads the detector."""
+    from application.main.services.language_detector_service import DetectorService
+
+    return DetectorService()
@@ -1,9 +1,19 @@
 import asyncio
 import time
-from typing import Dict
+from typing import Dict, List, Optional
 
 from application.initializer import logger_instance
-from application.main.infrastructure.detector import Detector
+from application.main.infrastructure.detector import get_detector
+from application.main.utility.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    acquire_before_deadline,
+)
+from application.main.utility.metrics import (
+    DROPPED_TEXTS,
+    INFERENCE_INFLIGHT,
+    INFERENCE_QUEUED,
+)
 
 
 class DetectorService(object):
@@ -13,29 +23,47 @@ class DetectorService(object):
 
     def __init__(self):
         self.logger = logger_instance.get_logger(__name__)
-        self.detector = Detector()
+        self.detector = get_detector()
 
-    async def detect(self, texts: list[str]) -> Dict:
+    async def _acquire(self, texts: List[str], deadline: Optional[Deadline]) -> None:
+        INFERENCE_QUEUED.labels("detection").inc()
         try:
-            await asyncio.wait_for(
-                self._semaphore.acquire(), timeout=self._semaphore_timeout_sec
+            await acquire_before_deadline(
+                self._semaphore,
+                self._semaphore_timeout_sec,
+                deadline,
+                dropped=len(texts),
             )
         except asyncio.TimeoutError as e:
             raise RuntimeError("Server is busy. Please try again later.") from e
+        except DeadlineExceeded as e:
+            DROPPED_TEXTS.labels("detection", "queue").inc(e.dropped)
+            self.logger.warning(
+                f"Dropped {e.dropped} texts before detection: {e}",
+                extra={"dropped": e.dropped, "disconnected": e.disconnected},
+            )
+            raise
+        finally:
+            INFERENCE_QUEUED.labels("detection").dec()
+
+    async def detect(self, texts: list[str], deadline: Optional[Deadline] = None) -> Dict:
+        await self._acquire(texts, deadline)
 
+        INFERENCE_INFLIGHT.labels("detection").inc()
         try:
             start_time = time.time()
             lang = self.detector.detect(texts)[0]["language"]
             duration_ms = (time.time() - start_time) * 1000
 
             self.logger.info(
-                f"Detecting language texts {texts}: {lang}",
+                f"Detected language of {len(texts)} texts: {lang}",
                 extra={
-                    "input": texts,
+                    "num_texts": len(texts),
                     "detected_lang": lang,
                     "duration_ms": duration_ms,
                 },
             )
+            self.logger.debug("Detection payload", extra={"input": texts})
 
             return {
                 "detected_lang": lang,
@@ -43,4 +71,31 @@ class DetectorService(object):
             }
 
         finally:
+            INFERENCE_INFLIGHT.labels("detection").dec()
+            self._semaphore.release()
+
+    async def detect_each(
+        self, texts: List[str], deadline: Optional[Deadline] = None
+    ) -> Dict:
+        """Detects the language of every text separately, in one detector call."""
+        await self._acquire(texts, deadline)
+
+        INFERENCE_INFLIGHT.labels("detection").inc()
+        try:
+            start_time = time.time()
+            langs = self.detector.detect_each(texts)
+            duration_ms = (time.time() - start_time) * 1000
+
+            self.logger.info(
+                f"Detected languages of {len(texts)} texts",
+                extra={"num_texts": len(texts), "duration_ms": duration_ms},
+            )
+
+            return {
+                "detected_langs": langs,
+                "time": f"{round(duration_ms / 1000, 2)}s",
+            }
+
+        finally:
+            INFERENCE_INFLIGHT.labels("detection").dec()
             self._semaphore.release()
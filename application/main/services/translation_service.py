@@ -1,9 +1,24 @@
 import asyncio
 import time
-from typing import Dict, List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 
 from application.initializer import logger_instance
+from application.main.config import settings
 from application.main.infrastructure.translator import UniversalTranslator
+from application.main.infrastructure.translator.translators import FAST_TIER
+from application.main.utility.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    acquire_before_deadline,
+)
+from application.main.utility.metrics import (
+    DROPPED_TEXTS,
+    INFERENCE_INFLIGHT,
+    INFERENCE_QUEUED,
+    TIER_FALLBACKS,
+)
+from application.main.utility.timing import UNKNOWN_PAIR, record_stage
 
 
 class TranslationService:
@@ -15,37 +30,151 @@ class TranslationService:
         self.logger = logger_instance.get_logger(__name__)
         self.translator = UniversalTranslator()
 
-    async def translate(self, texts: List[str], src_lang: str, tgt_lang: str) -> Dict:
+    async def translate(
+        self,
+        texts: List[str],
+        src_lang: str,
+        tgt_lang: str,
+        deadline: Optional[Deadline] = None,
+        tier: Optional[str] = None,
+        allow_fallback: bool = True,
+    ) -> Dict:
+        if src_lang:
+            # Before any metric is labelled with the pair, and before taking a slot
+            self.translator.check_pair(src_lang, tgt_lang)
+        tier = self._select_tier(src_lang, tgt_lang, tier, allow_fallback)
+
+        start_time = time.time()
+        results = await self.translator.translate(
+            texts,
+            src_lang,
+            tgt_lang,
+            deadline=deadline,
+            tier=tier,
+            inference_slot=self._inference_slot,
+        )
+        duration_ms = (time.time() - start_time) * 1000
+
+        self.logger.info(
+            f"Translating {len(texts)} texts from {src_lang} to {tgt_lang} ({tier}) in {duration_ms:.2f} ms on {self.translator.device()}",
+            extra={
+                "src_lang": src_lang,
+                "tgt_lang": tgt_lang,
+                "tier": tier,
+                "device": self.translator.device(),
+                "num_texts": len(texts),
+                "duration_ms": duration_ms,
+            },
+        )
+        self.logger.debug(
+            "Translation payload", extra={"input": texts, "output": results}
+        )
+
+        return {
+            "results": results,
+            "time": f"{(duration_ms / 1000):.2f}s",
+            "src_lang": src_lang,
+            "tgt_lang": tgt_lang,
+            "tier": tier,
+        }
+
+    @asynccontextmanager
+    async def _inference_slot(
+        self, pair: str, num_texts: int, deadline: Optional[Deadline]
+    ) -> AsyncIterator[None]:
+        """Holds one of the inference slots around the inference of ``num_texts`` texts.
+
+        Cache hits are served without one, and the texts to translate are already charged
+        to the client's token budget, so an over-budget client never takes a slot.
+        """
+        queued_at = time.perf_counter()
+        INFERENCE_QUEUED.labels("translation").inc()
         try:
-            await asyncio.wait_for(
-                self._semaphore.acquire(), timeout=self._semaphore_timeout_sec
+            await acquire_before_deadline(
+                self._semaphore,
+                self._semaphore_timeout_sec,
+                deadline,
+                dropped=num_texts,
             )
         except asyncio.TimeoutError as e:
             raise RuntimeError("Server is busy. Please try again later.") from e
+        except DeadlineExceeded as e:
+            self._count_dropped(e, "queue")
+            raise
+        finally:
+            INFERENCE_QUEUED.labels("translation").dec()
+        record_stage(pair, "queue", time.perf_counter() - queued_at)
 
+        INFERENCE_INFLIGHT.labels("translation").inc()
         try:
-            start_time = time.time()
-            results = await self.translator.translate(texts, src_lang, tgt_lang)
-            duration_ms = (time.time() - start_time) * 1000
-
-            self.logger.info(
-                f"Translating {len(texts)} texts from {src_lang} to {tgt_lang} in {duration_ms:.2f} ms on {self.translator.device()}",
-                extra={
-                    "src_lang": src_lang,
-                    "tgt_lang": tgt_lang,
-                    "input": texts,
-                    "output": results,
-                    "device": self.translator.device(),
-                    "num_texts": len(texts),
-                    "duration_ms": duration_ms,
-                },
-            )
-
-            return {
-                "results": results,
-                "time": f"{(duration_ms / 1000):.2f}s",
-                "src_lang": src_lang,
-                "tgt_lang": tgt_lang,
-            }
+            yield
+        except DeadlineExceeded as e:
+            self._count_dropped(e, "batch")
+            raise
         finally:
+            INFERENCE_INFLIGHT.labels("translation").dec()
             self._semaphore.release()
+
+    async def translate_batch(
+        self,
+        groups: Dict[Tuple[str, str], List[str]],
+        deadline: Optional[Deadline] = None,
+        tier: Optional[str] = None,
+        allow_fallback: bool = True,
+    ) -> Dict[Tuple[str, str], Union[Dict, ValueError]]:
+        """Translates texts grouped by (src_lang, tgt_lang), the pairs running concurrently.
+
+        An unsupported pair yields its ValueError in place of its result; any other error
+        (overload, deadline, quota) fails the whole batch.
+        """
+        outcomes = await asyncio.gather(
+            *(
+                self.translate(
+                    texts,
+                    src_lang,
+                    tgt_lang,
+                    deadline=deadline,
+                    tier=tier,
+                    allow_fallback=allow_fallback,
+                )
+                for (src_lang, tgt_lang), texts in groups.items()
+            ),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException) and not isinstance(outcome, ValueError):
+                raise outcome
+        return dict(zip(groups, outcomes))
+
+    def _select_tier(
+        self, src_lang: str, tgt_lang: str, tier: Optional[str], allow_fallback: bool
+    ) -> str:
+        """Resolves the requested tier, degraded to the fast one while every slot is busy.
+
+        A request that would queue behind the others is better served quickly by the
+        smaller model than late by the larger one.
+        """
+        tier = self.translator.resolve_tier(tier)
+        if (
+            allow_fallback
+            and settings.TIER_FALLBACK_UNDER_LOAD
+            and tier != FAST_TIER
+            and FAST_TIER in self.translator.tiers
+            and self._semaphore.locked()
+        ):
+            TIER_FALLBACKS.labels(
+                f"{src_lang}2{tgt_lang}" if src_lang else UNKNOWN_PAIR, tier
+            ).inc()
+            return FAST_TIER
+        return tier
+
+    def _count_dropped(self, e: DeadlineExceeded, stage: str) -> None:
+        DROPPED_TEXTS.labels("translation", stage).inc(e.dropped)
+        self.logger.warning(
+            f"Dropped {e.dropped} texts at {stage}: {e}",
+            extra={
+                "stage": stage,
+                "dropped": e.dropped,
+                "disconnected": e.disconnected,
+            },
+        )
@@ -0,0 +1,5 @@
+from application.main.utility.deadline.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    acquire_before_deadline,
+)
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+
+class DeadlineExceeded(RuntimeError):
+    """Raised when work is abandoned because its deadline passed or its client left."""
+
+    def __init__(self, message: str, dropped: int = 0, disconnected: bool = False):
+        super().__init__(message)
+        self.dropped = dropped
+        self.disconnected = disconnected
+
+
+class Deadline:
+    """Absolute deadline of a request, optionally tied to the client connection.
+
+    Args:
+        timeout_sec: Seconds from now after which the work is no longer useful.
+        is_disconnected: Optional coroutine function telling whether the client is gone
+            (e.g. ``starlette.requests.Request.is_disconnected``).
+    """
+
+    def __init__(
+        self,
+        timeout_sec: float,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ):
+        self.timeout_sec = timeout_sec
+        self.expires_at = time.monotonic() + timeout_sec
+        self._is_disconnected = is_disconnected
+        self._disconnected = False
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    async def disconnected(self) -> bool:
+        if not self._disconnected and self._is_disconnected is not None:
+            self._disconnected = await self._is_disconnected()
+        return self._disconnected
+
+    async def cancelled(self) -> bool:
+        return self.expired() or await self.disconnected()
+
+    async def check(self, dropped: int = 0) -> None:
+        """Raises DeadlineExceeded if the work behind this deadline should be dropped.
+
+        Args:
+            dropped: Number of items abandoned if the check fails, carried on the exception.
+        """
+        if self.expired():
+            raise DeadlineExceeded(
+                f"Deadline of {self.timeout_sec:.2f}s exceeded", dropped=dropped
+            )
+        if await self.disconnected():
+            raise DeadlineExceeded(
+                "Client disconnected", dropped=dropped, disconnected=True
+            )
+
+
+async def acquire_before_deadline(
+    semaphore: asyncio.Semaphore,
+    timeout_sec: float,
+    deadline: Optional[Deadline] = None,
+    poll_interval_sec: float = 0.1,
+    dropped: int = 0,
+) -> None:
+    """Waits for a semaphore slot, giving up as soon as the waiting request is abandoned.
+
+    Raises:
+        asyncio.TimeoutError: If no slot frees up within ``timeout_sec``.
+        DeadlineExceeded: If the deadline passes or the client disconnects while waiting.
+    """
+    if deadline is None:
+        await asyncio.wait_for(semaphore.acquire(), timeout=timeout_sec)
+        return
+
+    give_up_at = time.monotonic() + timeout_sec
+    while True:
+        await deadline.check(dropped)
+        wait_sec = min(
+            poll_interval_sec, deadline.remaining(), give_up_at - time.monotonic()
+        )
+        if wait_sec <= 0:
+            if time.monotonic() >= give_up_at:
+                raise asyncio.TimeoutError()
+            continue
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=wait_sec)
+            return
+        except asyncio.TimeoutError:
+            if time.monotonic() >= give_up_at:
+                raise
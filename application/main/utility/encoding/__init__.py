@@ -0,0 +1,15 @@
+from application.main.utility.encoding.encoding import (
+    JSON,
+    MSGPACK,
+    MSGPACK_TYPES,
+    DecodedRequest,
+    EncodedResponse,
+    EncodedRoute,
+    dumps,
+    encoded_response,
+    loads,
+    media_type_of,
+    negotiate,
+    parse_accept,
+    response_media_type,
+)
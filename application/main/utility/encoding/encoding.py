@@ -0,0 +1,133 @@
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import msgpack
+import orjson
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+# Media types clients commonly send for msgpack
+MSGPACK_TYPES = {MSGPACK, "application/x-msgpack", "application/vnd.msgpack"}
+
+
+def media_type_of(content_type: Optional[str]) -> str:
+    """``"application/json; charset=utf-8"`` -> ``"application/json"``."""
+    return (content_type or "").split(";", 1)[0].strip().lower()
+
+
+def parse_accept(header: Optional[str]) -> Dict[str, float]:
+    """Quality value of each entry of an Accept or Accept-Encoding header."""
+    accepted: Dict[str, float] = {}
+    for entry in (header or "").split(","):
+        value, *params = entry.split(";")
+        value = value.strip().lower()
+        if not value:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, number = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(number)
+                except ValueError:
+                    quality = 0.0
+        accepted[value] = max(quality, accepted.get(value, 0.0))
+    return accepted
+
+
+def negotiate(header: Optional[str], offers: Iterable[str]) -> Optional[str]:
+    """The offer the client prefers, ties going to the first one; None if none is accepted.
+
+    Offers the header does not name get the quality of its ``*`` entry, if any.
+    """
+    accepted = parse_accept(header)
+    best, best_quality = None, 0.0
+    for offer in offers:
+        quality = accepted.get(offer, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = offer, quality
+    return best
+
+
+def response_media_type(accept: Optional[str]) -> str:
+    """msgpack when the client prefers it to JSON, JSON otherwise (including no Accept).
+
+    Wildcards count for JSON only, so that only clients asking for msgpack get it.
+    """
+    accepted = parse_accept(accept)
+    msgpack_quality = max(accepted.get(media_type, 0.0) for media_type in MSGPACK_TYPES)
+    json_quality = next(
+        (accepted[it] for it in (JSON, "application/*", "*/*") if it in accepted), 0.0
+    )
+    return MSGPACK if msgpack_quality > json_quality else JSON
+
+
+def dumps(content: Any, media_type: str = JSON) -> bytes:
+    if media_type in MSGPACK_TYPES:
+        return msgpack.packb(content, use_bin_type=True)
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def loads(body: bytes, media_type: str = JSON) -> Any:
+    if media_type in MSGPACK_TYPES:
+        return msgpack.unpackb(body, raw=False)
+    return orjson.loads(body)
+
+
+class EncodedResponse(Response):
+    """Response serialized with orjson, or msgpack when created with its media type."""
+
+    media_type = JSON
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content, self.media_type)
+
+
+def encoded_response(request: Request, content: Any, status_code: int = 200) -> Response:
+    """Response in the format negotiated from the request's Accept header."""
+    return EncodedResponse(
+        content=content,
+        status_code=status_code,
+        media_type=response_media_type(request.headers.get("accept")),
+        headers={"Vary": "Accept"},
+    )
+
+
+class DecodedRequest(Request):
+    """Request whose body is parsed with orjson, or msgpack for a msgpack Content-Type."""
+
+    def __init__(self, scope, receive, body_media_type: str = JSON):
+        super().__init__(scope, receive)
+        self.body_media_type = body_media_type
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = loads(await self.body(), self.body_media_type)
+        return self._json
+
+
+class EncodedRoute(APIRoute):
+    """Route accepting JSON or msgpack bodies.
+
+    FastAPI only parses bodies with a JSON Content-Type, so a msgpack request is handed
+    over with ``application/json`` and its body unpacked by ``DecodedRequest.json``.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            body_media_type = media_type_of(request.headers.get("content-type"))
+            scope = request.scope
+            if body_media_type in MSGPACK_TYPES:
+                scope = dict(scope)
+                scope["headers"] = [
+                    (name, value) for name, value in scope["headers"] if name != b"content-type"
+                ] + [(b"content-type", JSON.encode())]
+            else:
+                body_media_type = JSON
+            return await handler(DecodedRequest(scope, request.receive, body_media_type))
+
+        return route_handler
@@ -13,7 +13,11 @@ class Handlers:
         self.config = ConfigReaderInstance.yaml.read_config_from_file(
     settings.LOG_CONFIG_FILENAME)
         if self.config.json_formatter:
-            self.formatter = UnicodeJsonFormatter(fmt="%(asctime)s %(levelname)s %(name)s %(message)s") 
+            self.formatter = UnicodeJsonFormatter(
+                fmt="%(asctime)s %(levelname)s %(name)s %(message)s",
+                max_field_chars=self.config.max_field_chars,
+                max_list_items=self.config.max_list_items,
+            )
         else:
             self.formatter = logging.Formatter(self.config.formatter)
         self.log_filename = Path().joinpath(
@@ -21,7 +25,7 @@ class Handlers:
         self.rotation = self.config.rotation
 
     def get_console_handler(self):
-        console_handler = logging.StreamHandler(sys.stdout.flush())
+        console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(self.formatter)
         return console_handler
 
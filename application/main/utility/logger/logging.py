@@ -1,13 +1,36 @@
+import atexit
 import logging
-from typing import List
+import queue
+from logging.handlers import QueueListener
 
+from application.main.config import settings
 from application.main.utility.logger.handlers import Handlers
+from application.main.utility.logger.queue_handler import DroppingQueueHandler
 
 
 class LogHandler(object):
+    """Builds application loggers that log through a background thread.
+
+    Loggers only put records on a bounded queue; a QueueListener thread formats them and
+    writes to the console, file and socket handlers, so slow I/O never blocks a request.
+    """
 
     def __init__(self):
-        self.available_handlers: List = Handlers().get_handlers()
+        handlers = Handlers()
+        self._queue: queue.Queue = queue.Queue(maxsize=handlers.config.queue_size or 10000)
+        self.queue_handler = DroppingQueueHandler(self._queue)
+        self.listener = QueueListener(
+            self._queue, *handlers.get_handlers(), respect_handler_level=True
+        )
+        self.listener.start()
+        self._stopped = False
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Flushes queued records and stops the listener thread; safe to call twice."""
+        if not self._stopped:
+            self._stopped = True
+            self.listener.stop()
 
     def get_logger(self, logger_name):
         """
@@ -16,10 +39,9 @@ class LogHandler(object):
         :return:
         """
         logger = logging.getLogger(logger_name)
-        logger.setLevel(logging.DEBUG)
+        logger.setLevel(settings.LOG_LEVEL.upper())
         if logger.hasHandlers():
             logger.handlers.clear()
-        for handler in self.available_handlers:
-            logger.addHandler(handler)
+        logger.addHandler(self.queue_handler)
         logger.propagate = False
         return logger
@@ -0,0 +1,59 @@
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler
+
+from application.main.utility.metrics import LOG_RECORDS_DROPPED
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Hands records to a bounded queue without ever blocking the caller.
+
+    When the queue is full the record is dropped and counted. The number of records dropped
+    since the last report is logged as a warning at most every ``report_interval_sec``, once
+    the queue has room again.
+    """
+
+    def __init__(self, log_queue: queue.Queue, report_interval_sec: float = 10.0):
+        super().__init__(log_queue)
+        self.report_interval_sec = report_interval_sec
+        self.dropped = 0
+        self._unreported = 0
+        self._last_report = 0.0
+        self._lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                self._unreported += 1
+            LOG_RECORDS_DROPPED.inc()
+            return
+
+        if self._unreported and time.monotonic() - self._last_report >= self.report_interval_sec:
+            self._report_dropped()
+
+    def _report_dropped(self) -> None:
+        with self._lock:
+            unreported, self._unreported = self._unreported, 0
+            self._last_report = time.monotonic()
+        if not unreported:
+            return
+        warning = logging.makeLogRecord(
+            {
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Log queue full: dropped {unreported} records ({self.dropped} total)",
+                "dropped": unreported,
+                "dropped_total": self.dropped,
+            }
+        )
+        try:
+            self.queue.put_nowait(warning)
+        except queue.Full:
+            with self._lock:
+                self._unreported += unreported
@@ -1,14 +1,42 @@
-import json
+from typing import Any, Optional
 
 from pythonjsonlogger.json import JsonFormatter
 
 
 class UnicodeJsonFormatter(JsonFormatter):
-    def process_log_record(self, log_record):
-        return log_record
+    """JSON formatter that keeps non-ASCII text readable and caps large payload fields.
+
+    Records are serialized once, with ``ensure_ascii=False``. Strings longer than
+    ``max_field_chars`` and lists longer than ``max_list_items`` (e.g. the texts of a large
+    batch) are truncated so one request cannot produce a multi-megabyte log line.
+    """
+
+    def __init__(
+        self,
+        *args,
+        max_field_chars: Optional[int] = None,
+        max_list_items: Optional[int] = None,
+        **kwargs,
+    ):
+        kwargs.setdefault("json_ensure_ascii", False)
+        super().__init__(*args, **kwargs)
+        self.max_field_chars = max_field_chars
+        self.max_list_items = max_list_items
 
-    def format(self, record):
-        json_log = super().format(record)
-        log_record = json.loads(json_log)
-        log_record = self.process_log_record(log_record)
-        return json.dumps(log_record, ensure_ascii=False)
+    def _cap(self, value: Any) -> Any:
+        if isinstance(value, str):
+            if self.max_field_chars and len(value) > self.max_field_chars:
+                return f"{value[: self.max_field_chars]}... <{len(value)} chars>"
+            return value
+        if isinstance(value, (list, tuple)):
+            if self.max_list_items and len(value) > self.max_list_items:
+                capped = [self._cap(it) for it in value[: self.max_list_items]]
+                capped.append(f"... <{len(value)} items>")
+                return capped
+            return [self._cap(it) for it in value]
+        if isinstance(value, dict):
+            return {k: self._cap(v) for k, v in value.items()}
+        return value
+
+    def process_log_record(self, log_record):
+        return {k: self._cap(v) for k, v in log_record.items()}
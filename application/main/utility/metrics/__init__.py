@@ -0,0 +1,29 @@
+from application.main.utility.metrics.metrics import (
+    AUDIT_EVENTS_DROPPED,
+    AUDIT_EVENTS_WRITTEN,
+    AUDIT_FLUSH_LATENCY,
+    AUDIT_QUEUE_DEPTH,
+    BATCH_PADDING_RATIO,
+    BATCH_SIZE,
+    CACHE_HOT_KEYS,
+    CACHE_REQUESTS,
+    CIRCUIT_BREAKER_STATE,
+    CIRCUIT_BREAKER_TRANSITIONS,
+    DROPPED_TEXTS,
+    GATEWAY_FAILOVERS,
+    GATEWAY_NODE_UP,
+    GENERATED_TOKENS,
+    INFERENCE_INFLIGHT,
+    INFERENCE_QUEUED,
+    LOG_RECORDS_DROPPED,
+    MASKING_FALLBACKS,
+    MODEL_IDLE,
+    RATE_LIMIT_DEGRADED,
+    RATE_LIMIT_SYNC_LATENCY,
+    RATE_LIMITED_REQUESTS,
+    STAGE_LATENCY,
+    STREAM_COALESCED_REQUESTS,
+    STREAM_CONNECTIONS,
+    TIER_FALLBACKS,
+    TOKENS_PER_SECOND,
+)
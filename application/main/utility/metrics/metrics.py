@@ -0,0 +1,145 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# Buckets tuned for the translate hot path: sub-millisecond cache hits up to slow beam searches
+_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+_BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+_RATIO_BUCKETS = (0.0, 0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+_TOKENS_PER_SEC_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+STAGE_LATENCY = Histogram(
+    "translator_stage_duration_seconds",
+    "Time spent per translation stage and language pair",
+    ["pair", "stage"],
+    buckets=_LATENCY_BUCKETS,
+)
+BATCH_SIZE = Histogram(
+    "translator_batch_size",
+    "Number of texts per inference batch",
+    ["pair"],
+    buckets=_BATCH_SIZE_BUCKETS,
+)
+BATCH_PADDING_RATIO = Histogram(
+    "translator_batch_padding_ratio",
+    "Share of padding tokens in the tokenized inference batch",
+    ["pair"],
+    buckets=_RATIO_BUCKETS,
+)
+TOKENS_PER_SECOND = Histogram(
+    "translator_generate_tokens_per_second",
+    "Generated tokens per second of generate() per batch",
+    ["pair"],
+    buckets=_TOKENS_PER_SEC_BUCKETS,
+)
+GENERATED_TOKENS = Counter(
+    "translator_generated_tokens",
+    "Tokens produced by generate()",
+    ["pair"],
+)
+CACHE_REQUESTS = Counter(
+    "translator_cache_requests",
+    "Cache lookups per tier and result (hit or miss)",
+    ["tier", "result"],
+)
+CACHE_HOT_KEYS = Gauge(
+    "translator_cache_hot_keys",
+    "Cache keys currently hot, pinned in the in-process tier",
+)
+MODEL_IDLE = Histogram(
+    "translator_model_idle_seconds",
+    "Gap between two generate calls on consecutive chunks of one request",
+    ["pair"],
+    buckets=_LATENCY_BUCKETS,
+)
+MASKING_FALLBACKS = Counter(
+    "translator_masking_fallbacks",
+    "Texts retranslated unmasked because the model dropped or duplicated a placeholder",
+    ["pair"],
+)
+TIER_FALLBACKS = Counter(
+    "translator_tier_fallbacks",
+    "Requests served by the fast tier instead of the requested one because of load",
+    ["pair", "tier"],
+)
+INFERENCE_INFLIGHT = Gauge(
+    "translator_inference_inflight",
+    "Requests holding an inference semaphore slot",
+    ["service"],
+)
+INFERENCE_QUEUED = Gauge(
+    "translator_inference_queued",
+    "Requests waiting for an inference semaphore slot",
+    ["service"],
+)
+DROPPED_TEXTS = Counter(
+    "translator_dropped_texts",
+    "Texts dropped because their deadline passed or their client disconnected",
+    ["service", "stage"],
+)
+RATE_LIMITED_REQUESTS = Counter(
+    "translator_rate_limited_requests",
+    "Requests rejected by the rate limiter",
+    ["path"],
+)
+RATE_LIMIT_SYNC_LATENCY = Histogram(
+    "translator_rate_limit_sync_duration_seconds",
+    "Round trip of one batched rate limit usage exchange with Redis",
+    buckets=_LATENCY_BUCKETS,
+)
+RATE_LIMIT_DEGRADED = Gauge(
+    "translator_rate_limit_degraded",
+    "1 while rate limits are enforced per process because Redis sync is failing",
+)
+CIRCUIT_BREAKER_STATE = Gauge(
+    "translator_circuit_breaker_state",
+    "Circuit breaker state per dependency: 0 closed, 1 half-open, 2 open (degraded)",
+    ["service"],
+)
+CIRCUIT_BREAKER_TRANSITIONS = Counter(
+    "translator_circuit_breaker_transitions",
+    "Circuit breaker state changes per dependency",
+    ["service", "from_state", "to_state"],
+)
+LOG_RECORDS_DROPPED = Counter(
+    "translator_log_records_dropped",
+    "Log records dropped because the asynchronous log queue was full",
+)
+AUDIT_EVENTS_WRITTEN = Counter(
+    "translator_audit_events_written",
+    "Translation audit events inserted into the database",
+)
+AUDIT_EVENTS_DROPPED = Counter(
+    "translator_audit_events_dropped",
+    "Translation audit events lost: queue_full (backpressure), error (insert failed) or closed",
+    ["reason"],
+)
+AUDIT_QUEUE_DEPTH = Gauge(
+    "translator_audit_queue_depth",
+    "Translation audit events waiting to be written",
+)
+AUDIT_FLUSH_LATENCY = Histogram(
+    "translator_audit_flush_duration_seconds",
+    "Duration of one insert_many of queued audit events",
+    buckets=_LATENCY_BUCKETS,
+)
+STREAM_CONNECTIONS = Gauge(
+    "translator_stream_connections",
+    "Open WebSocket translation streams",
+)
+STREAM_COALESCED_REQUESTS = Histogram(
+    "translator_stream_coalesced_requests",
+    "Stream requests of one connection translated by a single inference call",
+    buckets=_BATCH_SIZE_BUCKETS,
+)
+GATEWAY_NODE_UP = Gauge(
+    "translator_gateway_node_up",
+    "Whether the gateway currently routes to the node (1) or considers it down (0)",
+    ["node"],
+)
+GATEWAY_FAILOVERS = Counter(
+    "translator_gateway_failovers",
+    "Gateway requests retried on the next node after a node failed to answer",
+    ["pair"],
+)
@@ -0,0 +1 @@
+from application.main.utility.profiler.profiler import BatchProfiler, batch_profiler
@@ -0,0 +1,106 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+from application.initializer import logger_instance
+from application.main.config import settings
+
+logger = logger_instance.get_logger(__name__)
+
+
+class BatchProfiler:
+    """Captures torch.profiler traces of the next N inference batches.
+
+    Each profiled batch is written as a Chrome trace to ``LOGS_DIR`` and can be opened in
+    ``chrome://tracing`` or Perfetto. Batches run on worker threads, hence the lock; only
+    one of them is profiled at a time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._remaining = 0
+        self._capture_id = ""
+        self._captured = 0
+        self._traces: List[str] = []
+        # Whether a batch is being profiled, at most one per process
+        self._active = False
+
+    def arm(self, num_batches: int) -> Dict:
+        """Profiles the next ``num_batches`` inference batches, replacing any pending capture."""
+        with self._lock:
+            self._remaining = num_batches
+            self._capture_id = time.strftime("%Y%m%d-%H%M%S")
+            self._captured = 0
+            self._traces = []
+        logger.info(f"Profiling the next {num_batches} inference batches")
+        return self.status()
+
+    def status(self) -> Dict:
+        with self._lock:
+            return {
+                "capture_id": self._capture_id,
+                "remaining": self._remaining,
+                "traces": list(self._traces),
+            }
+
+    @contextmanager
+    def profile(self, pair: str) -> Iterator[None]:
+        """Profiles the batch run inside if a capture is armed.
+
+        torch.profiler cannot run on two threads at once, so batches running while another
+        one is profiled are not; profiler errors are logged and never fail the batch.
+        """
+        with self._lock:
+            armed = self._remaining > 0 and not self._active
+            if armed:
+                self._active = True
+                self._remaining -= 1
+                self._captured += 1
+                trace_name = f"profile-{self._capture_id}-{self._captured}-{pair}.json"
+
+        if not armed:
+            yield
+            return
+
+        prof = None
+        try:
+            prof = self._start()
+        except Exception as e:
+            logger.warning(f"Could not start the profiler: {e!r}")
+        try:
+            yield
+        finally:
+            try:
+                if prof is not None:
+                    self._stop(prof, trace_name)
+            except Exception as e:
+                logger.warning(f"Could not write the profiler trace: {e!r}")
+            finally:
+                with self._lock:
+                    self._active = False
+
+    @staticmethod
+    def _start():
+        # Imported here so that importing the admin router does not import torch
+        import torch
+        from torch.profiler import ProfilerActivity
+        from torch.profiler import profile as torch_profile
+
+        activities = [ProfilerActivity.CPU]
+        if torch.cuda.is_available():
+            activities.append(ProfilerActivity.CUDA)
+
+        prof = torch_profile(activities=activities, record_shapes=True, profile_memory=True)
+        prof.start()
+        return prof
+
+    def _stop(self, prof, trace_name: str) -> None:
+        prof.stop()
+        trace_path = settings.APP_CONFIG.LOGS_DIR / trace_name
+        prof.export_chrome_trace(str(trace_path))
+        with self._lock:
+            self._traces.append(str(trace_path))
+        logger.info(f"Profiler trace written to {trace_path}")
+
+batch_profiler = BatchProfiler()
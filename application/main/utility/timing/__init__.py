@@ -0,0 +1,9 @@
+from application.main.utility.timing.timing import (
+    UNKNOWN_PAIR,
+    record_span,
+    record_stage,
+    server_timing_header,
+    start_request_timing,
+    stop_request_timing,
+    timed_stage,
+)
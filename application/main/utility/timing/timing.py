@@ -0,0 +1,59 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from application.main.utility.metrics import STAGE_LATENCY
+
+# Pair label of stages timed before the pair is known and validated, so that request
+# input never creates metric series
+UNKNOWN_PAIR = "unknown"
+
+# Spans of the current request, shared by reference with worker threads spawned from it
+_spans: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar(
+    "server_timing_spans", default=None
+)
+
+
+def start_request_timing() -> Token:
+    """Starts collecting spans for the current request context."""
+    return _spans.set([])
+
+
+def stop_request_timing(token: Token) -> None:
+    _spans.reset(token)
+
+
+def record_span(name: str, duration_sec: float) -> None:
+    """Records a span on the current request, if it is being timed."""
+    spans = _spans.get()
+    if spans is not None:
+        spans.append((name, duration_sec))
+
+
+def record_stage(pair: str, stage: str, duration_sec: float) -> None:
+    """Records a translation stage both as a metric and as a request span."""
+    STAGE_LATENCY.labels(pair, stage).observe(duration_sec)
+    record_span(stage, duration_sec)
+
+
+@contextmanager
+def timed_stage(pair: str, stage: str) -> Iterator[None]:
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(pair, stage, time.perf_counter() - start_time)
+
+
+def server_timing_header() -> str:
+    """Renders the current request spans as a Server-Timing header value.
+
+    Spans sharing a name (e.g. several inference batches) are summed.
+    """
+    totals: Dict[str, float] = {}
+    for name, duration_sec in _spans.get() or []:
+        totals[name] = totals.get(name, 0.0) + duration_sec
+    return ", ".join(
+        f"{name};dur={duration_sec * 1000:.2f}" for name, duration_sec in totals.items()
+    )
@@ -0,0 +1,114 @@
+"""Serialization benchmark: cost and size of translate payloads per encoding and compression.
+
+Builds ``/translate`` and ``/translate/batch`` responses (and batch requests) of
+``--batch-sizes`` texts from the load test sentences, then for each encoding (stdlib json,
+orjson, msgpack) and compression (none, gzip, brotli at the levels of
+``CompressionMiddleware``) reports the median encode and decode time and the payload size,
+e.g.::
+
+    python -m application.test.benchmark_encoding --batch-sizes 1,32,256 --output enc.json
+"""
+
+import argparse
+import gzip
+import json
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import brotli
+import msgpack
+import orjson
+
+from application.main.middlewares.compression import BROTLI_QUALITY, GZIP_LEVEL
+from application.test.load_test import SAMPLE_SENTENCES, git_commit
+
+ENCODINGS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "json": (lambda it: json.dumps(it, ensure_ascii=False).encode("utf-8"), json.loads),
+    "orjson": (orjson.dumps, orjson.loads),
+    "msgpack": (lambda it: msgpack.packb(it, use_bin_type=True), msgpack.unpackb),
+}
+COMPRESSIONS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "none": (lambda it: it, lambda it: it),
+    "gzip": (lambda it: gzip.compress(it, compresslevel=GZIP_LEVEL), gzip.decompress),
+    "br": (lambda it: brotli.compress(it, quality=BROTLI_QUALITY), brotli.decompress),
+}
+
+
+def make_payloads(batch_size: int, rng: random.Random) -> Dict[str, Any]:
+    sources = [rng.choice(SAMPLE_SENTENCES["en"]) for _ in range(batch_size)]
+    translations = [rng.choice(SAMPLE_SENTENCES["vi"]) for _ in range(batch_size)]
+    return {
+        "translate_response": {
+            "results": translations,
+            "time": "0.12s",
+            "src_lang": "en",
+            "tgt_lang": "vi",
+            "tier": "quality",
+        },
+        "batch_request": {
+            "items": [{"text": text, "tgt_langs": ["vi", "fr"]} for text in sources],
+        },
+        "batch_response": {
+            "results": [
+                {"src_lang": "en", "translations": {"vi": text, "fr": text}}
+                for text in translations
+            ],
+            "time": "0.12s",
+        },
+    }
+
+
+def median_sec(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def measure(payload: Any, encoding: str, compression: str, repeat: int) -> Dict:
+    encode, decode = ENCODINGS[encoding]
+    compress, decompress = COMPRESSIONS[compression]
+    raw = encode(payload)
+    wire = compress(raw)
+    return {
+        "encoding": encoding,
+        "compression": compression,
+        "size_bytes": len(wire),
+        "encode_us": round(median_sec(lambda: compress(encode(payload)), repeat) * 1e6, 1),
+        "decode_us": round(median_sec(lambda: decode(decompress(wire)), repeat) * 1e6, 1),
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--batch-sizes", default="1,32,256", help="texts per payload")
+    parser.add_argument("--repeat", type=int, default=200, help="timings per measurement")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON report path (stdout only if omitted)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    rng = random.Random(args.seed)
+    results = []
+    for batch_size in (int(it) for it in args.batch_sizes.split(",")):
+        for name, payload in make_payloads(batch_size, rng).items():
+            for encoding in ENCODINGS:
+                for compression in COMPRESSIONS:
+                    result = measure(payload, encoding, compression, args.repeat)
+                    results.append({"payload": name, "batch_size": batch_size, **result})
+    report = {"config": vars(args), "commit": git_commit(), "results": results}
+    content = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(content)
+    print(content)
+
+
+if __name__ == "__main__":
+    main()
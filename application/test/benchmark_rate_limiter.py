@@ -0,0 +1,161 @@
+"""Benchmark of the rate limiter: per-request overhead and global accuracy.
+
+``overhead`` times ``Limiter.hit`` on local buckets over a number of distinct client keys and,
+when ``--redis-url`` is given, compares it with the Redis round trip a storage-backed limiter
+pays on every request. ``accuracy`` runs ``--nodes`` limiters in one process, as stand-ins for
+service replicas sharing one limit, offers them ``--offered-rate`` requests/sec in total for
+``--duration`` seconds and compares the admitted requests with the ideal budget
+(capacity + refill over the run). Without ``--redis-url`` the nodes are not synchronised,
+which shows the local-only fallback bound (up to ``--nodes`` times the limit)::
+
+    python -m application.test.benchmark_rate_limiter accuracy --nodes 4 \\
+        --limit 100/second --offered-rate 1000 --sync-interval 0.1 \\
+        --redis-url redis://localhost:6379
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from application.main.infrastructure.rate_limiter import Limiter, RateLimitExceeded
+from application.main.infrastructure.rate_limiter.sync import RedisUsageSync
+from application.main.infrastructure.rate_limiter.token_bucket import parse_limit
+from application.test.load_test import git_commit
+
+
+def make_sync(args: argparse.Namespace, prefix: str) -> Optional[RedisUsageSync]:
+    if not args.redis_url:
+        return None
+    return RedisUsageSync(args.redis_url, prefix=prefix)
+
+
+async def benchmark_overhead(args: argparse.Namespace) -> Dict:
+    limiter = Limiter(sync=make_sync(args, f"ratelimit-bench-{uuid.uuid4().hex}:"))
+    keys = [f"client-{i}" for i in range(args.keys)]
+    # A limit that is never reached, so only the bookkeeping is measured
+    limit = "1000000000/second"
+
+    samples = []
+    for chunk in range(args.requests // 1000):
+        start = time.perf_counter()
+        for i in range(1000):
+            limiter.hit("bench", keys[(chunk * 1000 + i) % len(keys)], limit)
+        samples.append((time.perf_counter() - start) / 1000)
+
+    result = {
+        "hits": len(samples) * 1000,
+        "keys": args.keys,
+        "local_hit_us_median": round(statistics.median(samples) * 1e6, 3),
+        "local_hit_us_max_chunk": round(max(samples) * 1e6, 3),
+    }
+
+    if limiter.sync is not None:
+        start = time.perf_counter()
+        await limiter.sync_once()
+        result["sync_exchange_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+        round_trips = []
+        for _ in range(200):
+            start = time.perf_counter()
+            await limiter.sync.redis.incr(f"{limiter.sync.prefix}roundtrip")
+            round_trips.append(time.perf_counter() - start)
+        result["redis_round_trip_us_median"] = round(statistics.median(round_trips) * 1e6, 1)
+    await limiter.close()
+    return result
+
+
+async def run_node(
+    limiter: Limiter, limit: str, rate: float, duration: float, counts: Dict[str, int]
+) -> None:
+    interval = 1.0 / rate
+    start = time.perf_counter()
+    sent = 0
+    while time.perf_counter() - start < duration:
+        try:
+            limiter.hit("bench", "shared-client", limit)
+            counts["admitted"] += 1
+        except RateLimitExceeded:
+            counts["rejected"] += 1
+        sent += 1
+        # Open loop: stay on schedule regardless of how long the hit took
+        delay = start + sent * interval - time.perf_counter()
+        await asyncio.sleep(max(0.0, delay))
+
+
+async def benchmark_accuracy(args: argparse.Namespace) -> Dict:
+    prefix = f"ratelimit-bench-{uuid.uuid4().hex}:"
+    limiters = [
+        Limiter(
+            sync=make_sync(args, prefix),
+            sync_interval_sec=args.sync_interval,
+            sync_timeout_sec=args.sync_timeout,
+        )
+        for _ in range(args.nodes)
+    ]
+    counts = [{"admitted": 0, "rejected": 0} for _ in limiters]
+    await asyncio.gather(
+        *(
+            run_node(limiter, args.limit, args.offered_rate / args.nodes, args.duration, count)
+            for limiter, count in zip(limiters, counts)
+        )
+    )
+    for limiter in limiters:
+        await limiter.close()
+
+    amount, period_sec = parse_limit(args.limit)
+    ideal = amount + amount / period_sec * args.duration
+    admitted = sum(count["admitted"] for count in counts)
+    return {
+        "synchronised": bool(args.redis_url),
+        "offered": admitted + sum(count["rejected"] for count in counts),
+        "admitted": admitted,
+        "admitted_per_node": [count["admitted"] for count in counts],
+        "ideal": round(ideal, 1),
+        "overshoot_ratio": round(admitted / ideal, 3),
+        # Worst case: every other node spends a full interval of refill plus its burst unseen
+        "bound_per_interval": round(
+            (args.nodes - 1) * amount / period_sec * args.sync_interval, 1
+        ),
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scenario", choices=["overhead", "accuracy"])
+    parser.add_argument("--redis-url", help="synchronise through this Redis (local only if omitted)")
+    parser.add_argument("--requests", type=int, default=200_000, help="overhead: hits to time")
+    parser.add_argument("--keys", type=int, default=1000, help="overhead: distinct client keys")
+    parser.add_argument("--nodes", type=int, default=4, help="accuracy: limiters sharing the limit")
+    parser.add_argument("--limit", default="100/second", help="accuracy: shared limit")
+    parser.add_argument(
+        "--offered-rate", type=float, default=1000.0, help="accuracy: requests/sec over all nodes"
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="accuracy: seconds")
+    parser.add_argument("--sync-interval", type=float, default=0.5)
+    parser.add_argument("--sync-timeout", type=float, default=0.1)
+    parser.add_argument("--output", help="JSON report path (stdout if omitted)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    scenario = benchmark_overhead if args.scenario == "overhead" else benchmark_accuracy
+    report = {
+        "config": vars(args),
+        "commit": git_commit(),
+        "result": asyncio.run(scenario(args)),
+    }
+    content = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(content)
+    print(content, file=sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Startup benchmark: cost of importing the application and of its lifespan startup.
+
+Each run starts a fresh interpreter, so nothing is shared between runs, and measures:
+
+* ``import_sec``: ``import manage``, i.e. what any script or test touching the package pays.
+  It should stay free of connections and model loading.
+* ``startup_sec``: the lifespan startup, where clients and models are actually built.
+* ``first_request_sec``: one ``/translate`` call right after startup.
+
+The median of ``--runs`` runs is reported, plus the heaviest imports of the last run from
+``python -X importtime``. Use ``STUB_MODE=True CACHE=memory DB=memory`` to leave model
+downloads and servers out of it, e.g.::
+
+    STUB_MODE=True CACHE=memory DB=memory \\
+        python -m application.test.benchmark_startup --runs 5 --output bench/startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+from application.test.load_test import git_commit
+
+# Runs in the child interpreter (argv[1] is "1" to also start the app); prints one JSON
+# line with the timings
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import manage
+import_sec = time.perf_counter() - start
+result = {"import_sec": import_sec}
+if sys.argv[1] == "1":
+    from fastapi.testclient import TestClient
+    start = time.perf_counter()
+    with TestClient(manage.app) as client:
+        result["startup_sec"] = time.perf_counter() - start
+        start = time.perf_counter()
+        response = client.post(
+            "/api/v0/translate/",
+            json={"texts": ["Hello, how are you?"], "src_lang": "en", "tgt_lang": "vi"},
+        )
+        result["first_request_sec"] = time.perf_counter() - start
+        result["first_request_status"] = response.status_code
+print("STARTUP_BENCHMARK " + json.dumps(result))
+"""
+
+
+def run_probe(startup: bool, importtime: bool = False) -> Dict:
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", _PROBE, "1" if startup else "0"]
+    completed = subprocess.run(
+        command, capture_output=True, text=True, env=os.environ.copy(), check=False
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith("STARTUP_BENCHMARK "):
+            result = json.loads(line.split(" ", 1)[1])
+            if importtime:
+                result["heaviest_imports"] = heaviest_imports(completed.stderr)
+            return result
+    raise RuntimeError(f"Startup probe failed:\n{completed.stderr[-2000:]}")
+
+
+def heaviest_imports(importtime_log: str, top: int = 15) -> List[Dict]:
+    """Modules with the largest cumulative import time from ``-X importtime`` output."""
+    imports = []
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = (part.strip() for part in line[len("import time:"):].split("|"))
+        imports.append({"module": module.strip(), "cumulative_ms": int(cumulative) / 1000})
+    return sorted(imports, key=lambda it: it["cumulative_ms"], reverse=True)[:top]
+
+
+def summarize(runs: List[Dict]) -> Dict:
+    summary = {}
+    for key in ("import_sec", "startup_sec", "first_request_sec"):
+        values = [run[key] for run in runs if key in run]
+        if values:
+            summary[key] = {
+                "median": round(statistics.median(values), 3),
+                "min": round(min(values), 3),
+                "max": round(max(values), 3),
+            }
+    return summary
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--import-only", action="store_true", help="skip the lifespan startup and request"
+    )
+    parser.add_argument("--output", help="JSON report path (stdout only if omitted)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    runs = [run_probe(not args.import_only) for _ in range(args.runs)]
+    report = {
+        "config": vars(args),
+        "commit": git_commit(),
+        "stub_mode": os.environ.get("STUB_MODE"),
+        "summary": summarize(runs),
+        "runs": runs,
+        "heaviest_imports": run_probe(False, importtime=True)["heaviest_imports"],
+    }
+    content = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(content)
+    print(content)
+
+
+if __name__ == "__main__":
+    main()
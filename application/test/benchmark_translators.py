@@ -0,0 +1,223 @@
+"""Micro-benchmark of the translators, outside of the HTTP stack.
+
+Every selected ``TRANSLATOR_FACTORY`` entry is loaded and driven directly with synthetic inputs
+over a grid of batch sizes, input lengths and beam sizes. For each cell the median tokenize,
+generate and decode times, generated tokens/sec and peak RSS are recorded; each pair runs in a
+fresh process, since peak RSS only ever grows within one. Each decoding setting
+is also scored with chrF against ``resources/benchmark_references.csv`` so that backends
+(``--backend fp32|fp16|bf16|int8``) can be compared on speed and accuracy together, e.g.::
+
+    python -m application.test.benchmark_translators --pairs en2vi:fast,en2vi:quality \\
+        --batch-sizes 1,8,32 --lengths short,long --num-beams 1,4 --backend int8 \\
+        --output bench/translators-int8.json
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import resource
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import torch
+
+from application.main.config import settings
+from application.main.infrastructure.translator.translators import (
+    TRANSLATOR_FACTORY,
+    BaseTranslator,
+)
+from application.test.load_test import LENGTH_CLASSES, SAMPLE_SENTENCES, git_commit
+
+REFERENCES_FILE = settings.APP_CONFIG.RESOURCES_DIR / "benchmark_references.csv"
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def chrf(hypotheses: List[str], references: List[str], max_n: int = 6, beta: float = 2.0) -> float:
+    """Corpus-level chrF: character n-gram F-score (n <= max_n, whitespace ignored), 0-100."""
+    matches, hyp_total, ref_total = [0] * max_n, [0] * max_n, [0] * max_n
+    for hypothesis, reference in zip(hypotheses, references):
+        hyp_chars = hypothesis.replace(" ", "")
+        ref_chars = reference.replace(" ", "")
+        for n in range(1, max_n + 1):
+            hyp_ngrams = Counter(hyp_chars[i : i + n] for i in range(len(hyp_chars) - n + 1))
+            ref_ngrams = Counter(ref_chars[i : i + n] for i in range(len(ref_chars) - n + 1))
+            matches[n - 1] += sum((hyp_ngrams & ref_ngrams).values())
+            hyp_total[n - 1] += sum(hyp_ngrams.values())
+            ref_total[n - 1] += sum(ref_ngrams.values())
+
+    precision = statistics.mean(m / h if h else 0.0 for m, h in zip(matches, hyp_total))
+    recall = statistics.mean(m / r if r else 0.0 for m, r in zip(matches, ref_total))
+    if precision + recall == 0:
+        return 0.0
+    beta2 = beta**2
+    return round(100 * (1 + beta2) * precision * recall / (beta2 * precision + recall), 2)
+
+
+def load_references() -> Dict[str, List[str]]:
+    with open(REFERENCES_FILE, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    return {lang: [row[lang] for row in rows] for lang in rows[0]}
+
+
+def apply_backend(translator: BaseTranslator, backend: str) -> None:
+    """Converts a loaded translator in place to the requested numeric backend."""
+    if backend == "fp16":
+        translator.model.half()
+    elif backend == "bf16":
+        translator.model.to(torch.bfloat16)
+    elif backend == "int8":
+        # Dynamic quantization only runs on CPU
+        translator._device = torch.device("cpu")
+        translator.model = torch.ao.quantization.quantize_dynamic(
+            translator.model.to("cpu"), {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+
+def make_texts(src_lang: str, length: str, batch_size: int) -> List[str]:
+    sentences = SAMPLE_SENTENCES[src_lang]
+    num_sentences = LENGTH_CLASSES[length]
+    return [
+        " ".join(sentences[(i + j) % len(sentences)] for j in range(num_sentences))
+        for i in range(batch_size)
+    ]
+
+
+def count_tokens(translator: BaseTranslator, ids: torch.Tensor) -> int:
+    return int((ids != translator.tokenizer.pad_token_id).sum().item())
+
+
+def benchmark_cell(
+    translator: BaseTranslator, texts: List[str], repeats: int
+) -> Dict:
+    tokenize_sec, generate_sec, decode_sec = [], [], []
+    input_tokens = output_tokens = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        batch = translator.tokenize(texts)
+        tokenize_sec.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        generated_ids = translator.generate(batch)
+        generate_sec.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        translator.decode(generated_ids)
+        decode_sec.append(time.perf_counter() - start)
+
+        input_tokens = int(batch["attention_mask"].sum().item())
+        output_tokens = count_tokens(translator, generated_ids)
+
+    generate_median = statistics.median(generate_sec)
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "tokenize_ms": round(statistics.median(tokenize_sec) * 1000, 2),
+        "generate_ms": round(generate_median * 1000, 2),
+        "decode_ms": round(statistics.median(decode_sec) * 1000, 2),
+        "tokens_per_sec": round(output_tokens / generate_median, 1) if generate_median else None,
+        "texts_per_sec": round(len(texts) / generate_median, 2) if generate_median else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def benchmark_pair(pair: str, args: argparse.Namespace, references: Dict[str, List[str]]) -> Dict:
+    src_lang, tgt_lang = pair.split(":")[0].split("2")
+
+    rss_before_load_mb = peak_rss_mb()
+    start = time.perf_counter()
+    translator = TRANSLATOR_FACTORY[pair]()
+    load_sec = time.perf_counter() - start
+    apply_backend(translator, args.backend)
+
+    # One untimed batch to trigger lazy initialisation (kernels, allocator, caches)
+    translator.translate(make_texts(src_lang, "short", 1))
+
+    result = {
+        "model_name": translator.model_name,
+        "device": str(translator._device),
+        "load_sec": round(load_sec, 2),
+        "rss_before_load_mb": rss_before_load_mb,
+        "rss_after_load_mb": peak_rss_mb(),
+        "cells": [],
+        "quality": [],
+    }
+    for num_beams in args.num_beams:
+        translator._num_beams = num_beams
+        for length in args.lengths:
+            for batch_size in args.batch_sizes:
+                cell = benchmark_cell(
+                    translator, make_texts(src_lang, length, batch_size), args.repeats
+                )
+                cell.update(num_beams=num_beams, length=length, batch_size=batch_size)
+                result["cells"].append(cell)
+                print(f"{pair} {cell}", file=sys.stderr)
+
+        hypotheses = translator.translate(references[src_lang])
+        result["quality"].append(
+            {"num_beams": num_beams, "chrf": chrf(hypotheses, references[tgt_lang])}
+        )
+
+    del translator
+    return result
+
+
+def benchmark_pair_in_subprocess(
+    pair: str, args: argparse.Namespace, references: Dict[str, List[str]]
+) -> Dict:
+    """Runs benchmark_pair in a fresh interpreter, so that peak RSS is that of the pair only."""
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(benchmark_pair, (pair, args, references))
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    def int_list(value: str) -> List[int]:
+        return [int(it) for it in value.split(",")]
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pairs", default=",".join(TRANSLATOR_FACTORY))
+    parser.add_argument("--batch-sizes", type=int_list, default=[1, 8, 32])
+    parser.add_argument(
+        "--lengths", type=lambda v: v.split(","), default=["short", "medium", "long"],
+        help=f"input length classes among {sorted(LENGTH_CLASSES)}",
+    )
+    parser.add_argument("--num-beams", type=int_list, default=[BaseTranslator._num_beams])
+    parser.add_argument(
+        "--backend", choices=["fp32", "fp16", "bf16", "int8"], default="fp32",
+        help="numeric backend applied after loading (int8 = dynamic quantization, CPU only)",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", help="JSON report path (stdout if omitted)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    references = load_references()
+    report = {
+        "config": vars(args),
+        "commit": git_commit(),
+        "torch": torch.__version__,
+        "threads": torch.get_num_threads(),
+        "pairs": {
+            pair: benchmark_pair_in_subprocess(pair, args, references)
+            for pair in args.pairs.split(",")
+        },
+    }
+    content = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(content)
+    print(content)
+
+
+if __name__ == "__main__":
+    main()
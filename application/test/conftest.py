@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+# Tests run without models or servers: stub translators, in-process cache and database
+os.environ["STUB_MODE"] = "True"
+os.environ["CACHE"] = "memory"
+os.environ["DB"] = "memory"
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+
+    import manage
+
+    with TestClient(manage.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def client_from(client):
+    """Makes clients of the running app from their own address, with full token budgets."""
+    from fastapi.testclient import TestClient
+
+    def make(host: str) -> TestClient:
+        return TestClient(client.app, client=(host, 50000))
+
+    return make
@@ -0,0 +1,368 @@
+"""Load-testing and latency benchmark for the translation API.
+
+Two load models are supported:
+
+* ``open``: requests are issued at a fixed arrival rate whatever the server does, and latency
+  is measured from the *scheduled* send time so queueing is not hidden (no coordinated omission).
+* ``closed``: a fixed number of clients each send their next request as soon as the previous
+  one completes.
+
+Requests issued during the warm-up period are excluded from the report. The report is JSON so
+runs can be diffed across commits, e.g.::
+
+    python -m application.test.load_test --mode open --rate 20 --duration 60 \\
+        --pairs en2vi:0.6,vi2en:0.4 --cache-hit-ratio 0.3 --output bench/en2vi.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+SAMPLE_SENTENCES: Dict[str, List[str]] = {
+    "en": [
+        "Hello, how are you?",
+        "What time is it?",
+        "Can you help me with this task?",
+        "Where is the nearest restaurant?",
+        "I love learning new languages.",
+        "This translation service is very fast.",
+        "Artificial intelligence is evolving rapidly.",
+        "The weather is nice today.",
+        "Do you speak French or Vietnamese?",
+        "Let’s go to the beach this weekend.",
+        "She is preparing dinner now.",
+        "Please take a seat and wait.",
+        "I’m reading a great book about history.",
+        "My dog loves to play fetch.",
+        "He works as a software engineer.",
+        "We need to buy some groceries.",
+        "They are traveling to Japan next month.",
+        "This is a challenging problem to solve.",
+        "Can you translate this sentence?",
+        "Good morning! Have a nice day.",
+    ],
+    "fr": [
+        "Bonjour, comment allez-vous ?",
+        "Quelle heure est-il ?",
+        "Pouvez-vous m'aider avec cette tâche ?",
+        "Où se trouve le restaurant le plus proche ?",
+        "J'adore apprendre de nouvelles langues.",
+        "Ce service de traduction est très rapide.",
+        "Il fait beau aujourd'hui.",
+        "Elle prépare le dîner maintenant.",
+        "Veuillez vous asseoir et attendre.",
+        "Nous devons acheter des provisions.",
+        "Ils voyagent au Japon le mois prochain.",
+        "C'est un problème difficile à résoudre.",
+    ],
+    "vi": [
+        "Xin chào, bạn khỏe không?",
+        "Bây giờ là mấy giờ?",
+        "Bạn có thể giúp tôi việc này không?",
+        "Nhà hàng gần nhất ở đâu?",
+        "Tôi thích học ngôn ngữ mới.",
+        "Dịch vụ dịch thuật này rất nhanh.",
+        "Hôm nay thời tiết đẹp.",
+        "Cô ấy đang nấu bữa tối.",
+        "Vui lòng ngồi xuống và chờ.",
+        "Chúng ta cần mua một ít thực phẩm.",
+        "Họ sẽ đi du lịch Nhật Bản vào tháng tới.",
+        "Đây là một vấn đề khó giải quyết.",
+    ],
+}
+
+# Number of sentences joined into one text for each length class
+LENGTH_CLASSES: Dict[str, int] = {"short": 1, "medium": 3, "long": 10}
+
+
+@dataclass
+class RequestResult:
+    scheduled_at: float
+    latency_sec: float
+    status: int
+    num_texts: int
+    pair: str
+    warmup: bool
+    error: Optional[str] = None
+
+
+@dataclass
+class Report:
+    config: Dict
+    commit: Optional[str]
+    measured_requests: int = 0
+    warmup_requests: int = 0
+    duration_sec: float = 0.0
+    throughput_rps: float = 0.0
+    throughput_texts_per_sec: float = 0.0
+    status_codes: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    latency_ms_by_pair: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+
+def parse_distribution(spec: str) -> List[Tuple[str, float]]:
+    """Parses ``"a:0.6,b:0.4"`` into weighted choices; a missing weight means 1."""
+    choices = []
+    for item in spec.split(","):
+        name, _, weight = item.strip().partition(":")
+        choices.append((name, float(weight) if weight else 1.0))
+    return choices
+
+
+def weighted_choice(rng: random.Random, choices: List[Tuple[str, float]]) -> str:
+    names, weights = zip(*choices)
+    return rng.choices(names, weights=weights, k=1)[0]
+
+
+def percentiles(latencies: List[float]) -> Dict[str, float]:
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+
+    def rank(q: float) -> float:
+        return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+    return {
+        "p50": round(rank(0.50) * 1000, 2),
+        "p90": round(rank(0.90) * 1000, 2),
+        "p99": round(rank(0.99) * 1000, 2),
+        "max": round(ordered[-1] * 1000, 2),
+        "mean": round(sum(ordered) / len(ordered) * 1000, 2),
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class WorkloadGenerator:
+    """Builds reproducible request payloads from the configured distributions.
+
+    A pool of "hot" texts per source language is sent once before the run so that picking
+    from it produces cache hits; every other text is made unique to force a cache miss.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        self.rng = random.Random(args.seed)
+        self.pairs = parse_distribution(args.pairs)
+        self.lengths = parse_distribution(args.lengths)
+        self.batch_sizes = parse_distribution(args.texts_per_request)
+        self.cache_hit_ratio = args.cache_hit_ratio
+        self.detect_ratio = args.detect_ratio
+        self.tier = args.tier
+        self._unique = 0
+        self.hot_texts: Dict[str, List[str]] = {
+            lang: [self._make_text(lang) for _ in range(args.hot_pool_size)]
+            for lang in {pair.split("2")[0] for pair, _ in self.pairs}
+        }
+
+    def _make_text(self, lang: str) -> str:
+        num_sentences = LENGTH_CLASSES[weighted_choice(self.rng, self.lengths)]
+        return " ".join(self.rng.choices(SAMPLE_SENTENCES[lang], k=num_sentences))
+
+    def _make_unique_text(self, lang: str) -> str:
+        # A pseudo-word spelled from a counter makes each text (and its cache key) unique
+        self._unique += 1
+        n, word = self._unique, ""
+        while n:
+            n, r = divmod(n, 26)
+            word += chr(ord("a") + r)
+        return f"{self._make_text(lang)} {word}"
+
+    def next_payload(self) -> Tuple[str, Dict]:
+        pair = weighted_choice(self.rng, self.pairs)
+        src_lang, tgt_lang = pair.split("2")
+        num_texts = int(weighted_choice(self.rng, self.batch_sizes))
+        texts = [
+            self.rng.choice(self.hot_texts[src_lang])
+            if self.rng.random() < self.cache_hit_ratio
+            else self._make_unique_text(src_lang)
+            for _ in range(num_texts)
+        ]
+        payload = {"texts": texts, "tgt_lang": tgt_lang}
+        if self.tier:
+            payload["tier"] = self.tier
+        if self.rng.random() >= self.detect_ratio:
+            payload["src_lang"] = src_lang
+        return pair, payload
+
+    def priming_payloads(self) -> List[Dict]:
+        payloads = []
+        for pair, _ in self.pairs:
+            src_lang, tgt_lang = pair.split("2")
+            payload = {
+                "texts": self.hot_texts[src_lang],
+                "src_lang": src_lang,
+                "tgt_lang": tgt_lang,
+            }
+            if self.tier:
+                payload["tier"] = self.tier
+            payloads.append(payload)
+        return payloads
+
+
+class LoadTest:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.workload = WorkloadGenerator(args)
+        self.results: List[RequestResult] = []
+        self.headers = {"X-Request-Timeout": str(args.timeout)}
+
+    async def _send(
+        self, client: httpx.AsyncClient, scheduled_at: float, warmup: bool
+    ) -> None:
+        pair, payload = self.workload.next_payload()
+        status, error = 0, None
+        try:
+            response = await client.post(
+                self.args.url, json=payload, headers=self.headers
+            )
+            status = response.status_code
+        except httpx.HTTPError as e:
+            error = type(e).__name__
+        self.results.append(
+            RequestResult(
+                scheduled_at=scheduled_at,
+                latency_sec=time.perf_counter() - scheduled_at,
+                status=status,
+                num_texts=len(payload["texts"]),
+                pair=pair,
+                warmup=warmup,
+                error=error,
+            )
+        )
+
+    async def _prime(self, client: httpx.AsyncClient) -> None:
+        if self.args.cache_hit_ratio <= 0:
+            return
+        for payload in self.workload.priming_payloads():
+            await client.post(self.args.url, json=payload, headers=self.headers)
+
+    async def _run_open_loop(self, client: httpx.AsyncClient, start: float) -> None:
+        interval = 1.0 / self.args.rate
+        end = start + self.args.warmup + self.args.duration
+        tasks = []
+        scheduled_at = start
+        while scheduled_at < end:
+            delay = scheduled_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            warmup = scheduled_at < start + self.args.warmup
+            tasks.append(asyncio.create_task(self._send(client, scheduled_at, warmup)))
+            if self.args.arrival == "poisson":
+                scheduled_at += self.workload.rng.expovariate(self.args.rate)
+            else:
+                scheduled_at += interval
+        await asyncio.gather(*tasks)
+
+    async def _run_closed_loop(self, client: httpx.AsyncClient, start: float) -> None:
+        end = start + self.args.warmup + self.args.duration
+
+        async def worker():
+            while (now := time.perf_counter()) < end:
+                await self._send(client, now, now < start + self.args.warmup)
+
+        await asyncio.gather(*(worker() for _ in range(self.args.concurrency)))
+
+    async def run(self) -> Report:
+        limits = httpx.Limits(max_connections=self.args.max_connections)
+        async with httpx.AsyncClient(timeout=self.args.timeout, limits=limits) as client:
+            await self._prime(client)
+            start = time.perf_counter()
+            if self.args.mode == "open":
+                await self._run_open_loop(client, start)
+            else:
+                await self._run_closed_loop(client, start)
+        return self.report(start)
+
+    def report(self, start: float) -> Report:
+        measured = [r for r in self.results if not r.warmup]
+        report = Report(config=vars(self.args), commit=git_commit())
+        report.measured_requests = len(measured)
+        report.warmup_requests = len(self.results) - len(measured)
+        if not measured:
+            return report
+
+        measure_start = start + self.args.warmup
+        measure_end = max(r.scheduled_at + r.latency_sec for r in measured)
+        report.duration_sec = round(measure_end - measure_start, 3)
+        ok = [r for r in measured if r.status == 200]
+        if report.duration_sec > 0:
+            report.throughput_rps = round(len(ok) / report.duration_sec, 2)
+            report.throughput_texts_per_sec = round(
+                sum(r.num_texts for r in ok) / report.duration_sec, 2
+            )
+        for r in measured:
+            key = str(r.status) if r.error is None else "error"
+            report.status_codes[key] = report.status_codes.get(key, 0) + 1
+            if r.error is not None:
+                report.errors[r.error] = report.errors.get(r.error, 0) + 1
+        report.latency_ms = percentiles([r.latency_sec for r in ok])
+        for pair in sorted({r.pair for r in ok}):
+            report.latency_ms_by_pair[pair] = percentiles(
+                [r.latency_sec for r in ok if r.pair == pair]
+            )
+        return report
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://localhost:8080/api/v0/translate/")
+    parser.add_argument("--mode", choices=["open", "closed"], default="open")
+    parser.add_argument("--rate", type=float, default=10.0, help="open loop: requests/sec")
+    parser.add_argument(
+        "--arrival", choices=["constant", "poisson"], default="constant",
+        help="open loop: inter-arrival distribution",
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="closed loop: clients")
+    parser.add_argument("--duration", type=float, default=30.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="excluded seconds")
+    parser.add_argument("--pairs", default="en2vi", help='e.g. "en2vi:0.6,vi2en:0.4"')
+    parser.add_argument(
+        "--lengths", default="short:0.7,medium:0.25,long:0.05",
+        help=f"text length classes {sorted(LENGTH_CLASSES)} with weights",
+    )
+    parser.add_argument(
+        "--texts-per-request", default="1", help='e.g. "1:0.8,16:0.2"'
+    )
+    parser.add_argument(
+        "--tier", choices=["fast", "quality"], help="model tier (server default if omitted)"
+    )
+    parser.add_argument("--cache-hit-ratio", type=float, default=0.0)
+    parser.add_argument("--hot-pool-size", type=int, default=20)
+    parser.add_argument(
+        "--detect-ratio", type=float, default=0.0,
+        help="share of requests omitting src_lang",
+    )
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--max-connections", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON report path (stdout if omitted)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    report = asyncio.run(LoadTest(args).run())
+    content = json.dumps(asdict(report), indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(content)
+    print(content)
+
+
+if __name__ == "__main__":
+    main()
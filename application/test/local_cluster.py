@@ -0,0 +1,76 @@
+"""Local sharded cluster: one node process per ``--shard`` plus the routing gateway.
+
+Each shard is a comma-separated list of pairs served by one node (SERVED_PAIRS); nodes
+listen on ``--base-port + 1``, ``+ 2``... and the gateway on ``--base-port``, e.g.::
+
+    STUB_MODE=True CACHE=memory DB=memory python -m application.test.local_cluster \\
+        --shard en2vi,vi2en --shard en2fr,fr2en --shard en2vi,en2fr
+
+Pairs listed by several shards fail over between their nodes: kill one node process and
+its pairs are served by the next node of the ring. Ctrl+C stops everything.
+"""
+
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--shard",
+        action="append",
+        required=True,
+        help="Pairs served by one node, e.g. en2vi,vi2en (repeat for each node)",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--base-port", type=int, default=8080)
+    return parser.parse_args(argv)
+
+
+def spawn(app: str, host: str, port: int, **env: str) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--host", host, "--port", str(port)],
+        env={**os.environ, **env},
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    # Stopped like Ctrl+C, so the nodes and gateway are stopped too
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    processes: List[subprocess.Popen] = []
+    urls = []
+    try:
+        for i, shard in enumerate(args.shard, start=1):
+            port = args.base_port + i
+            processes.append(spawn("manage:app", args.host, port, SERVED_PAIRS=shard))
+            urls.append(f"http://{args.host}:{port}")
+            print(f"node {urls[-1]} serving {shard}")
+        processes.append(
+            spawn(
+                "application.gateway.app:app",
+                args.host,
+                args.base_port,
+                GATEWAY_NODES=",".join(urls),
+            )
+        )
+        print(f"gateway http://{args.host}:{args.base_port}")
+        # Nodes may be killed to try failover; the cluster runs as long as the gateway
+        while processes[-1].poll() is None:
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
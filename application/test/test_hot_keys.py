@@ -0,0 +1,63 @@
+import time
+
+from application.initializer import get_cache
+from application.main.config import settings
+from application.main.infrastructure.cache.keys import translation_cache_key
+from application.main.infrastructure.cache.memory import operations as memory_operations
+from application.main.infrastructure.translator.translators import StubTranslator
+
+
+def test_admin_hot_keys_lists_keys_without_texts(client, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    client.post(
+        "/api/v0/translate/", json={"texts": ["Private note"], "src_lang": "en", "tgt_lang": "vi"}
+    )
+
+    response = client.get("/api/v0/admin/hot-keys", headers={"X-Admin-Token": "secret"})
+
+    assert response.status_code == 200
+    keys = response.json()["keys"]
+    assert keys
+    assert all("text" not in entry for entry in keys)
+    assert "Private note" not in response.text
+
+
+class _Clock:
+    """Stands in for the time module of the in-process tier, ``offset`` seconds ahead."""
+
+    def __init__(self, offset: float):
+        self.offset = offset
+
+    def monotonic(self) -> float:
+        return time.monotonic() + self.offset
+
+
+def _cache_key(text: str) -> str:
+    return translation_cache_key("en2vi:quality", StubTranslator.checkpoint_version(), text)
+
+
+def test_cold_entries_keep_the_tier_ttl(client, monkeypatch):
+    client.post(
+        "/api/v0/translate/", json={"texts": ["Cold entry"], "src_lang": "en", "tgt_lang": "vi"}
+    )
+
+    # Past the 6h COLD_KEY_TTL that used to override it, within the tier's 1d ttl
+    monkeypatch.setattr(memory_operations, "time", _Clock(7 * 3600))
+    assert get_cache().get(_cache_key("Cold entry")) == b"Cold entry"
+
+    monkeypatch.setattr(memory_operations, "time", _Clock(25 * 3600))
+    assert get_cache().get(_cache_key("Cold entry")) is None
+
+
+def test_hot_entries_are_pinned_past_the_tier_ttl(client, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    payload = {"texts": ["Hot entry"], "src_lang": "en", "tgt_lang": "vi"}
+    for _ in range(settings.HOT_KEYS_MIN_COUNT + 1):
+        client.post("/api/v0/translate/", json=payload)
+
+    response = client.get("/api/v0/admin/hot-keys", headers={"X-Admin-Token": "secret"})
+    entry = next(it for it in response.json()["keys"] if it["key"] == _cache_key("Hot entry"))
+    assert entry["hot"]
+
+    monkeypatch.setattr(memory_operations, "time", _Clock(25 * 3600))
+    assert get_cache().get(_cache_key("Hot entry")) == b"Hot entry"
@@ -0,0 +1,100 @@
+from application.main.infrastructure.rate_limiter.quota import CACHED_TEXT_COST, estimate_cost
+
+
+def test_translate_unknown_language_is_a_bad_request(client):
+    response = client.post(
+        "/api/v0/translate/", json={"texts": ["Hello"], "src_lang": "xx", "tgt_lang": "vi"}
+    )
+
+    assert response.status_code == 400
+    assert "(xx)" in response.json()["detail"]
+
+
+def test_batch_reports_unsupported_pair_in_item_errors(client):
+    response = client.post(
+        "/api/v0/translate/batch",
+        json={
+            "items": [
+                {"text": "Hello", "src_lang": "en", "tgt_lang": "vi"},
+                {"text": "Hello", "src_lang": "xx", "tgt_langs": ["vi", "xx"]},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    first, second = response.json()["results"]
+    assert first["translations"] == {"vi": "Hello"}
+    assert "errors" not in first
+    assert second["translations"] == {"xx": "Hello"}
+    assert "not supported" in second["errors"]["vi"]
+
+
+def test_translate_reports_the_token_budget_left(client_from):
+    client = client_from("10.0.0.35")
+    text = "Budget " * 300
+
+    first = client.post(
+        "/api/v0/translate/", json={"texts": [text], "src_lang": "en", "tgt_lang": "vi"}
+    )
+
+    limit = int(first.headers["X-Token-Budget-Limit"])
+    remaining = int(first.headers["X-Token-Budget-Remaining"])
+    assert first.status_code == 200
+    assert remaining == limit - estimate_cost([text])
+
+    # Served from the cache: costs 1 instead of its estimated tokens
+    second = client.post(
+        "/api/v0/translate/", json={"texts": [text], "src_lang": "en", "tgt_lang": "vi"}
+    )
+
+    assert second.status_code == 200
+    assert int(second.headers["X-Token-Budget-Remaining"]) >= remaining - CACHED_TEXT_COST
+
+
+def test_spent_budget_rejects_requests_upfront(client_from):
+    client = client_from("10.0.0.36")
+    hello = {"texts": ["Hello"], "src_lang": "en", "tgt_lang": "vi"}
+    assert client.post("/api/v0/translate/", json=hello).status_code == 200
+    client.post(
+        "/api/v0/translate/",
+        json={"texts": ["debt " * 25000], "src_lang": "en", "tgt_lang": "vi"},
+    )
+
+    # Even a request that would only be served from the cache
+    response = client.post("/api/v0/translate/", json=hello)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+    assert response.headers["X-Token-Budget-Remaining"] == "0"
+
+
+def test_batch_shares_the_token_budget_of_translate(client_from):
+    client = client_from("10.0.0.39")
+    # One oversized text is admitted on a full budget and leaves it in debt
+    spent = client.post(
+        "/api/v0/translate/",
+        json={"texts": ["word " * 25000], "src_lang": "en", "tgt_lang": "vi"},
+    )
+    assert spent.status_code == 200
+
+    response = client.post(
+        "/api/v0/translate/batch",
+        json={"items": [{"text": "Hello", "src_lang": "en", "tgt_lang": "vi"}]},
+    )
+
+    assert response.status_code == 429
+    assert response.headers["X-Token-Budget-Remaining"] == "0"
+
+
+def test_detect_is_charged_to_the_translate_budget(client_from):
+    client = client_from("10.0.0.50")
+    detected = client.post("/api/v0/translate/detect", json={"texts": ["Hello", "Bonjour"]})
+    limit = int(detected.headers["X-Token-Budget-Limit"])
+    assert detected.status_code == 200
+    assert detected.headers["X-Token-Budget-Remaining"] == str(limit - 2)
+
+    client.post(
+        "/api/v0/translate/",
+        json={"texts": ["term " * 25000], "src_lang": "en", "tgt_lang": "vi"},
+    )
+    assert client.post("/api/v0/translate/detect", json={"texts": ["Hello"]}).status_code == 429
@@ -0,0 +1,31 @@
+def test_stream_reports_unsupported_pair_as_bad_request(client):
+    with client.websocket_connect("/api/v0/translate/stream") as websocket:
+        websocket.send_json({"id": 1, "texts": ["Hello"], "src_lang": "xx", "tgt_lang": "vi"})
+        reply = websocket.receive_json()
+
+        assert reply["id"] == 1
+        assert reply["status"] == 400
+        assert "(xx)" in reply["detail"]
+
+        # The connection keeps serving requests after a failed one
+        websocket.send_json({"id": 2, "texts": ["Hello"], "src_lang": "en", "tgt_lang": "vi"})
+        reply = websocket.receive_json()
+
+        assert reply["id"] == 2
+        assert reply["status"] == 200
+        assert reply["result"]["results"] == ["Hello"]
+
+
+def test_stream_shares_the_token_budget_of_translate(client_from):
+    client = client_from("10.0.0.48")
+    client.post(
+        "/api/v0/translate/",
+        json={"texts": ["page " * 25000], "src_lang": "en", "tgt_lang": "vi"},
+    )
+
+    with client.websocket_connect("/api/v0/translate/stream") as websocket:
+        websocket.send_json({"id": 1, "texts": ["Hello"], "src_lang": "en", "tgt_lang": "vi"})
+        reply = websocket.receive_json()
+
+    assert reply["id"] == 1
+    assert reply["status"] == 429
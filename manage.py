@@ -1,18 +1,34 @@
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from application.initializer import IncludeAPIRouter
+from application.initializer import IncludeAPIRouter, limiter_instance, logger_instance
 from application.main.config import settings
+from application.main.infrastructure.audit import get_audit_sink
 from application.main.infrastructure.rate_limiter.limiter import setup_rate_limit
-from application.main.middlewares import LoggingMiddleware
+from application.main.middlewares import (
+    CompressionMiddleware,
+    LoggingMiddleware,
+    ServerTimingMiddleware,
+)
+from application.main.services import get_detector_service, get_translation_service
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Models and clients are built here rather than at import, so that importing the
+    # application (scripts, tests, tooling) stays cheap
+    get_detector_service()
+    get_translation_service()
     yield
     # Shutdown code ...
+    audit_sink = get_audit_sink()
+    if audit_sink is not None:
+        await audit_sink.close()
+    await limiter_instance.close()
+    logger_instance.stop()
 
 
 def get_application():
@@ -21,6 +37,7 @@ def get_application():
         description=settings.API_DESCRIPTION,
         version=settings.API_VERSION,
         lifespan=lifespan,
+        dependencies=[Depends(limiter_instance.default_limits_dependency)],
     )
     _app.include_router(IncludeAPIRouter())
 
@@ -30,7 +47,9 @@ def get_application():
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    _app.add_middleware(CompressionMiddleware)
     _app.add_middleware(LoggingMiddleware)
+    _app.add_middleware(ServerTimingMiddleware)
 
     setup_rate_limit(_app)
     return _app